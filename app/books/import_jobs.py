@@ -0,0 +1,106 @@
+# app/books/import_jobs.py
+# Checkpoint journal for resumable book CSV imports, stored in Redis.
+
+# Standard library imports
+import hashlib
+import time
+from typing import Dict, Optional
+
+# App imports
+from app.utils.redis_manager import redis_client
+from app.utils.logger import get_logger
+
+# Logger setup
+logger = get_logger(__name__)
+
+# ----------------------------- CONSTANTS ----------------------------- #
+JOB_KEY_PREFIX = "book_import:"
+JOB_TTL_SECONDS = 7 * 24 * 60 * 60  # keep journals for a week
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+COUNTER_FIELDS = ("total", "processed", "failed", "duplicates")
+
+
+def file_job_id(path: str) -> str:
+    """
+    Job id derived from the CSV content, so re-uploading the same file resumes the same job.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()[:16]
+
+
+class ImportJob:
+    """
+    Journal of one book import: last committed row offset, counters and per-row outcomes.
+    The journal lives in two Redis hashes: `book_import:<id>` and `book_import:<id>:rows`.
+    """
+    def __init__(self, job_id: str, state: Optional[Dict[str, str]] = None):
+        self.job_id = job_id
+        self.key = f"{JOB_KEY_PREFIX}{job_id}"
+        self.rows_key = f"{self.key}:rows"
+        self.state = state or {}
+
+    @classmethod
+    def for_file(cls, path: str) -> "ImportJob":
+        """
+        Load the unfinished job for this file, or start a new one.
+        A finished job for the same content is reset so the file is imported again.
+        """
+        job = cls(file_job_id(path))
+        try:
+            state = redis_client.hgetall(job.key)
+        except Exception as e:
+            logger.error(f"Could not read import journal {job.key}: {e}")
+            state = {}
+        if state and state.get("status") == STATUS_RUNNING:
+            job.state = state
+            logger.info(f"Resuming book import {job.job_id} after row {job.committed_rows}")
+            return job
+        job.state = {"status": STATUS_RUNNING, "file": path, "committed_rows": "0", "started_at": str(int(time.time()))}
+        try:
+            pipe = redis_client.pipeline(transaction=True)
+            pipe.delete(job.key, job.rows_key)
+            pipe.hset(job.key, mapping=job.state)
+            pipe.expire(job.key, JOB_TTL_SECONDS)
+            pipe.execute()
+        except Exception as e:
+            logger.error(f"Could not create import journal {job.key}: {e}")
+        return job
+
+    @property
+    def committed_rows(self) -> int:
+        return int(self.state.get("committed_rows", 0))
+
+    @property
+    def counters(self) -> Dict[str, int]:
+        return {name: int(self.state.get(name, 0)) for name in COUNTER_FIELDS}
+
+    def commit(self, committed_rows: int, counters: Dict[str, int], outcomes: Dict[int, str], **extra: str) -> None:
+        """
+        Record a committed chunk: new row offset, running counters and its per-row outcomes.
+        """
+        self.state.update({"committed_rows": str(committed_rows), "updated_at": str(int(time.time())), **extra})
+        self.state.update({name: str(value) for name, value in counters.items()})
+        try:
+            pipe = redis_client.pipeline(transaction=True)
+            if outcomes:
+                pipe.hset(self.rows_key, mapping={str(row): outcome for row, outcome in outcomes.items()})
+                pipe.expire(self.rows_key, JOB_TTL_SECONDS)
+            pipe.hset(self.key, mapping=self.state)
+            pipe.expire(self.key, JOB_TTL_SECONDS)
+            pipe.execute()
+        except Exception as e:
+            logger.error(f"Could not update import journal {self.key}: {e}")
+
+    def finish(self) -> None:
+        """
+        Mark the job as done.
+        """
+        self.state["status"] = STATUS_DONE
+        try:
+            redis_client.hset(self.key, "status", STATUS_DONE)
+        except Exception as e:
+            logger.error(f"Could not finish import journal {self.key}: {e}")
@@ -1,29 +1,63 @@
 # Standard library imports
 import os
 import csv
-import json
 import re
 import uuid
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
 
 # Third-party imports
-import requests
+import pandas as pd
 from dotenv import load_dotenv
 
-from typing import List, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 # App imports
 from app.utils.redis_manager import redis_client
 from app.utils.logger import get_logger
-from app.utils.keyvault_loader import DEEPINFRA_TOKEN
+from app.utils.metrics import timed
+from app.utils.embeddings import get_embedding, get_embeddings
+from app.books.import_jobs import ImportJob
+from app.books.schema import REQUIRED_CSV_COLUMNS
+from app.utils.vector_store import queue_document, store_document
+from app.utils.search_cache import bump_index_version
+from app.utils.local_vector_index import local_index_add
+from app.utils.suggestions import add_suggestions
+from app.utils.artifacts import ARTIFACT_POLICY, POLICY_ASYNC, save_record, submit
 
 
 logger = get_logger(__name__)
 load_dotenv()
 
 # ----------------- ENV & Constants ----------------- #
-EMBEDDING_MODEL = "BAAI/bge-base-en-v1.5"
-HEADERS = {"Authorization": f"Bearer {DEEPINFRA_TOKEN}"}
+BOOK_INDEX = "book_idx"
+
+# Batched embedding: max rows per request and approximate token budget per request
+EMBED_BATCH_SIZE = int(os.getenv("BOOK_EMBED_BATCH_SIZE", "32"))
+EMBED_BATCH_MAX_TOKENS = int(os.getenv("BOOK_EMBED_BATCH_MAX_TOKENS", "8000"))
+# Bulk import: books per non-transactional Redis pipeline
+WRITE_CHUNK_SIZE = int(os.getenv("BOOK_WRITE_CHUNK_SIZE", "100"))
+# Streaming import: rows read and processed per chunk, capped error/key lists in the report
+IMPORT_CHUNK_SIZE = int(os.getenv("BOOK_IMPORT_CHUNK_SIZE", "500"))
+REPORT_MAX_ITEMS = 20
+# Concurrent import: worker threads shared by all book imports in the process
+IMPORT_WORKERS = int(os.getenv("BOOK_IMPORT_WORKERS", "4"))
+
+# In-file duplicate detection: similarity ratio (0-1) for near-duplicate titles, 0 disables it
+NEAR_DUPLICATE_THRESHOLD = float(os.getenv("BOOK_NEAR_DUPLICATE_THRESHOLD", "0"))
+NEAR_DUPLICATE_CANDIDATES = 20
+MAX_RECORDED_COLLISIONS = 1000
+
+# pandas options: keep every value as a string, empty cells as "" (not NaN)
+CSV_READ_OPTIONS = {"dtype": str, "keep_default_na": False, "encoding": "utf-8"}
+
+# Row outcomes
+PROCESSED = "processed"
+FAILED = "failed"
+DUPLICATE = "duplicate"
 
 redis_json = redis_client.json()
 
@@ -37,6 +71,9 @@ os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 os.makedirs(PROCESSED_FOLDER, exist_ok=True)
 os.makedirs(FINAL_CSV_FOLDER, exist_ok=True)
 
+# Shared worker pool for embedding batches, pipeline writes and per-row processing
+import_executor = ThreadPoolExecutor(max_workers=IMPORT_WORKERS, thread_name_prefix="book-import")
+
 SEARCHABLE_COLUMNS = [
     "book_title",
     "dimension",
@@ -56,6 +93,36 @@ SEARCHABLE_COLUMNS = [
 ]
 
 # ----------------- Helpers ----------------- #
+@dataclass
+class ImportStats:
+    """
+    Per-import row counters, updated only by the importing thread in row order.
+    """
+    total: int = 0
+    processed: int = 0
+    failed: int = 0
+    duplicates: int = 0
+    collisions: List[str] = field(default_factory=list)
+
+    def add(self, outcome: str) -> None:
+        self.total += 1
+        if outcome == PROCESSED:
+            self.processed += 1
+        elif outcome == DUPLICATE:
+            self.duplicates += 1
+        else:
+            self.failed += 1
+
+    def add_collision(self, message: str) -> None:
+        if len(self.collisions) < MAX_RECORDED_COLLISIONS:
+            self.collisions.append(message)
+
+    def counters(self) -> Dict[str, int]:
+        return {"total": self.total, "processed": self.processed, "failed": self.failed, "duplicates": self.duplicates}
+
+    def summary(self) -> str:
+        return f"✅ Processed: {self.processed} | ❌ Failed: {self.failed} | ⏭️ Duplicates: {self.duplicates} | 📊 Total: {self.total}"
+
 def to_snake_case(text: str) -> str:
     text = text.strip().lower()
     text = re.sub(r'[\s\-]+', '_', text)
@@ -66,49 +133,100 @@ def generate_uuid(title: str) -> str:
     cleaned = re.sub(r'[^A-Za-z0-9]', '', title)[:6].lower() or "book"
     return f"{cleaned}_{uuid.uuid4()}"
 
-def get_embedding(text: str) -> List[float] | None:
+def estimate_tokens(text: str) -> int:
     """
-    Get embedding for the given text using DeepInfra API. Logs errors if any.
+    Rough token estimate (~4 characters per token) used to cap batch size.
     """
-    try:
-        resp = requests.post(
-            "https://api.deepinfra.com/v1/openai/embeddings",
-            headers=HEADERS,
-            json={"model": EMBEDDING_MODEL, "input": [text]}
-        )
-        resp.raise_for_status()
-        return resp.json()["data"][0]["embedding"]
-    except Exception as e:
-        logger.error(f"Embedding error: {e}")
+    return max(1, len(text) // 4)
+
+def iter_batches(books: Iterable[dict], max_size: int = EMBED_BATCH_SIZE,
+                 max_tokens: int = EMBED_BATCH_MAX_TOKENS) -> Iterator[List[dict]]:
+    """
+    Group prepared books into batches bounded by row count and estimated tokens.
+    A single book larger than the token budget is sent as its own batch.
+    """
+    batch: List[dict] = []
+    batch_tokens = 0
+    for book in books:
+        tokens = estimate_tokens(book["searchable_text"])
+        if batch and (len(batch) >= max_size or batch_tokens + tokens > max_tokens):
+            yield batch
+            batch, batch_tokens = [], 0
+        batch.append(book)
+        batch_tokens += tokens
+    if batch:
+        yield batch
+
+@timed("ingest.book.embed_batch")
+def embed_book_batch(books: List[dict]) -> List[List[float] | None]:
+    """
+    Embed a batch of prepared books with one request.
+    Rows missing from a failed or partial batch response are retried one by one.
+    """
+    embeddings = get_embeddings([book["searchable_text"] for book in books])
+    missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+    if missing:
+        logger.warning(f"Batch embedding incomplete: retrying {len(missing)}/{len(books)} rows individually")
+        for i in missing:
+            embeddings[i] = get_embedding(books[i]["searchable_text"])
+    return embeddings
+
+def duplicate_title_query(book_title: str) -> Optional[str]:
+    """
+    RediSearch query matching existing books whose title contains every word of `book_title`
+    (punctuation dropped, lowercase). None if the title has no searchable words.
+    """
+    filtered_query = re.sub(r'[^a-zA-Z0-9 ]', '', book_title).strip().lower()
+    if not filtered_query:
         return None
+    query_str = re.sub(r'([@!{}()\[\]\|><"~*:\\])', r'\\\1', filtered_query)
+    return f'@book_title:{query_str}'
 
 def check_duplicate_by_title(book_title: str) -> bool:
     """
     Check for duplicate book by title using RediSearch text search (no in-memory index).
-    Returns True if a book with the same normalized title exists, else False.
+    Returns True if a book matching every word of the title exists, else False.
+    """
+    return bool(find_existing_titles([book_title]))
+
+def find_existing_titles(titles: List[str]) -> set[str]:
     """
+    The titles that match an existing book (same rule as check_duplicate_by_title), checked
+    with one pipeline of count-only FT.SEARCH queries. Titles whose query fails count as new.
+    """
+    queries = [(title, duplicate_title_query(title)) for title in titles]
+    queries = [(title, query) for title, query in queries if query]
+    if not queries:
+        return set()
+    pipe = redis_client.pipeline(transaction=False)
+    for _, query in queries:
+        pipe.execute_command('FT.SEARCH', BOOK_INDEX, query, 'LIMIT', '0', '0')
     try:
-        filtered_query = re.sub(r'[^a-zA-Z0-9 ]', '', book_title).strip().lower()
-        query_str = re.sub(r'([@!{}()\[\]\|><"~*:\\])', r'\\\1', filtered_query)
-        search_query = f'@book_title:{query_str}'
-        args = [
-            'book_idx',
-            search_query,
-            'LIMIT', '0', '1',
-        ]
-        res = redis_client.execute_command('FT.SEARCH', *args)
-        # If any result found, it's a duplicate
-        return bool(res and len(res) > 2)
+        replies = pipe.execute(raise_on_error=False)
     except Exception as e:
         logger.error(f"RediSearch error in duplicate check: {e}")
-        return False
+        return set()
+    existing = set()
+    for (title, _), reply in zip(queries, replies):
+        if isinstance(reply, Exception):
+            logger.error(f"RediSearch error in duplicate check for '{title}': {reply}")
+        elif reply and int(reply[0]) > 0:
+            existing.add(title)
+    return existing
+
+def normalize_title(title: str) -> str:
+    """
+    Normalize a title for duplicate matching: alphanumerics only, lowercase, single spaces.
+    """
+    return " ".join(re.sub(r'[^a-zA-Z0-9 ]', '', title).lower().split())
 
 def build_searchable_text(row: dict[str, str]) -> str:
     return " ".join(str(row.get(col, "")) for col in SEARCHABLE_COLUMNS)
 
 # ----------------------------- BOOKS PROCESSOR ----------------------------- #
-# All duplicate detection and search now use RediSearch. No in-memory index logic remains.
-# Functions are commented and logging is present for all major operations.
+# Duplicates are checked in two tiers: DuplicateIndex catches repeats within the CSV being
+# imported (in memory, per import), then find_existing_titles looks the remaining titles up
+# in RediSearch. Functions are commented and logging is present for all major operations.
 # ----------------- Main Entry ----------------- #
 
 def stringify(value):
@@ -116,74 +234,365 @@ def stringify(value):
         return ", ".join(map(str, value))
     return str(value) if value is not None else ""
 
-def process_book_row(row, failed_ref, duplicates_ref):
+def prepare_book_row(row: dict[str, str]) -> dict | None:
+    """
+    Normalize CSV headers/values and build searchable text for one row.
+    Returns None if the row is incomplete.
+    """
     row_snake = {to_snake_case(k): v.strip() for k, v in row.items()}
     row_data = dict(row_snake)
     row_data["searchable_text"] = " ".join([stringify(row_data.get(col, '')) for col in SEARCHABLE_COLUMNS]).strip()
 
     if not row_data.get("book_title") or all(not v for k, v in row_data.items() if k != "book_title"):
-        failed_ref[0] += 1
         logger.warning(f"Incomplete book data in row: {row}")
         return None
+    return row_data
 
-    if check_duplicate_by_title(row_data["book_title"]):
-        duplicates_ref[0] += 1
-        logger.info(f"Duplicate book found: {row_data['book_title']}")
-        return None
+def validate_book_columns(columns: Iterable[str]) -> None:
+    """
+    Check CSV headers against the required columns of the upload schema.
+    Raises ValueError listing the missing columns.
+    """
+    present = {to_snake_case(col) for col in columns}
+    missing = [col for col in REQUIRED_CSV_COLUMNS if to_snake_case(col) not in present]
+    if missing:
+        raise ValueError(f"Missing required CSV columns: {', '.join(missing)}")
 
-    uuid_ = generate_uuid(row_data["book_title"])
-    redis_key = f"book:{uuid_}"
-    embedding = get_embedding(row_data["searchable_text"])
-    if embedding is None:
-        failed_ref[0] += 1
-        logger.error(f"Failed to get embedding for book: {row_data['book_title']}")
-        return None
+def read_csv_columns(path: str) -> List[str]:
+    """
+    Read only the header row of a CSV file.
+    """
+    return list(pd.read_csv(path, nrows=0, **CSV_READ_OPTIONS).columns)
+
+@timed("ingest.book.prepare")
+def prepare_book_frame(frame: pd.DataFrame) -> List[dict | None]:
+    """
+    Column-oriented version of `prepare_book_row` for a chunk of CSV rows: headers are mapped
+    once, values are stripped and searchable text is built column by column.
+    Returns one dict per row (None for incomplete rows), in row order.
+    """
+    frame = frame.copy()
+    frame.columns = [to_snake_case(col) for col in frame.columns]
+    for col in frame.columns:
+        frame[col] = frame[col].str.strip()
+
+    searchable = frame.reindex(columns=SEARCHABLE_COLUMNS, fill_value="")
+    text = searchable[SEARCHABLE_COLUMNS[0]]
+    for col in SEARCHABLE_COLUMNS[1:]:
+        text = text + " " + searchable[col]
+    frame["searchable_text"] = text.str.strip()
 
+    # Same rule as prepare_book_row: searchable_text counts as a non-title value (it holds the
+    # title), so a row is complete whenever it has a title
+    titles = frame["book_title"] if "book_title" in frame else pd.Series("", index=frame.index)
+    others = frame.drop(columns=["book_title"], errors="ignore")
+    complete = titles.ne("") & others.ne("").any(axis=1)
+    incomplete = int((~complete).sum())
+    if incomplete:
+        logger.warning(f"Incomplete book data in {incomplete} rows")
+    return [record if ok else None for record, ok in zip(frame.to_dict("records"), complete)]
+
+def build_book_document(row_data: dict, embedding: List[float]) -> Tuple[str, dict]:
+    """
+    Build the Redis key and JSON document for a book.
+    """
+    uuid_ = generate_uuid(row_data["book_title"])
     book_data = {
         "uuid": uuid_,
         **row_data,
         "embedding": embedding
     }
-    redis_json.set(redis_key, "$", book_data)
+    return f"book:{uuid_}", book_data
+
+def save_book_artifact(book_data: dict) -> None:
+    """
+    Save the processed book locally according to ARTIFACT_POLICY (off the request path).
+    """
+    save_record(PROCESSED_FOLDER, book_data["uuid"], book_data, stream="books")
+
+def save_book(row_data: dict, embedding: List[float]) -> dict:
+    """
+    Store a book with its embedding in Redis and save the processed JSON.
+    """
+    redis_key, book_data = build_book_document(row_data, embedding)
+    store_document(redis_json, redis_key, book_data)
+    version = bump_index_version(BOOK_INDEX)
+    local_index_add("book", [(redis_key, embedding)], version)
+    add_suggestions("book", [(book_data["book_title"], redis_key)])
     logger.info(f"Saved book to Redis: {redis_key}")
-    json_path = os.path.join(PROCESSED_FOLDER, f"{uuid_}.json")
-    with open(json_path, "w", encoding="utf-8") as jf:
-        json.dump(book_data, jf, indent=2, ensure_ascii=False)
-    logger.info(f"Saved processed book JSON: {json_path}")
+    save_book_artifact(book_data)
     return book_data
 
-def process_book_csv(uploaded_file_path: str) -> Tuple[List[dict[str, str]], str]:
+@timed("ingest.book.write_chunk")
+def save_book_chunk(chunk: List[Tuple[str, dict]]) -> List[Tuple[str, dict, Exception | None]]:
     """
-    Process a CSV file containing book data, generate embeddings, and store in Redis.
-    Logs all major actions and errors.
+    Write one chunk of book documents through a single non-transactional pipeline.
+    Returns (key, document, error) per book; error is None when the write succeeded.
     """
+    pipe = redis_json.pipeline(transaction=False)
+    command_counts = [queue_document(pipe, redis_key, book_data) for redis_key, book_data in chunk]
+    try:
+        replies = pipe.execute(raise_on_error=False)
+    except Exception as e:
+        logger.error(f"Pipeline write failed for {len(chunk)} books: {e}")
+        replies = [e] * sum(command_counts)
+    results = []
+    offset = 0
+    for (redis_key, book_data), count in zip(chunk, command_counts):
+        # A book may need several commands (document + binary vector); any failure fails the book
+        error = next((reply for reply in replies[offset:offset + count] if isinstance(reply, Exception)), None)
+        offset += count
+        if error:
+            logger.error(f"Failed to save book to Redis: {redis_key}: {error}")
+        else:
+            save_book_artifact(book_data)
+        results.append((redis_key, book_data, error))
+    version = bump_index_version(BOOK_INDEX)
+    stored = [(key, book_data) for key, book_data, error in results if error is None]
+    local_index_add("book", [(key, book_data["embedding"]) for key, book_data in stored], version)
+    add_suggestions("book", [(book_data["book_title"], key) for key, book_data in stored])
+    logger.info(f"Saved {len(chunk)} books to Redis in one pipeline")
+    return results
+
+def save_books_pipelined(documents: List[Tuple[str, dict]]) -> List[Tuple[str, dict, Exception | None]]:
+    """
+    Write book documents in pipelines of WRITE_CHUNK_SIZE commands, run on the shared worker pool.
+    Results are returned in input order.
+    """
+    chunks = [documents[start:start + WRITE_CHUNK_SIZE] for start in range(0, len(documents), WRITE_CHUNK_SIZE)]
+    return [result for chunk_results in import_executor.map(save_book_chunk, chunks) for result in chunk_results]
+
+class DuplicateIndex:
+    """
+    Per-import duplicate detection against earlier rows of the same CSV (exact normalized
+    title, and similar titles when `near_threshold` > 0). Books already in Redis are checked
+    per chunk with find_existing_titles.
+    """
+    def __init__(self, near_threshold: float = NEAR_DUPLICATE_THRESHOLD):
+        self.near_threshold = near_threshold
+        self.seen: dict[str, Tuple[int, str]] = {}
+        self.token_index: defaultdict[str, set[str]] = defaultdict(set)
+
+    def find_near_duplicate(self, normalized: str) -> Optional[str]:
+        """
+        Return the most similar earlier title at or above the threshold, if any.
+        Candidates are limited to titles sharing the most (non-trivial) words.
+        """
+        shared = Counter()
+        for token in set(normalized.split()):
+            if len(token) > 2:
+                shared.update(self.token_index[token])
+        best, best_ratio = None, self.near_threshold
+        for candidate, _ in shared.most_common(NEAR_DUPLICATE_CANDIDATES):
+            ratio = SequenceMatcher(None, normalized, candidate).ratio()
+            if ratio >= best_ratio:
+                best, best_ratio = candidate, ratio
+        return best
+
+    def check(self, book_title: str, row_number: int) -> Optional[str]:
+        """
+        Register a row's title. Returns a description of the earlier row it collides with, or None.
+        """
+        normalized = normalize_title(book_title)
+        match = self.seen.get(normalized)
+        if match is None and self.near_threshold > 0:
+            near = self.find_near_duplicate(normalized)
+            match = self.seen[near] if near else None
+        if match:
+            return f"row {match[0]} ('{match[1]}')"
+
+        self.seen[normalized] = (row_number, book_title)
+        for token in set(normalized.split()):
+            if len(token) > 2:
+                self.token_index[token].add(normalized)
+        return None
+
+@timed("ingest.book.chunk")
+def process_book_chunk(prepared_rows: List[dict | None], duplicates: DuplicateIndex, stats: ImportStats,
+                       start_row: int = 0, outcomes: Optional[Dict[int, str]] = None) -> Tuple[List[dict], List[str]]:
+    """
+    Bulk ingestion of a chunk of rows prepared by `prepare_book_frame` (None marks an incomplete
+    row); `start_row` is the number of data rows before this chunk.
+    Duplicates (in this CSV or in Redis) are rejected before any embedding request. Embedding
+    batches and pipelined writes run concurrently on the shared worker pool (DeepInfra calls go
+    through the shared rate limiter); results are collected in row order so counters and output
+    are deterministic. If `outcomes` is given it is filled with row number -> outcome.
+    Returns the stored books and per-key error messages for failed writes.
+    """
+    outcomes = {} if outcomes is None else outcomes
+    candidates = []
+    for row_number, row_data in enumerate(prepared_rows, start=start_row + 1):
+        if row_data is None:
+            stats.add(FAILED)
+            outcomes[row_number] = FAILED
+            continue
+        collision = duplicates.check(row_data["book_title"], row_number)
+        if collision:
+            logger.info(f"Duplicate book found: row {row_number} ('{row_data['book_title']}') duplicates {collision}")
+            stats.add_collision(f"⏭️ row {row_number} ('{row_data['book_title']}') duplicates {collision}")
+            stats.add(DUPLICATE)
+            outcomes[row_number] = DUPLICATE
+        else:
+            candidates.append((row_number, row_data))
+
+    # Same rule as the per-row import (every title word matches an existing book), one pipeline
+    existing = find_existing_titles([row_data["book_title"] for _, row_data in candidates])
+    for row_number, row_data in candidates:
+        if row_data["book_title"] in existing:
+            logger.info(f"Duplicate book found: row {row_number} ('{row_data['book_title']}') duplicates an existing book in Redis")
+            stats.add_collision(f"⏭️ row {row_number} ('{row_data['book_title']}') duplicates an existing book in Redis")
+            stats.add(DUPLICATE)
+            outcomes[row_number] = DUPLICATE
+    candidate_rows = [row_number for row_number, row_data in candidates if row_data["book_title"] not in existing]
+    candidates = [row_data for _, row_data in candidates if row_data["book_title"] not in existing]
+
+    # Batches preserve candidate order, so row numbers are consumed in step with the books
+    row_numbers = iter(candidate_rows)
+    batches = list(iter_batches(candidates))
+    documents: List[Tuple[str, dict]] = []
+    document_rows = []
+    for batch, embeddings in zip(batches, import_executor.map(embed_book_batch, batches)):
+        logger.info(f"Embedded batch of {len(batch)} books")
+        for row_data, embedding in zip(batch, embeddings):
+            row_number = next(row_numbers)
+            if embedding is None:
+                logger.error(f"Failed to get embedding for book: {row_data['book_title']}")
+                stats.add(FAILED)
+                outcomes[row_number] = FAILED
+                continue
+            documents.append(build_book_document(row_data, embedding))
+            document_rows.append(row_number)
+
     processed_books = []
-    total = 0
-    failed = [0]
-    duplicates = [0]
+    errors = []
+    for row_number, (redis_key, book_data, error) in zip(document_rows, save_books_pipelined(documents)):
+        if error:
+            stats.add(FAILED)
+            outcomes[row_number] = FAILED
+            errors.append(f"❌ '{redis_key}': {error}")
+        else:
+            stats.add(PROCESSED)
+            outcomes[row_number] = f"{PROCESSED} {redis_key}"
+            processed_books.append(book_data)
+    return processed_books, errors
 
+def store_uploaded_csv(uploaded_file_path: str) -> str:
+    """
+    Copy the uploaded CSV into UPLOAD_FOLDER (if not already there) and return its path.
+    """
     filename = os.path.basename(uploaded_file_path)
     saved_path = os.path.join(UPLOAD_FOLDER, filename)
     if uploaded_file_path != saved_path:
         shutil.copyfile(uploaded_file_path, saved_path)
         logger.info(f"Book CSV uploaded: {saved_path}")
+    return saved_path
+
+def append_books_csv(final_csv_path: str, books: List[dict]) -> None:
+    """
+    Append processed books to the final CSV, writing the header on first use.
+    Runs on the artifact writer thread (see `save_books_csv`).
+    """
+    if not books:
+        return
+    write_header = not os.path.exists(final_csv_path)
+    with open(final_csv_path, "a", encoding="utf-8", newline="") as out_csv:
+        writer = csv.DictWriter(out_csv, fieldnames=books[0].keys(), extrasaction="ignore")
+        if write_header:
+            writer.writeheader()
+        writer.writerows(books)
+
+def save_books_csv(final_csv_path: str, books: List[dict]) -> bool:
+    """
+    Queue processed books for the final CSV. Only the async artifact policy writes CSVs
+    (compact mode already keeps every book in the JSONL stream). Returns True if queued.
+    """
+    if ARTIFACT_POLICY != POLICY_ASYNC or not books:
+        return False
+    submit(append_books_csv, final_csv_path, books)
+    return True
+
+def process_book_csv(uploaded_file_path: str) -> Tuple[List[dict[str, str]], str]:
+    """
+    Process a CSV file containing book data, generate embeddings, and store in Redis.
+    Duplicates are resolved up front, rows are embedded in batches of BOOK_EMBED_BATCH_SIZE
+    rows / BOOK_EMBED_BATCH_MAX_TOKENS tokens and written through pipelines of
+    BOOK_WRITE_CHUNK_SIZE books. Returns every processed book; use `stream_book_csv` for large files.
+    Raises ValueError before any API call if required columns are missing.
+    Logs all major actions and errors.
+    """
+    stats = ImportStats()
 
-    with open(saved_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            total += 1
-            book_data = process_book_row(row, failed, duplicates)
-            if book_data:
-                processed_books.append(book_data)
+    saved_path = store_uploaded_csv(uploaded_file_path)
+    validate_book_columns(read_csv_columns(saved_path))
+    prepared_rows = prepare_book_frame(pd.read_csv(saved_path, **CSV_READ_OPTIONS))
+    processed_books, errors = process_book_chunk(prepared_rows, DuplicateIndex(), stats)
 
     final_csv_path = os.path.join(FINAL_CSV_FOLDER, f"processed_books_{uuid.uuid4()}.csv")
-    if processed_books:
-        with open(final_csv_path, "w", encoding="utf-8", newline="") as out_csv:
-            writer = csv.DictWriter(out_csv, fieldnames=processed_books[0].keys())
-            writer.writeheader()
-            writer.writerows(processed_books)
-        logger.info(f"Saved processed books CSV: {final_csv_path}")
+    if save_books_csv(final_csv_path, processed_books):
+        logger.info(f"Queued processed books CSV: {final_csv_path}")
 
-    summary = f"✅ Processed: {len(processed_books)} | ❌ Failed: {failed[0]} | ⏭️ Duplicates: {duplicates[0]} | 📊 Total: {total}"
+    summary = stats.summary()
     logger.info(summary)
+    if errors or stats.collisions:
+        summary = "\n".join([summary, *errors, *stats.collisions])
     return processed_books, summary
+
+def stream_book_csv(uploaded_file_path: str, chunk_size: int = IMPORT_CHUNK_SIZE) -> Iterator[dict]:
+    """
+    Streaming import: read the CSV in chunks of `chunk_size` rows, process each chunk with the
+    bulk path and append it to the final CSV, so only one chunk is held in memory at a time.
+    Each committed chunk is checkpointed in the import journal (see `ImportJob`); an interrupted
+    import of the same file resumes at the first uncommitted row.
+    Raises ValueError before any API call if required columns are missing.
+    Yields a compact progress report after every chunk; the last report has status "done".
+    """
+    sample_keys: List[str] = []
+    errors: List[str] = []
+
+    saved_path = store_uploaded_csv(uploaded_file_path)
+    validate_book_columns(read_csv_columns(saved_path))
+    total_rows = sum(len(chunk) for chunk in pd.read_csv(saved_path, usecols=[0], chunksize=10000, **CSV_READ_OPTIONS))
+    job = ImportJob.for_file(saved_path)
+    rows_read = job.committed_rows
+    stats = ImportStats(**job.counters)
+    job_start_row = rows_read
+    final_csv_path = job.state.get("final_csv") or os.path.join(FINAL_CSV_FOLDER, f"processed_books_{uuid.uuid4()}.csv")
+
+    def report(status: str) -> dict:
+        return {
+            "status": status,
+            "job_id": job.job_id,
+            "resumed_from_row": job_start_row,
+            "progress": f"{stats.total}/{total_rows} rows",
+            "summary": stats.summary(),
+            "sample_keys": sample_keys,
+            "errors": errors,
+            "collisions": stats.collisions[:REPORT_MAX_ITEMS],
+        }
+
+    yield report("running")
+    duplicates = DuplicateIndex()
+    for chunk in pd.read_csv(saved_path, chunksize=chunk_size, **CSV_READ_OPTIONS):
+        # Skip rows committed by an earlier, interrupted run of this job (the index is the row offset)
+        chunk = chunk[chunk.index >= rows_read]
+        if chunk.empty:
+            continue
+        outcomes: Dict[int, str] = {}
+        books, chunk_errors = process_book_chunk(prepare_book_frame(chunk), duplicates, stats,
+                                                 start_row=rows_read, outcomes=outcomes)
+        rows_read += len(chunk)
+        save_books_csv(final_csv_path, books)
+        job.commit(rows_read, stats.counters(), outcomes, final_csv=final_csv_path)
+        sample_keys.extend(f"book:{book['uuid']}" for book in books[:REPORT_MAX_ITEMS - len(sample_keys)])
+        errors.extend(chunk_errors[:REPORT_MAX_ITEMS - len(errors)])
+        logger.info(f"Book import progress: {stats.total}/{total_rows} rows")
+        yield report("running")
+
+    job.finish()
+    csv_written = stats.processed and ARTIFACT_POLICY == POLICY_ASYNC
+    if csv_written:
+        logger.info(f"Queued processed books CSV: {final_csv_path}")
+    final = report("done")
+    final["final_csv"] = final_csv_path if csv_written else None
+    logger.info(final["summary"])
+    yield final
@@ -0,0 +1,37 @@
+"""
+app/books/schema.py
+Expected book CSV columns, in upload order. Columns marked with * are required.
+"""
+
+REQUIRED_MARKER = "*"
+
+# Column headers exactly as they appear in Sample_File.csv
+BOOK_CSV_COLUMNS = [
+    "Book Title",
+    "Dimension*",
+    "Sub-Themes*",
+    "Author",
+    "Summary",
+    "Who is it for",
+    "Why you will love it",
+    "Zumlos Takeaway",
+    "Audience",
+    "Difficulty",
+    "Format",
+    "Tone and Style",
+    "Length",
+    "Expert Recommended",
+    "Clinically Validated",
+    "Awards and Recognition",
+    "User Goal Alignment*",
+    "Challenge Addressed*",
+    "Stage of Wellness Journey*",
+    "Activity and Engagement Compatibility*",
+    "Conversational Keywords*",
+    "Emotional and Behavioral Triggers*",
+    "Personality Fit*",
+    "Recommended Complementary Resources*",
+]
+
+# Book Title is not starred in the upload note but every row needs one
+REQUIRED_CSV_COLUMNS = ["Book Title"] + [col for col in BOOK_CSV_COLUMNS if col.endswith(REQUIRED_MARKER)]
@@ -8,7 +8,9 @@ import gradio as gr
 
 # App imports
 from app.videos.runner import run_video_pipeline
-from app.books.processor import process_book_csv
+from app.videos.batch import run_video_batch, split_sources, VIDEO_BATCH_WORKERS
+from app.books.processor import stream_book_csv
+from app.books.schema import BOOK_CSV_COLUMNS
 from app.utils.logger import get_logger
 
 # Constants
@@ -35,27 +37,27 @@ def save_uploaded_file(file_obj, dest_path):
         raise ValueError("Unsupported file object type for upload.")
 
 def process_and_log_csv(path, logger):
-    """Process CSV and log results."""
+    """Stream CSV processing, yielding compact progress reports, and log results."""
     try:
-        books_json, summary = process_book_csv(path)
-        logger.info(f"Processed book CSV: {path} | Summary: {summary}")
-        return {
-            "summary": summary,
-            "processed_books": books_json
-        }
+        report = {}
+        for report in stream_book_csv(path):
+            yield report
+        logger.info(f"Processed book CSV: {path} | Summary: {report.get('summary')}")
     except Exception as e:
         logger.error(f"Error processing book CSV: {e}")
-        return {"error": f"❌ Error processing CSV: {e}"}
+        yield {"error": f"❌ Error processing CSV: {e}"}
 
 def handle_book_upload(file_obj, upload_folder, logger):
     """
     Handles the upload and processing of a book CSV file.
     Logs the upload and processing steps.
+    Yields progress reports so the UI updates while large files are imported.
     Refactored for lower cognitive complexity and SonarQube guidelines.
     """
     if not file_obj:
         logger.warning("No CSV file uploaded for books.")
-        return {"error": "❌ Please upload a CSV file."}
+        yield {"error": "❌ Please upload a CSV file."}
+        return
 
     dest_path = os.path.join(upload_folder, os.path.basename(file_obj.name))
     try:
@@ -63,9 +65,10 @@ def handle_book_upload(file_obj, upload_folder, logger):
         logger.info(f"Book CSV uploaded and saved to: {dest_path}")
     except Exception as e:
         logger.error(f"Failed to save uploaded CSV: {e}")
-        return {"error": f"❌ Failed to save uploaded CSV: {e}"}
+        yield {"error": f"❌ Failed to save uploaded CSV: {e}"}
+        return
 
-    return process_and_log_csv(dest_path, logger)
+    yield from process_and_log_csv(dest_path, logger)
 
 def handle_video_upload(youtube_url, logger):
     """
@@ -83,6 +86,27 @@ def handle_video_upload(youtube_url, logger):
         logger.error(f"Error processing YouTube video: {e}")
         return {"error": f"❌ Error processing video: {e}"}
 
+def handle_video_batch_upload(url_text, file_obj, workers, logger):
+    """
+    Streams progress of a batch ingest of pasted URLs and/or an uploaded URL list.
+    Playlist and channel URLs are expanded to their videos.
+    """
+    entries = split_sources(url_text)
+    if file_obj is not None:
+        path = file_obj if isinstance(file_obj, str) else file_obj.name
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entries.extend(split_sources(f.read()))
+        except Exception as e:
+            logger.error(f"Failed to read URL list: {e}")
+            yield {"error": f"❌ Failed to read URL list: {e}"}
+            return
+    if not entries:
+        yield {"message": "❌ Please enter YouTube URLs or upload a list."}
+        return
+    logger.info(f"Starting video batch with {len(entries)} entries")
+    yield from run_video_batch(entries, workers=int(workers))
+
 def render_add_data_tab():
     """
     Renders the Add Data tab for uploading books (CSV) and YouTube videos.
@@ -92,10 +116,10 @@ def render_add_data_tab():
         # Book Upload Tab
         with gr.Tab("📚Book"):
             gr.Markdown(
-                """
+                f"""
                 <div style='background:transparent; border:none; padding:0; margin-bottom:12px;'>
                     <span style='color:#e67e22; font-weight:bold;'>Important Note: The CSV you upload must have the following columns in this exact order and format:</span><br>
-                    <code style='color:inherit; background:var(--color-background-tertiary); padding:2px 4px; border-radius:4px; display:block; margin:6px 0;'>Book Title, Dimension*, Sub-Themes*, Author, Summary, Who is it for, Why you will love it, Zumlos Takeaway, Audience, Difficulty, Format, Tone and Style, Length, Expert Recommended, Clinically Validated, Awards and Recognition, User Goal Alignment*, Challenge Addressed*, Stage of Wellness Journey*, Activity and Engagement Compatibility*, Conversational Keywords*, Emotional and Behavioral Triggers*, Personality Fit*, Recommended Complementary Resources*</code>
+                    <code style='color:inherit; background:var(--color-background-tertiary); padding:2px 4px; border-radius:4px; display:block; margin:6px 0;'>{', '.join(BOOK_CSV_COLUMNS)}</code>
                     <span style='color:#e67e22;'><i>Columns marked with * are required.<br>
                 </div>
                 """,
@@ -107,10 +131,13 @@ def render_add_data_tab():
             gr.Markdown("### Upload Book CSV")
             csv_input = gr.File(file_types=[".csv"], label="Upload CSV", height=130)
             upload_book_btn = gr.Button("Process & Save Book", variant="primary")
-            book_output = gr.Json(label="Processed Book Data (JSON)")
+            book_output = gr.Json(label="Book Import Report")
+
+            def on_book_upload(file_obj):
+                yield from handle_book_upload(file_obj, UPLOAD_FOLDER, logger)
 
             upload_book_btn.click(
-                lambda file_obj: handle_book_upload(file_obj, UPLOAD_FOLDER, logger),
+                on_book_upload,
                 inputs=[csv_input],
                 outputs=[book_output]
             )
@@ -130,3 +157,23 @@ def render_add_data_tab():
                 inputs=[youtube_input],
                 outputs=[video_output]
             )
+
+            with gr.Accordion("Batch import (URL list, playlist or channel)", open=False):
+                batch_urls = gr.Textbox(
+                    label="YouTube URLs",
+                    placeholder="One video, playlist or channel URL per line",
+                    lines=6
+                )
+                batch_file = gr.File(file_types=[".txt", ".csv"], label="Or upload a URL list", height=100)
+                batch_workers = gr.Slider(1, 16, value=VIDEO_BATCH_WORKERS, step=1, label="Parallel videos")
+                batch_btn = gr.Button("Process & Save Videos", variant="primary")
+                batch_output = gr.Json(label="Video Batch Progress")
+
+                def on_video_batch(url_text, file_obj, workers):
+                    yield from handle_video_batch_upload(url_text, file_obj, workers, logger)
+
+                batch_btn.click(
+                    on_video_batch,
+                    inputs=[batch_urls, batch_file, batch_workers],
+                    outputs=[batch_output]
+                )
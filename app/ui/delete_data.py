@@ -3,7 +3,8 @@
 import gradio as gr
 
 # App imports
-from app.utils.common import delete_multiple_keys
+from app.utils.common import delete_multiple_keys, bulk_delete
+from app.utils.facets import FACET_FIELDS
 from app.utils.logger import get_logger
 
 # Logger setup
@@ -23,6 +24,49 @@ def handle_video_deletion(video_keys: str) -> str:
     logger.info(f"Deleting video keys: {video_keys}")
     return delete_multiple_keys(video_keys, expected_prefix="video:")
 
+def parse_filter_text(filter_text: str) -> dict:
+    """
+    Parses 'field=value, value; field=value' into a facet filters dict.
+    """
+    filters = {}
+    for part in (filter_text or "").split(";"):
+        field, _, values = part.partition("=")
+        if field.strip() and values.strip():
+            filters[field.strip()] = [value.strip() for value in values.split(",") if value.strip()]
+    return filters
+
+def handle_bulk_deletion(kind: str, query: str, pattern: str, filter_text: str, dry_run: bool):
+    """
+    Streams bulk delete progress (per batch) for a key pattern, title query and/or facet filters.
+    """
+    logger.info(f"Bulk delete {kind}: query={query!r} pattern={pattern!r} filters={filter_text!r} dry_run={dry_run}")
+    yield from bulk_delete(kind, query=query or "", pattern=(pattern or "").strip(),
+                           filters=parse_filter_text(filter_text), dry_run=dry_run)
+
+def render_bulk_delete(kind: str):
+    """
+    Renders the bulk delete controls for one document kind.
+    """
+    with gr.Accordion(f"Bulk delete {kind}s by query, filter or key pattern", open=False):
+        query = gr.Textbox(label="Title query (optional)")
+        filter_text = gr.Textbox(
+            label="Facet filters (optional)",
+            placeholder=f"{FACET_FIELDS[kind][0]}=value, other value; {FACET_FIELDS[kind][-1]}=value",
+        )
+        pattern = gr.Textbox(label="Key pattern (optional, overrides query/filters)", placeholder=f"{kind}:abc*")
+        dry_run = gr.Checkbox(label="Dry run (preview only)", value=True)
+        run_btn = gr.Button("Run bulk delete", variant="stop")
+        report = gr.Json(label="Bulk Delete Progress")
+
+        def on_bulk_delete(query_text, pattern_text, filters, dry):
+            yield from handle_bulk_deletion(kind, query_text, pattern_text, filters, dry)
+
+        run_btn.click(
+            on_bulk_delete,
+            inputs=[query, pattern, filter_text, dry_run],
+            outputs=report,
+        )
+
 def render_delete_data_tab():
     """
     Renders the Delete Data tab for books and videos.
@@ -43,6 +87,8 @@ def render_delete_data_tab():
                 outputs=[book_delete_status]
             )
 
+            render_bulk_delete("book")
+
             gr.Markdown("""
 ---
 ### ℹ️ **Book Deletion Instructions**
@@ -68,6 +114,8 @@ def render_delete_data_tab():
                 outputs=[video_delete_status]
             )
 
+            render_bulk_delete("video")
+
             gr.Markdown("""
 ---
 ### ℹ️ **Video Deletion Instructions**
@@ -3,35 +3,115 @@
 import gradio as gr
 
 # App imports
-from app.utils.common import search_book_by_title, search_video_by_title_or_url
-from app.utils.redis_manager import redis_client
+from app.utils.common import (
+    search_books_page, search_videos_page, semantic_search_books, semantic_search_videos,
+    hybrid_search, page_count, extract_video_id, facet_counts,
+    SEARCH_MODE_TEXT, SEARCH_MODE_SEMANTIC, SEARCH_MODE_HYBRID
+)
+from app.utils.facets import FACET_FIELDS
+from app.utils.suggestions import get_suggestions
+from app.utils.vector_store import get_document
 from app.utils.logger import get_logger
+from app.utils.metrics import timed
 
 # Logger setup
 logger = get_logger(__name__)
 NO_RESULTS_FOUND = "No results found"
 
-def handle_book_search(book_title):
+def format_page_info(page, total):
     """
-    Handles book search by title and logs the search action.
+    Builds the page position line shown under the search results.
     """
-    logger.info(f"Searching for book: {book_title}")
-    keys, data = search_book_by_title(book_title)
+    if not total:
+        return ""
+    return f"Page {page} of {page_count(total)} · {total} result(s)"
+
+def selected_filters(kind, selections):
+    """
+    Maps the facet dropdown selections (in FACET_FIELDS order) to a filters dict.
+    """
+    return {field: list(values) for field, values in zip(FACET_FIELDS[kind], selections) if values}
+
+def facet_dropdown_updates(kind, query, filters):
+    """
+    Refreshes the facet dropdowns with per-value counts for the current query and filters,
+    keeping the selected values.
+    """
+    counts = facet_counts(kind, query, filters)
+    updates = []
+    for field in FACET_FIELDS[kind]:
+        selected = filters.get(field, [])
+        choices = [(f"{value} ({count})", value) for value, count in counts.get(field, [])]
+        listed = {value for _, value in choices}
+        choices += [(value, value) for value in selected if value not in listed]
+        updates.append(gr.Dropdown(choices=choices, value=selected))
+    return updates
+
+@timed("ui.book_search")
+def handle_book_search(book_title, mode=SEARCH_MODE_TEXT, page=1, *facet_selections):
+    """
+    Handles book search by title (text) or meaning (semantic) and logs the search action.
+    Text results are paginated; semantic and hybrid results are a single top-k page.
+    Facet selections are passed to RediSearch as filters, and the facet counts are refreshed.
+    """
+    page = max(int(page or 1), 1)
+    filters = selected_filters("book", facet_selections)
+    logger.info(f"Searching for book ({mode}, page {page}, filters {filters}): {book_title}")
+    if mode == SEARCH_MODE_SEMANTIC:
+        keys, data = semantic_search_books(book_title, filters=filters)
+        page, total = 1, len(keys)
+    elif mode == SEARCH_MODE_HYBRID:
+        keys, data = hybrid_search("book", book_title, filters=filters)
+        page, total = 1, len(keys)
+    else:
+        keys, data, total = search_books_page(book_title, page, filters=filters)
+        if not keys and total and page > page_count(total):
+            page = page_count(total)
+            keys, data, total = search_books_page(book_title, page, filters=filters)
+    # Semantic matches are not limited to title hits, so count over the filters alone there
+    facets = facet_dropdown_updates("book", book_title if mode == SEARCH_MODE_TEXT else "", filters)
     if not keys:
         logger.info(f"No book results found for: {book_title}")
-        return gr.Dropdown(choices=[NO_RESULTS_FOUND], value=NO_RESULTS_FOUND), {"message": "❌ No related book results found. Please check your search query or try a different title."}
-    return gr.Dropdown(choices=keys, value=keys[0]), data[0]
+        return gr.Dropdown(choices=[NO_RESULTS_FOUND], value=NO_RESULTS_FOUND), {"message": "❌ No related book results found. Please check your search query or try a different title."}, "", 1, *facets
+    return gr.Dropdown(choices=keys, value=keys[0]), data[0], format_page_info(page, total), page, *facets
 
-def handle_video_search(input_text):
+@timed("ui.video_search")
+def handle_video_search(input_text, mode=SEARCH_MODE_TEXT, page=1, *facet_selections):
     """
-    Handles video search by title or URL and logs the search action.
+    Handles video search by title or URL (text) or meaning (semantic) and logs the search action.
+    Text results are paginated; semantic and hybrid results are a single top-k page.
+    Facet selections are passed to RediSearch as filters, and the facet counts are refreshed.
     """
-    logger.info(f"Searching for video: {input_text}")
-    keys, data = search_video_by_title_or_url(input_text)
+    page = max(int(page or 1), 1)
+    filters = selected_filters("video", facet_selections)
+    is_url = bool(extract_video_id(input_text))
+    logger.info(f"Searching for video ({mode}, page {page}, filters {filters}): {input_text}")
+    if mode == SEARCH_MODE_SEMANTIC:
+        keys, data = semantic_search_videos(input_text, filters=filters)
+        page, total = 1, len(keys)
+    elif mode == SEARCH_MODE_HYBRID and not is_url:
+        keys, data = hybrid_search("video", input_text, filters=filters)
+        page, total = 1, len(keys)
+    else:
+        keys, data, total = search_videos_page(input_text, page, filters=filters)
+        if not keys and total and page > page_count(total):
+            page = page_count(total)
+            keys, data, total = search_videos_page(input_text, page, filters=filters)
+    facet_query = input_text if mode == SEARCH_MODE_TEXT and not is_url else ""
+    facets = facet_dropdown_updates("video", facet_query, filters)
     if not keys:
         logger.info(f"No video results found for: {input_text}")
-        return gr.Dropdown(choices=[NO_RESULTS_FOUND], value=NO_RESULTS_FOUND), {"message": "❌ No related video results found. Please check your search query or try a different title or URL."}
-    return gr.Dropdown(choices=keys, value=keys[0]), data[0]
+        return gr.Dropdown(choices=[NO_RESULTS_FOUND], value=NO_RESULTS_FOUND), {"message": "❌ No related video results found. Please check your search query or try a different title or URL."}, "", 1, *facets
+    return gr.Dropdown(choices=keys, value=keys[0]), data[0], format_page_info(page, total), page, *facets
+
+def handle_suggestions(kind, text):
+    """
+    Refreshes the title suggestions for what has been typed so far (nothing for video URLs).
+    """
+    if not text or (kind == "video" and extract_video_id(text)):
+        return gr.Dropdown(choices=[], value=None)
+    titles = [suggestion["title"] for suggestion in get_suggestions(kind, text)]
+    return gr.Dropdown(choices=titles, value=None)
 
 def handle_book_dropdown_change(selected_key):
     """
@@ -40,7 +120,7 @@ def handle_book_dropdown_change(selected_key):
     if not selected_key:
         return None
     logger.info(f"Loading book data for key: {selected_key}")
-    return redis_client.json().get(selected_key)
+    return get_document(selected_key)
 
 def handle_video_dropdown_change(selected_key):
     """
@@ -49,7 +129,7 @@ def handle_video_dropdown_change(selected_key):
     if not selected_key:
         return None
     logger.info(f"Loading video data for key: {selected_key}")
-    return redis_client.json().get(selected_key)
+    return get_document(selected_key)
 
 def render_search_data_tab():
     """
@@ -57,18 +137,56 @@ def render_search_data_tab():
     """
     with gr.Column():
         with gr.Tab("📚 Book"):
-            gr.Markdown("### Search by Book Title")
+            gr.Markdown("### Search by Book Title or Meaning")
             book_input = gr.Textbox(label="Enter book title...")
+            book_suggestions = gr.Dropdown(label="Suggestions", choices=[], interactive=True)
+            book_mode = gr.Radio(
+                choices=[SEARCH_MODE_TEXT, SEARCH_MODE_SEMANTIC, SEARCH_MODE_HYBRID], value=SEARCH_MODE_TEXT,
+                label="Search mode", info="Semantic finds books by meaning, e.g. 'books for burnout'; Hybrid combines both rankings"
+            )
+            with gr.Accordion("Filters", open=False):
+                gr.Markdown("Counts refresh after each search; search with an empty title to browse by filter.")
+                book_facets = [
+                    gr.Dropdown(label=field, choices=[], multiselect=True, allow_custom_value=True)
+                    for field in FACET_FIELDS["book"]
+                ]
             book_search_btn = gr.Button("🔍 Search Book", variant="primary")
 
             book_key_dropdown = gr.Dropdown(label="Found Book Keys", choices=[], interactive=True)
             book_data_display = gr.Json(label="Book Data")
+            with gr.Row():
+                book_prev_btn = gr.Button("⬅️ Previous")
+                book_page_info = gr.Markdown()
+                book_next_btn = gr.Button("Next ➡️")
+            book_page = gr.State(1)
 
+            book_outputs = [book_key_dropdown, book_data_display, book_page_info, book_page, *book_facets]
             book_search_btn.click(
-                handle_book_search,
+                lambda query, mode, *facets: handle_book_search(query, mode, 1, *facets),
+                inputs=[book_input, book_mode, *book_facets],
+                outputs=book_outputs,
+            )
+            book_prev_btn.click(
+                lambda query, mode, page, *facets: handle_book_search(query, mode, page - 1, *facets),
+                inputs=[book_input, book_mode, book_page, *book_facets],
+                outputs=book_outputs,
+            )
+            book_next_btn.click(
+                lambda query, mode, page, *facets: handle_book_search(query, mode, page + 1, *facets),
+                inputs=[book_input, book_mode, book_page, *book_facets],
+                outputs=book_outputs,
+            )
+
+            # Typeahead: only the latest keystroke's lookup runs once the previous one returns
+            book_input.input(
+                lambda text: handle_suggestions("book", text),
                 inputs=book_input,
-                outputs=[book_key_dropdown, book_data_display],
+                outputs=book_suggestions,
+                trigger_mode="always_last",
+                show_progress="hidden",
+                api_name="suggest_books",
             )
+            book_suggestions.select(lambda title: title, inputs=book_suggestions, outputs=book_input)
 
             book_key_dropdown.change(
                 handle_book_dropdown_change,
@@ -79,16 +197,53 @@ def render_search_data_tab():
         with gr.Tab("🎥 Video"):
             gr.Markdown("### Search by YouTube Title or URL")
             video_input = gr.Textbox(label="Enter YouTube URL or video title...")
+            video_suggestions = gr.Dropdown(label="Suggestions", choices=[], interactive=True)
+            video_mode = gr.Radio(
+                choices=[SEARCH_MODE_TEXT, SEARCH_MODE_SEMANTIC, SEARCH_MODE_HYBRID], value=SEARCH_MODE_TEXT,
+                label="Search mode", info="Semantic finds videos by meaning; Hybrid combines both rankings; URLs are always looked up directly"
+            )
+            with gr.Accordion("Filters", open=False):
+                gr.Markdown("Counts refresh after each search; search with an empty title to browse by filter.")
+                video_facets = [
+                    gr.Dropdown(label=field, choices=[], multiselect=True, allow_custom_value=True)
+                    for field in FACET_FIELDS["video"]
+                ]
             video_search_btn = gr.Button("🔍 Search Video", variant="primary")
 
             video_key_dropdown = gr.Dropdown(label="Found Video Keys", choices=[], interactive=True)
             video_data_display = gr.Json(label="Video Data")
+            with gr.Row():
+                video_prev_btn = gr.Button("⬅️ Previous")
+                video_page_info = gr.Markdown()
+                video_next_btn = gr.Button("Next ➡️")
+            video_page = gr.State(1)
 
+            video_outputs = [video_key_dropdown, video_data_display, video_page_info, video_page, *video_facets]
             video_search_btn.click(
-                handle_video_search,
+                lambda query, mode, *facets: handle_video_search(query, mode, 1, *facets),
+                inputs=[video_input, video_mode, *video_facets],
+                outputs=video_outputs,
+            )
+            video_prev_btn.click(
+                lambda query, mode, page, *facets: handle_video_search(query, mode, page - 1, *facets),
+                inputs=[video_input, video_mode, video_page, *video_facets],
+                outputs=video_outputs,
+            )
+            video_next_btn.click(
+                lambda query, mode, page, *facets: handle_video_search(query, mode, page + 1, *facets),
+                inputs=[video_input, video_mode, video_page, *video_facets],
+                outputs=video_outputs,
+            )
+
+            video_input.input(
+                lambda text: handle_suggestions("video", text),
                 inputs=video_input,
-                outputs=[video_key_dropdown, video_data_display],
+                outputs=video_suggestions,
+                trigger_mode="always_last",
+                show_progress="hidden",
+                api_name="suggest_videos",
             )
+            video_suggestions.select(lambda title: title, inputs=video_suggestions, outputs=video_input)
 
             video_key_dropdown.change(
                 handle_video_dropdown_change,
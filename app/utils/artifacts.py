@@ -0,0 +1,237 @@
+# app/utils/artifacts.py
+# Local ingestion artifacts (processed JSON, final CSVs), written off the request path.
+#
+# ARTIFACT_POLICY:
+#   off     - no local artifacts
+#   async   - same files as before (indented JSON per record, final CSV), written by a background thread
+#   compact - one JSONL file per stream without embeddings, plus embeddings in numbered float32 parts
+
+# Standard library imports
+import os
+import json
+import glob
+import queue
+import atexit
+import threading
+from typing import Any, Callable, Dict, Iterator, List
+
+# Third-party imports
+import numpy as np
+from dotenv import load_dotenv
+
+# App imports
+from app.utils.logger import get_logger
+
+# Logger setup
+logger = get_logger(__name__)
+
+# Load environment variables
+load_dotenv()
+
+# ----------------------------- CONSTANTS ----------------------------- #
+POLICY_OFF = "off"
+POLICY_ASYNC = "async"
+POLICY_COMPACT = "compact"
+ARTIFACT_POLICY = os.getenv("ARTIFACT_POLICY", POLICY_ASYNC).lower()
+if ARTIFACT_POLICY not in (POLICY_OFF, POLICY_ASYNC, POLICY_COMPACT):
+    raise RuntimeError(f"Unsupported ARTIFACT_POLICY: {ARTIFACT_POLICY}")
+
+QUEUE_SIZE = int(os.getenv("ARTIFACT_QUEUE_SIZE", "1000"))
+VECTORS_PER_PART = 4096
+
+_queue: "queue.Queue[tuple]" = queue.Queue(maxsize=QUEUE_SIZE)
+_worker_lock = threading.Lock()
+_worker = None
+# Compact streams, only touched by the writer thread
+_streams: Dict[str, "CompactStream"] = {}
+
+# ----------------------------- COMPACT STREAMS ----------------------------- #
+
+class CompactStream:
+    """
+    Appends records to `<folder>/<name>.jsonl` and their embeddings to raw float32 parts
+    `<name>.NNNNN.f32`. Each JSONL record points at its vector with
+    {"vector_file", "vector_row", "vector_dim"}. Both files stay open for the life of the
+    stream; a record's vector is flushed before its JSONL row is written, so a row never
+    refers to vector data that is not on disk. JSONL rows are flushed by `flush()`.
+    """
+    def __init__(self, folder: str, name: str):
+        os.makedirs(folder, exist_ok=True)
+        self.folder = folder
+        self.name = name
+        self.jsonl_path = os.path.join(folder, f"{name}.jsonl")
+        # Start a new part per process; an interrupted earlier part is left as it is
+        self.part = len(glob.glob(os.path.join(folder, f"{name}.*.f32")))
+        self.rows = 0
+        self.jsonl_file = None
+        self.vector_file = None
+
+    def part_file(self) -> str:
+        return f"{self.name}.{self.part:05d}.f32"
+
+    def _vector_handle(self):
+        if self.rows >= VECTORS_PER_PART:
+            if self.vector_file is not None:
+                self.vector_file.close()
+                self.vector_file = None
+            self.part += 1
+            self.rows = 0
+        if self.vector_file is None:
+            self.vector_file = open(os.path.join(self.folder, self.part_file()), "ab")
+        return self.vector_file
+
+    def append(self, record: dict) -> None:
+        record = dict(record)
+        embedding = record.pop("embedding", None)
+        if embedding is not None:
+            vector = np.asarray(embedding, dtype=np.float32)
+            handle = self._vector_handle()
+            handle.write(vector.tobytes())
+            handle.flush()
+            record["vector_file"] = self.part_file()
+            record["vector_row"] = self.rows
+            record["vector_dim"] = int(vector.shape[0])
+            self.rows += 1
+        if self.jsonl_file is None:
+            self.jsonl_file = open(self.jsonl_path, "a", encoding="utf-8")
+        self.jsonl_file.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+    def flush(self) -> None:
+        if self.jsonl_file is not None:
+            self.jsonl_file.flush()
+
+    def close(self) -> None:
+        for handle in (self.vector_file, self.jsonl_file):
+            if handle is not None:
+                handle.close()
+        self.vector_file = self.jsonl_file = None
+
+def read_compact_stream(folder: str, name: str) -> Iterator[dict]:
+    """
+    Read back the records of a compact stream with their embeddings restored.
+    """
+    jsonl_path = os.path.join(folder, f"{name}.jsonl")
+    if not os.path.exists(jsonl_path):
+        return
+    parts: Dict[str, np.ndarray] = {}
+    with open(jsonl_path, "r", encoding="utf-8") as f:
+        for line in f:
+            record = json.loads(line)
+            vector_file = record.pop("vector_file", None)
+            if vector_file is not None:
+                row, dim = record.pop("vector_row"), record.pop("vector_dim")
+                if vector_file not in parts:
+                    parts[vector_file] = np.fromfile(os.path.join(folder, vector_file), dtype=np.float32)
+                record["embedding"] = parts[vector_file][row * dim:(row + 1) * dim].tolist()
+            yield record
+
+# ----------------------------- WRITER THREAD ----------------------------- #
+
+def _run_worker():
+    while True:
+        task, args = _queue.get()
+        try:
+            task(*args)
+        except Exception as e:
+            logger.error(f"Artifact write failed: {e}")
+        try:
+            # Flush open streams whenever the writer catches up, so flush() callers see every row
+            if _queue.empty():
+                _flush_streams()
+        except Exception as e:
+            logger.error(f"Artifact flush failed: {e}")
+        finally:
+            _queue.task_done()
+
+def submit(task: Callable[..., Any], *args: Any) -> None:
+    """
+    Run `task(*args)` on the background writer thread (blocks only if the queue is full).
+    Tasks run one at a time, in submission order.
+    """
+    global _worker
+    if ARTIFACT_POLICY == POLICY_OFF:
+        return
+    with _worker_lock:
+        if _worker is None:
+            _worker = threading.Thread(target=_run_worker, name="artifact-writer", daemon=True)
+            _worker.start()
+    _queue.put((task, args))
+
+def _write_json(path: str, data: Any, indent: int | None) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=indent, ensure_ascii=False)
+    logger.info(f"Saved artifact: {path}")
+
+def _write_text(path: str, text: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    logger.info(f"Saved artifact: {path}")
+
+def _remove_files(paths: List[str]) -> None:
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+def _append_compact(folder: str, stream: str, record: dict) -> None:
+    key = os.path.join(folder, stream)
+    if key not in _streams:
+        _streams[key] = CompactStream(folder, stream)
+    _streams[key].append(record)
+
+def _flush_streams() -> None:
+    for stream in _streams.values():
+        stream.flush()
+
+def _close_streams() -> None:
+    for stream in _streams.values():
+        stream.close()
+
+# ----------------------------- PUBLIC API ----------------------------- #
+
+def save_record(folder: str, name: str, data: dict, stream: str, indent: int | None = 2) -> None:
+    """
+    Save one processed record according to ARTIFACT_POLICY:
+    async writes `<folder>/<name>.json`, compact appends it to the `stream` JSONL/.f32 files.
+    """
+    if ARTIFACT_POLICY == POLICY_ASYNC:
+        submit(_write_json, os.path.join(folder, f"{name}.json"), data, indent)
+    elif ARTIFACT_POLICY == POLICY_COMPACT:
+        submit(_append_compact, folder, stream, data)
+
+def save_text(folder: str, name: str, text: str) -> None:
+    """
+    Save `<folder>/<name>.txt` in the background (any policy but off).
+    """
+    if ARTIFACT_POLICY != POLICY_OFF:
+        submit(_write_text, os.path.join(folder, f"{name}.txt"), text)
+
+def remove_files(paths: List[str]) -> None:
+    """
+    Remove artifact files. Queued behind pending writes so a file saved just before is removed too.
+    """
+    if ARTIFACT_POLICY == POLICY_OFF:
+        _remove_files(paths)
+    else:
+        submit(_remove_files, list(paths))
+
+def flush(timeout: float | None = None) -> None:
+    """
+    Wait until queued artifacts are written.
+    """
+    if ARTIFACT_POLICY == POLICY_OFF or _worker is None:
+        return
+    if timeout is None:
+        _queue.join()
+        return
+    done = threading.Event()
+    threading.Thread(target=lambda: (_queue.join(), done.set()), daemon=True).start()
+    done.wait(timeout)
+
+def _shutdown() -> None:
+    if _worker is not None:
+        submit(_close_streams)
+    flush(10)
+
+atexit.register(_shutdown)
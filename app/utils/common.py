@@ -1,6 +1,9 @@
 # Standard library imports
+import os
 import re
-from typing import List, Tuple, Any, Optional
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Tuple, Any, Optional
 import numpy as np
 
 # Third-party imports
@@ -8,6 +11,16 @@ import redis.exceptions
 
 # App imports
 from app.utils.redis_manager import redis_client
+from app.utils.vector_store import (
+    VECTOR_FORMAT, JSON_FORMAT, VECTOR_FIELD, encode_vector, vector_index_name, vector_key,
+    get_document, restore_embeddings
+)
+from app.utils.embeddings import get_embedding
+from app.utils.search_cache import cached_search, bump_index_version
+from app.utils.local_vector_index import local_vector_search, local_index_remove
+from app.utils.suggestions import remove_suggestions
+from app.utils.metrics import run_ft_command, timer
+from app.utils.facets import Filters, aggregate_facets, combine_query, filter_clause, filters_cache_key
 from app.utils.logger import get_logger
 
 # Logger setup
@@ -15,9 +28,72 @@ logger = get_logger(__name__)
 
 # ----------------------------- CONSTANTS ----------------------------- #
 FT_SEARCH_CMD = 'FT.SEARCH'
+SEARCH_MODE_TEXT = "Text"
+SEARCH_MODE_SEMANTIC = "Semantic"
+SEMANTIC_TOP_K = 10
+SEARCH_MODE_HYBRID = "Hybrid"
+TEXT_INDEXES = {"book": "book_idx", "video": "video_idx"}
+TEXT_FIELDS = {"book": "book_title", "video": "youtube_title"}
+
+# Hybrid search: reciprocal rank fusion constant, per-source weights, candidates per source
+RRF_K = int(os.getenv("HYBRID_RRF_K", "60"))
+HYBRID_TEXT_WEIGHT = float(os.getenv("HYBRID_TEXT_WEIGHT", "1.0"))
+HYBRID_VECTOR_WEIGHT = float(os.getenv("HYBRID_VECTOR_WEIGHT", "1.0"))
+HYBRID_CANDIDATES = 30
+
+# Pagination: results per Search tab page, keys per cursor read when walking every match
+SEARCH_PAGE_SIZE = int(os.getenv("SEARCH_PAGE_SIZE", "10"))
+CURSOR_BATCH_SIZE = 500
+CURSOR_MAX_IDLE_MS = 300000
+
+# Bulk delete: keys per pipelined check + UNLINK, matched keys listed in progress reports
+DELETE_BATCH_SIZE = int(os.getenv("DELETE_BATCH_SIZE", "500"))
+DELETE_PREVIEW_SIZE = 20
+
+# Runs the text and vector legs of hybrid searches concurrently
+search_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="search")
 
 # ----------------------------- DELETE LOGIC ----------------------------- #
 
+def delete_key_batch(kind: str, keys: List[str], dry_run: bool = False) -> Dict[str, List[str]]:
+    """
+    Delete a batch of documents of `kind` in two round trips: one pipeline checks existence
+    and reads the titles, then a single UNLINK frees the documents and their vector hashes
+    off the Redis main thread. Suggestions, the local vector index and the search cache
+    version are updated once per batch.
+
+    Returns:
+        Dict[str, List[str]]: "deleted" (or, in a dry run, would-be-deleted) and "missing" keys.
+    """
+    if not keys:
+        return {"deleted": [], "missing": []}
+    pipe = redis_client.pipeline(transaction=False)
+    for key in keys:
+        pipe.exists(key)
+    pipe.execute_command('JSON.MGET', *keys, f'$.{TEXT_FIELDS[kind]}')
+    replies = pipe.execute(raise_on_error=False)
+    exists, raw_titles = replies[:-1], replies[-1]
+    if isinstance(raw_titles, Exception):
+        raw_titles = [None] * len(keys)
+
+    deleted, missing, titles = [], [], []
+    for key, found, raw_title in zip(keys, exists, raw_titles):
+        if isinstance(found, Exception) or not found:
+            missing.append(key)
+            continue
+        deleted.append(key)
+        if raw_title:
+            titles.extend(json.loads(raw_title))
+    if dry_run or not deleted:
+        return {"deleted": deleted, "missing": missing}
+
+    redis_client.unlink(*deleted, *[vector_key(key) for key in deleted])
+    version = bump_index_version(TEXT_INDEXES[kind])
+    local_index_remove(kind, deleted, version)
+    remove_suggestions(kind, titles)
+    logger.info(f"✅ Unlinked {len(deleted)} {kind} keys")
+    return {"deleted": deleted, "missing": missing}
+
 def delete_multiple_keys(keys: str, expected_prefix: str) -> str:
     """
     Delete multiple Redis keys. Validates each key and returns status messages.
@@ -33,21 +109,99 @@ def delete_multiple_keys(keys: str, expected_prefix: str) -> str:
     if not key_list:
         return "⚠️ No keys provided."
 
-    messages = []
-    for key in key_list:
+    kind = expected_prefix.rstrip(":")
+    messages = {}
+    valid = []
+    for key in dict.fromkeys(key_list):
         if not key.startswith(expected_prefix):
-            messages.append(f"❌ '{key}': Key must start with `{expected_prefix}`")
-            continue
+            messages[key] = f"❌ '{key}': Key must start with `{expected_prefix}`"
+        else:
+            valid.append(key)
 
-        if not redis_client.exists(key):
-            messages.append(f"⚠️ '{key}': Key does not exist.")
-            continue
+    for i in range(0, len(valid), DELETE_BATCH_SIZE):
+        result = delete_key_batch(kind, valid[i:i + DELETE_BATCH_SIZE])
+        for key in result["missing"]:
+            messages[key] = f"⚠️ '{key}': Key does not exist."
+        for key in result["deleted"]:
+            messages[key] = f"✅ '{key}': Successfully deleted."
+    return "\n".join(messages[key] for key in dict.fromkeys(key_list))
+
+def iter_pattern_key_batches(kind: str, pattern: str, batch_size: int = DELETE_BATCH_SIZE) -> Iterator[List[str]]:
+    """
+    Batches of document keys matching a glob pattern (e.g. 'video:abc*'), from SCAN.
+    The pattern must start with the document prefix of `kind`.
+    """
+    prefix = f"{kind}:"
+    if not pattern.startswith(prefix):
+        raise ValueError(f"Pattern must start with `{prefix}`")
+    batch = []
+    for key in redis_client.scan_iter(match=pattern, count=batch_size):
+        batch.append(key)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def iter_query_key_batches(kind: str, query: str = "", filters: Optional[Filters] = None,
+                           batch_size: int = DELETE_BATCH_SIZE) -> Iterator[List[str]]:
+    """
+    Batches of document keys matching a title query and/or facet filters, from an FT.AGGREGATE cursor.
+    """
+    batch = []
+    for key in iter_search_keys(kind, query, batch_size, filters):
+        batch.append(key)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
 
-        redis_client.delete(key)
-        logger.info(f"✅ Deleted Redis key: {key}")
-        messages.append(f"✅ '{key}': Successfully deleted.")
+def bulk_delete(kind: str, query: str = "", pattern: str = "", filters: Optional[Filters] = None,
+                dry_run: bool = True, batch_size: int = DELETE_BATCH_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Delete every document of `kind` matched by a key pattern, or by a title query and/or facet
+    filters, one pipelined batch at a time. Yields a progress report after each batch and a
+    final report. Dry runs (the default) only count and preview the matches.
+
+    Args:
+        kind (str): 'book' or 'video'.
+        query (str): Title query (ignored when a pattern is given).
+        pattern (str): Key glob, e.g. 'video:abc*'.
+        filters (dict): Facet filters, e.g. {"activityType": ["Yoga"]}.
+        dry_run (bool): Report what would be deleted without deleting.
+        batch_size (int): Keys per batch.
 
-    return "\n".join(messages)
+    Yields:
+        dict: status, dry_run, batches, matched, deleted, missing and a preview of matched keys.
+    """
+    report = {"status": "running", "dry_run": dry_run, "batches": 0, "matched": 0,
+              "deleted": 0, "missing": 0, "preview": []}
+    if not pattern and not filter_search_term(query) and not filter_clause(kind, filters):
+        yield {"error": "❌ Provide a key pattern, a title query or a filter to select what to delete."}
+        return
+    try:
+        if pattern:
+            batches = iter_pattern_key_batches(kind, pattern.strip(), batch_size)
+        else:
+            batches = iter_query_key_batches(kind, query, filters, batch_size)
+        for batch in batches:
+            result = delete_key_batch(kind, batch, dry_run)
+            report["batches"] += 1
+            report["matched"] += len(batch)
+            report["missing"] += len(result["missing"])
+            if not dry_run:
+                report["deleted"] += len(result["deleted"])
+            preview_room = DELETE_PREVIEW_SIZE - len(report["preview"])
+            report["preview"].extend(result["deleted"][:max(preview_room, 0)])
+            logger.info(f"Bulk delete {kind} batch {report['batches']}: {len(result['deleted'])} keys (dry run: {dry_run})")
+            yield dict(report)
+    except Exception as e:
+        logger.error(f"Bulk delete of {kind} failed: {e}")
+        yield {**report, "status": "failed", "error": f"❌ Bulk delete failed: {e}"}
+        return
+    report["status"] = "done"
+    yield report
 
 # ----------------------------- UTILITY ----------------------------- #
 
@@ -63,51 +217,182 @@ def escape_query_string(text: str) -> str:
     """
     return re.sub(r'([@!{}()\[\]\|><"~*:\\])', r'\\\1', text)
 
+def fetch_documents(keys: List[str]) -> List[Optional[dict]]:
+    """
+    Fetch several JSON documents in one round trip (JSON.MGET), with binary-stored
+    embeddings restored.
+
+    Returns:
+        List[Optional[dict]]: Documents aligned with `keys`; None for missing keys.
+    """
+    if not keys:
+        return []
+    results = redis_client.json().mget(keys, "$")
+    return restore_embeddings(keys, [result[0] if result else None for result in results])
+
 def filter_search_term(term: str) -> str:
     """
     Remove special characters and extra whitespace from search term for robust RediSearch matching.
     """
     return re.sub(r'[^a-zA-Z0-9 ]', '', term).strip().lower()
 
+# ----------------------------- PAGINATION ----------------------------- #
+
+def page_offset(page: int, page_size: int = SEARCH_PAGE_SIZE) -> int:
+    """
+    Zero-based result offset of a 1-based page number.
+    """
+    return (max(int(page), 1) - 1) * page_size
+
+def page_count(total: int, page_size: int = SEARCH_PAGE_SIZE) -> int:
+    """
+    Number of pages needed for `total` results (at least one, so an empty result still has a page).
+    """
+    return max(1, -(-int(total) // page_size))
+
+def title_search_query(kind: str, query: str, filters: Optional[Filters] = None) -> str:
+    """
+    Build the RediSearch title query for `kind`, intersected with any facet filters.
+    An empty query without filters matches every document.
+    """
+    query_str = escape_query_string(filter_search_term(query))
+    text_query = f'@{TEXT_FIELDS[kind]}:{query_str}' if query_str else ''
+    return combine_query(text_query, filter_clause(kind, filters))
+
+def search_title_page(kind: str, query: str, offset: int = 0, limit: int = SEARCH_PAGE_SIZE,
+                      filters: Optional[Filters] = None) -> Tuple[List[str], List[Any], int]:
+    """
+    Run one FT.SEARCH page over the title field of `kind` (narrowed by facet filters)
+    and fetch the matching documents.
+
+    Returns:
+        Tuple[List[str], List[Any], int]: Keys and documents of the page, and the total number of matches.
+    """
+    with timer(f"search.{kind}.text.escape"):
+        search_query = title_search_query(kind, query, filters)
+    args = [
+        TEXT_INDEXES[kind],
+        search_query,
+        'NOCONTENT',
+        'LIMIT', str(offset), str(limit),
+    ]
+    logger.info(f"FT.SEARCH args: {args}")
+    res = run_ft_command(f"search.{kind}.text.query", FT_SEARCH_CMD, args)
+    logger.debug(f"FT.SEARCH raw response: {res}")
+    if not res:
+        return [], [], 0
+    keys = []
+    data = []
+    hit_keys = list(res[1:])
+    # Fetch full JSON for all keys in one round trip
+    with timer(f"search.{kind}.text.fetch"):
+        documents = fetch_documents(hit_keys)
+    for key, full_data in zip(hit_keys, documents):
+        if full_data:
+            keys.append(key)
+            data.append(full_data)
+    return keys, data, int(res[0])
+
+def iter_search_keys(kind: str, query: str = "", batch_size: int = CURSOR_BATCH_SIZE,
+                     filters: Optional[Filters] = None) -> Iterator[str]:
+    """
+    Walk every key matching a title query (every document when `query` is empty).
+
+    Streams the result set through an FT.AGGREGATE cursor, `batch_size` keys per read, so scripts
+    can visit all matches without offset paging or holding the whole result in memory.
+    The cursor is released if the caller stops iterating early.
+
+    Args:
+        kind (str): 'book' or 'video'.
+        query (str): Title query; empty for all documents.
+        batch_size (int): Keys per cursor read.
+        filters (dict): Optional facet filters, e.g. {"activityType": ["Yoga"]}.
+
+    Yields:
+        str: Matching Redis keys.
+    """
+    index = TEXT_INDEXES[kind]
+    res, cursor = redis_client.execute_command(
+        'FT.AGGREGATE', index, title_search_query(kind, query, filters),
+        'LOAD', '1', '@__key',
+        'WITHCURSOR', 'COUNT', str(batch_size), 'MAXIDLE', str(CURSOR_MAX_IDLE_MS),
+    )
+    try:
+        while True:
+            for fields in res[1:]:
+                values = dict(zip(fields[::2], fields[1::2]))
+                if values.get("__key"):
+                    yield values["__key"]
+            if not cursor:
+                break
+            res, cursor = redis_client.execute_command('FT.CURSOR', 'READ', index, cursor)
+    finally:
+        if cursor:
+            try:
+                redis_client.execute_command('FT.CURSOR', 'DEL', index, cursor)
+            except redis.exceptions.ResponseError as e:
+                logger.warning(f"Could not release search cursor {cursor} on {index}: {e}")
+
+def iter_search_documents(kind: str, query: str = "", batch_size: int = CURSOR_BATCH_SIZE,
+                          filters: Optional[Filters] = None) -> Iterator[Tuple[str, dict]]:
+    """
+    Walk every (key, document) pair matching a title query, fetching documents one batch per JSON.MGET.
+    """
+    batch = []
+    for key in iter_search_keys(kind, query, batch_size, filters):
+        batch.append(key)
+        if len(batch) >= batch_size:
+            yield from ((k, doc) for k, doc in zip(batch, fetch_documents(batch)) if doc)
+            batch = []
+    yield from ((k, doc) for k, doc in zip(batch, fetch_documents(batch)) if doc)
+
 # ----------------------------- BOOK SEARCH ----------------------------- #
 
 def search_book_by_title(title_query: str) -> Tuple[List[str], List[Any]]:
     """
     Search books by title using RediSearch text search (case/punctuation-insensitive).
+    Returns the first page of results; see search_books_page for the others.
 
     Returns empty lists with message if no results found.
     """
+    keys, data, _ = search_books_page(title_query)
+    return keys, data
+
+def search_books_page(title_query: str, page: int = 1, page_size: int = SEARCH_PAGE_SIZE,
+                      filters: Optional[Filters] = None) -> Tuple[List[str], List[Any], int]:
+    """
+    One page of book title search results plus the total number of matches.
+    Results are served from the search cache until the book index changes.
+
+    Args:
+        title_query (str): Book title to search for (may be empty when filtering).
+        page (int): 1-based page number.
+        page_size (int): Results per page.
+        filters (dict): Optional facet filters, e.g. {"difficulty": ["Beginner"]}.
+
+    Returns:
+        Tuple[List[str], List[Any], int]: Keys, documents (or a message) and total matches.
+    """
+    offset = page_offset(page, page_size)
+    mode = f"{SEARCH_MODE_TEXT}:{offset}:{page_size}:{filters_cache_key('book', filters)}"
+    with timer("search.book.text.total"):
+        return cached_search(TEXT_INDEXES["book"], mode, title_query,
+                             lambda: _search_book_by_title(title_query, offset, page_size, filters))
+
+def _search_book_by_title(title_query: str, offset: int = 0, limit: int = SEARCH_PAGE_SIZE,
+                          filters: Optional[Filters] = None) -> Tuple[List[str], List[Any], int]:
     try:
-        # Filter and normalize query for RediSearch
-        filtered_query = filter_search_term(title_query)
-        query_str = escape_query_string(filtered_query)
-        # Use fuzzy or prefix search if desired, e.g. '%query%'
-        search_query = f'@book_title:{query_str}'
-        args = [
-            'book_idx',
-            search_query,
-            'RETURN', '2', '__key__', 'book_title',
-            'LIMIT', '0', '10',
-        ]
-        logger.info(f"FT.SEARCH args: {args}")
-        res = redis_client.execute_command(FT_SEARCH_CMD, *args)
-        logger.info(f"FT.SEARCH raw response: {res}")
-        if not res or len(res) < 2:
-            logger.info(f"No book results found for query: {title_query}")
-            return [], [{"message": f"❌ No book results found for: '{title_query}'"}]
-        keys = []
-        data = []
-        for i in range(1, len(res), 2):
-            key = res[i]
-            full_data = redis_client.json().get(key)
-            if full_data:
-                keys.append(key)
-                data.append(full_data)
-        logger.info(f"Found {len(keys)} book results for query: {title_query}")
-        return keys, data
+        if not filter_search_term(title_query) and not filter_clause("book", filters):
+            return [], [{"message": "❌ Please enter a book title or choose a filter."}], 0
+        keys, data, total = search_title_page("book", title_query, offset, limit, filters)
+        if not keys:
+            logger.info(f"No book results found for query: {title_query} (offset {offset})")
+            return [], [{"message": f"❌ No book results found for: '{title_query}'"}], total
+        logger.info(f"Found {len(keys)} of {total} book results for query: {title_query}")
+        return keys, data, total
     except Exception as e:
         logger.error(f"RediSearch error: {e}")
-        return [], [{"message": f"❌ Error searching books with RediSearch: {e}"}]
+        return [], [{"message": f"❌ Error searching books with RediSearch: {e}"}], 0
 
 # ----------------------------- VIDEO SEARCH ----------------------------- #
 
@@ -127,46 +412,260 @@ def extract_video_id(url_or_text: str) -> Optional[str]:
 def search_video_by_title_or_url(input_text: str) -> Tuple[List[str], List[Any]]:
     """
     Search videos by URL (direct key lookup) or RediSearch text search by title.
+    Returns the first page of results; see search_videos_page for the others.
 
     Returns empty list with message if nothing found.
     """
+    keys, data, _ = search_videos_page(input_text)
+    return keys, data
+
+def search_videos_page(input_text: str, page: int = 1, page_size: int = SEARCH_PAGE_SIZE,
+                       filters: Optional[Filters] = None) -> Tuple[List[str], List[Any], int]:
+    """
+    One page of video search results plus the total number of matches (1 for a URL lookup).
+    Results are served from the search cache until the video index changes.
+
+    Args:
+        input_text (str): YouTube URL or title (may be empty when filtering).
+        page (int): 1-based page number.
+        page_size (int): Results per page.
+        filters (dict): Optional facet filters, ignored for URL lookups.
+
+    Returns:
+        Tuple[List[str], List[Any], int]: Keys, documents (or a message) and total matches.
+    """
+    offset = page_offset(page, page_size)
+    mode = f"{SEARCH_MODE_TEXT}:{offset}:{page_size}:{filters_cache_key('video', filters)}"
+    with timer("search.video.text.total"):
+        return cached_search(TEXT_INDEXES["video"], mode, input_text,
+                             lambda: _search_video_by_title_or_url(input_text, offset, page_size, filters))
+
+def _search_video_by_title_or_url(input_text: str, offset: int = 0, limit: int = SEARCH_PAGE_SIZE,
+                                  filters: Optional[Filters] = None) -> Tuple[List[str], List[Any], int]:
     video_id = extract_video_id(input_text)
     if video_id:
         key = f"video:{video_id}"
         try:
-            data = redis_client.json().get(key)
+            data = get_document(key)
             if data:
-                return [key], [data]
+                return [key], [data], 1
         except redis.exceptions.ResponseError as e:
             logger.error(f"Error fetching video key {key}: {e}")
-        return [], [{"message": f"❌ No related video found for ID: '{video_id}'"}]
+        return [], [{"message": f"❌ No related video found for ID: '{video_id}'"}], 0
+    try:
+        if not filter_search_term(input_text) and not filter_clause("video", filters):
+            return [], [{"message": "❌ Please enter a video title or URL, or choose a filter."}], 0
+        keys, data, total = search_title_page("video", input_text, offset, limit, filters)
+        if not keys:
+            return [], [{"message": f"❌ No video results found for: '{input_text}'"}], total
+        return keys, data, total
+    except Exception as e:
+        logger.error(f"RediSearch error: {e}")
+        return [], [{"message": f"❌ Error searching videos with RediSearch: {e}"}], 0
+
+# ----------------------------- SEMANTIC SEARCH ----------------------------- #
+
+def vector_search(kind: str, vector: List[float], k: int = SEMANTIC_TOP_K,
+                  filters: Optional[Filters] = None) -> List[Tuple[str, float]]:
+    """
+    Run a RediSearch KNN query against the stored embeddings of `kind` ('book' or 'video').
+
+    Uses the vector field of the JSON index for the json storage format, or the companion
+    vector index for binary formats (whose keys are mapped back to document keys).
+    Facet filters become a KNN pre-filter, so the k neighbours all match them.
+    Unfiltered queries are answered by the in-process index when LOCAL_VECTOR_INDEX is enabled.
+
+    Returns:
+        List[Tuple[str, float]]: (document key, cosine similarity), best first.
+    """
+    if not filter_clause(kind, filters):
+        with timer(f"search.{kind}.knn_local"):
+            local_hits = local_vector_search(kind, vector, k)
+        if local_hits is not None:
+            return local_hits
+    binary = VECTOR_FORMAT != JSON_FORMAT
+    index = vector_index_name(kind) if binary else TEXT_INDEXES[kind]
+    blob = encode_vector(vector, VECTOR_FORMAT if binary else "float32")
+    prefilter = filter_clause(kind, filters)
+    args = [
+        index,
+        f'({prefilter or "*"})=>[KNN {k} @{VECTOR_FIELD} $vec AS vector_score]',
+        'PARAMS', '2', 'vec', blob,
+        'SORTBY', 'vector_score',
+        'RETURN', '1', 'vector_score',
+        'LIMIT', '0', str(k),
+        'DIALECT', '2',
+    ]
+    res = run_ft_command(f"search.{kind}.knn", FT_SEARCH_CMD, args)
+    hits = []
+    for i in range(1, len(res or []), 2):
+        key, fields = res[i], res[i + 1]
+        values = dict(zip(fields[::2], fields[1::2]))
+        if binary:
+            key = key[len(vector_key("")):]
+        # Cosine distance -> similarity
+        hits.append((key, round(1 - float(values.get("vector_score", 1)), 4)))
+    return hits
+
+def semantic_search(kind: str, query: str, k: int = SEMANTIC_TOP_K,
+                    filters: Optional[Filters] = None) -> Tuple[List[str], List[Any]]:
+    """
+    Embed the query and return the `k` most similar documents of `kind` matching the facet
+    filters, each with a `similarity_score` field. Returns empty keys with a message if nothing found.
+    Results are served from the search cache until the index changes.
+    """
+    mode = f"{SEARCH_MODE_SEMANTIC}:{k}:{filters_cache_key(kind, filters)}"
+    with timer(f"search.{kind}.semantic.total"):
+        return cached_search(TEXT_INDEXES[kind], mode, query,
+                             lambda: _semantic_search(kind, query, k, filters))
+
+def _semantic_search(kind: str, query: str, k: int, filters: Optional[Filters] = None) -> Tuple[List[str], List[Any]]:
+    label = "book" if kind == "book" else "video"
     try:
-        filtered_query = filter_search_term(input_text)
-        query_str = escape_query_string(filtered_query)
-        search_query = f'@youtube_title:{query_str}'
-        args = [
-            'video_idx',
-            search_query,
-            'RETURN', '2', '__key__', 'youtube_title',
-            'LIMIT', '0', '10',
-        ]
-        logger.info(f"FT.SEARCH args: {args}")
-        res = redis_client.execute_command(FT_SEARCH_CMD, *args)
-        logger.info(f"FT.SEARCH raw response: {res}")
-        if not res or len(res) < 2:
-            return [], [{"message": f"❌ No video results found for: '{input_text}'"}]
+        with timer(f"search.{kind}.semantic.embed"):
+            vector = get_embedding(query)
+        if vector is None:
+            return [], [{"message": f"❌ Could not embed search query: '{query}'"}]
+        hits = vector_search(kind, vector, k, filters)
         keys = []
         data = []
-        for i in range(1, len(res), 2):
-            key = res[i]
-            # Fetch full JSON for each key
-            full_data = redis_client.json().get(key)
+        with timer(f"search.{kind}.semantic.fetch"):
+            documents = fetch_documents([key for key, _ in hits])
+        for (key, score), full_data in zip(hits, documents):
             if full_data:
+                full_data["similarity_score"] = score
                 keys.append(key)
                 data.append(full_data)
+        if not keys:
+            return [], [{"message": f"❌ No {label} results found for: '{query}'"}]
+        logger.info(f"Found {len(keys)} semantic {label} results for query: {query}")
         return keys, data
     except Exception as e:
-        logger.error(f"RediSearch error: {e}")
-        return [], [{"message": f"❌ Error searching videos with RediSearch: {e}"}]
+        logger.error(f"RediSearch KNN error: {e}")
+        return [], [{"message": f"❌ Error in semantic {label} search: {e}"}]
+
+def semantic_search_books(query: str, k: int = SEMANTIC_TOP_K,
+                          filters: Optional[Filters] = None) -> Tuple[List[str], List[Any]]:
+    """
+    Semantic book search: KNN over book embeddings.
+    """
+    return semantic_search("book", query, k, filters)
+
+def semantic_search_videos(input_text: str, k: int = SEMANTIC_TOP_K,
+                           filters: Optional[Filters] = None) -> Tuple[List[str], List[Any]]:
+    """
+    Semantic video search: a YouTube URL is still a direct key lookup, anything else is a KNN query.
+    """
+    if extract_video_id(input_text):
+        return search_video_by_title_or_url(input_text)
+    return semantic_search("video", input_text, k, filters)
+
+# ----------------------------- HYBRID SEARCH ----------------------------- #
+
+def text_search_keys(kind: str, query: str, limit: int = HYBRID_CANDIDATES,
+                     filters: Optional[Filters] = None) -> List[str]:
+    """
+    Title text search for `kind` (narrowed by facet filters) returning only document keys, best match first.
+    """
+    if not filter_search_term(query):
+        return []
+    args = [
+        TEXT_INDEXES[kind],
+        title_search_query(kind, query, filters),
+        'NOCONTENT',
+        'LIMIT', '0', str(limit),
+    ]
+    res = run_ft_command(f"search.{kind}.hybrid.text", FT_SEARCH_CMD, args)
+    return list(res[1:]) if res else []
+
+def fuse_rankings(rankings: List[List[str]], weights: List[float], k: int = RRF_K) -> List[Tuple[str, float, List[Optional[int]]]]:
+    """
+    Weighted reciprocal rank fusion: score(d) = sum_i w_i / (k + rank_i(d)), with 1-based ranks.
+    Documents missing from a ranking get no contribution from it.
+
+    Returns:
+        List of (key, fused score, per-source rank or None), best first.
+    """
+    keys = list(dict.fromkeys(key for ranking in rankings for key in ranking))
+    if not keys:
+        return []
+    position = {key: i for i, key in enumerate(keys)}
+    ranks = np.full((len(rankings), len(keys)), np.inf)
+    for source, ranking in enumerate(rankings):
+        for rank, key in enumerate(ranking, start=1):
+            ranks[source, position[key]] = min(ranks[source, position[key]], rank)
+    scores = (np.asarray(weights, dtype=float)[:, None] / (k + ranks)).sum(axis=0)
+    order = np.argsort(-scores, kind="stable")
+    return [
+        (keys[i], float(scores[i]), [int(r) if np.isfinite(r) else None for r in ranks[:, i]])
+        for i in order
+    ]
+
+def hybrid_search(kind: str, query: str, k: int = SEMANTIC_TOP_K,
+                  text_weight: float = HYBRID_TEXT_WEIGHT, vector_weight: float = HYBRID_VECTOR_WEIGHT,
+                  filters: Optional[Filters] = None) -> Tuple[List[str], List[Any]]:
+    """
+    Hybrid lexical + vector search for `kind`: the title text query and the KNN query run
+    concurrently and their rankings are fused with weighted RRF. Each returned document carries
+    `hybrid_scores` (fused score, text rank, vector rank, vector similarity) for debugging.
+    Facet filters are applied inside both queries. Results are served from the search cache until the index changes.
+    """
+    mode = f"{SEARCH_MODE_HYBRID}:{k}:{text_weight}:{vector_weight}:{filters_cache_key(kind, filters)}"
+    with timer(f"search.{kind}.hybrid.total"):
+        return cached_search(TEXT_INDEXES[kind], mode, query,
+                             lambda: _hybrid_search(kind, query, k, text_weight, vector_weight, filters))
 
+def _hybrid_search(kind: str, query: str, k: int, text_weight: float, vector_weight: float,
+                   filters: Optional[Filters] = None) -> Tuple[List[str], List[Any]]:
+    label = "book" if kind == "book" else "video"
+    try:
+        text_future = search_executor.submit(text_search_keys, kind, query, HYBRID_CANDIDATES, filters)
+        with timer(f"search.{kind}.hybrid.embed"):
+            vector = get_embedding(query)
+        vector_hits = vector_search(kind, vector, HYBRID_CANDIDATES, filters) if vector is not None else []
+        text_keys = text_future.result()
+        similarity: Dict[str, float] = dict(vector_hits)
+        with timer(f"search.{kind}.hybrid.fuse"):
+            fused = fuse_rankings([text_keys, [key for key, _ in vector_hits]], [text_weight, vector_weight])
+
+        keys = []
+        data = []
+        top = fused[:k]
+        with timer(f"search.{kind}.hybrid.fetch"):
+            documents = fetch_documents([key for key, _, _ in top])
+        for (key, score, (text_rank, vector_rank)), full_data in zip(top, documents):
+            if full_data:
+                full_data["hybrid_scores"] = {
+                    "rrf": round(score, 6),
+                    "text_rank": text_rank,
+                    "vector_rank": vector_rank,
+                    "vector_similarity": similarity.get(key),
+                }
+                keys.append(key)
+                data.append(full_data)
+        if not keys:
+            return [], [{"message": f"❌ No {label} results found for: '{query}'"}]
+        logger.info(f"Found {len(keys)} hybrid {label} results for query: {query}")
+        return keys, data
+    except Exception as e:
+        logger.error(f"Hybrid search error: {e}")
+        return [], [{"message": f"❌ Error in hybrid {label} search: {e}"}]
+
+# ----------------------------- FACETS ----------------------------- #
+
+def facet_counts(kind: str, query: str = "", filters: Optional[Filters] = None,
+                 fields: Optional[List[str]] = None) -> Dict[str, List[Tuple[str, int]]]:
+    """
+    Count the documents of `kind` matching a title query and facet filters per facet value,
+    e.g. how many videos per activityType match 'morning'. Counting runs in RediSearch
+    (FT.AGGREGATE GROUPBY), so no documents are fetched.
 
+    Returns:
+        Dict[str, List[Tuple[str, int]]]: Field -> (value, count), most frequent first.
+    """
+    try:
+        with timer(f"search.{kind}.facets"):
+            return aggregate_facets(TEXT_INDEXES[kind], kind, title_search_query(kind, query, filters), fields)
+    except Exception as e:
+        logger.error(f"Facet count error for {kind}: {e}")
+        return {}
@@ -0,0 +1,166 @@
+# Standard library imports
+import os
+import hashlib
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+# Third-party imports
+import numpy as np
+from dotenv import load_dotenv
+
+# App imports
+from app.utils.redis_manager import redis_binary_client
+from app.utils.logger import get_logger
+
+# Logger setup
+logger = get_logger(__name__)
+
+# Load environment variables
+load_dotenv()
+
+# ----------------------------- CONSTANTS ----------------------------- #
+LOCAL_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_LOCAL_SIZE", "10000"))
+REDIS_CACHE_TTL = int(os.getenv("EMBEDDING_CACHE_TTL", str(30 * 24 * 60 * 60)))  # 30 days
+REDIS_CACHE_MAX_ENTRIES = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "200000"))
+REDIS_CACHE_ENABLED = os.getenv("EMBEDDING_CACHE_REDIS", "true").lower() == "true"
+
+CACHE_KEY_PREFIX = "emb:"
+# Sorted set of cache keys scored by last write time, used for size-based eviction
+CACHE_INDEX_KEY = "emb_cache:index"
+
+_local_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+_lock = threading.Lock()
+_stats = {"local_hits": 0, "redis_hits": 0, "misses": 0}
+
+# ----------------------------- HELPERS ----------------------------- #
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text before hashing: Unicode NFC and collapsed whitespace.
+    Case is preserved because it can change the embedding.
+    """
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+def cache_key(model: str, text: str) -> str:
+    """
+    Content-addressed cache key: hash of model name plus normalized text.
+    """
+    digest = hashlib.sha256(f"{model}\0{normalize_text(text)}".encode("utf-8")).hexdigest()
+    return f"{CACHE_KEY_PREFIX}{digest}"
+
+def _count(stat: str, n: int = 1) -> None:
+    with _lock:
+        _stats[stat] += n
+
+def _local_get(key: str) -> Optional[List[float]]:
+    with _lock:
+        vector = _local_cache.get(key)
+        if vector is not None:
+            _local_cache.move_to_end(key)
+        return vector
+
+def _local_put(key: str, vector: List[float]) -> None:
+    with _lock:
+        _local_cache[key] = vector
+        _local_cache.move_to_end(key)
+        while len(_local_cache) > LOCAL_CACHE_SIZE:
+            _local_cache.popitem(last=False)
+
+def _redis_get_many(keys: List[str]) -> Dict[str, List[float]]:
+    if not REDIS_CACHE_ENABLED or not keys:
+        return {}
+    try:
+        blobs = redis_binary_client.mget(keys)
+    except Exception as e:
+        logger.warning(f"Embedding cache read failed: {e}")
+        return {}
+    return {
+        key: np.frombuffer(blob, dtype=np.float32).tolist()
+        for key, blob in zip(keys, blobs) if blob
+    }
+
+def _redis_put_many(vectors: Dict[str, List[float]]) -> None:
+    if not REDIS_CACHE_ENABLED or not vectors:
+        return
+    try:
+        now = time.time()
+        pipe = redis_binary_client.pipeline(transaction=False)
+        for key, vector in vectors.items():
+            pipe.set(key, np.asarray(vector, dtype=np.float32).tobytes(), ex=REDIS_CACHE_TTL)
+        pipe.zadd(CACHE_INDEX_KEY, {key: now for key in vectors})
+        # Forget index entries whose TTL has already expired
+        pipe.zremrangebyscore(CACHE_INDEX_KEY, "-inf", now - REDIS_CACHE_TTL)
+        pipe.zcard(CACHE_INDEX_KEY)
+        size = pipe.execute()[-1]
+        if size > REDIS_CACHE_MAX_ENTRIES:
+            evicted = [key for key, _ in redis_binary_client.zpopmin(CACHE_INDEX_KEY, size - REDIS_CACHE_MAX_ENTRIES)]
+            if evicted:
+                redis_binary_client.unlink(*evicted)
+                logger.info(f"Embedding cache evicted {len(evicted)} oldest entries")
+    except Exception as e:
+        logger.warning(f"Embedding cache write failed: {e}")
+
+# ----------------------------- PUBLIC API ----------------------------- #
+
+def get_cached_embeddings(
+    texts: List[str],
+    model: str,
+    compute: Callable[[List[str]], List[Optional[List[float]]]],
+) -> List[Optional[List[float]]]:
+    """
+    Return embeddings for `texts`, looking in the local LRU, then Redis, then calling `compute`.
+    `compute` receives only the uncached unique texts and must return a list aligned with them
+    (None for failures). Failed vectors are not cached.
+    """
+    keys = [cache_key(model, text) for text in texts]
+    found: Dict[str, List[float]] = {}
+    for key in set(keys):
+        vector = _local_get(key)
+        if vector is not None:
+            found[key] = vector
+    _count("local_hits", len(found))
+
+    remote_keys = [key for key in dict.fromkeys(keys) if key not in found]
+    remote = _redis_get_many(remote_keys)
+    for key, vector in remote.items():
+        _local_put(key, vector)
+    found.update(remote)
+    _count("redis_hits", len(remote))
+
+    missing = {}
+    for key, text in zip(keys, texts):
+        if key not in found and key not in missing:
+            missing[key] = text
+    if missing:
+        _count("misses", len(missing))
+        computed = compute(list(missing.values()))
+        fresh = {key: vector for key, vector in zip(missing, computed) if vector is not None}
+        for key, vector in fresh.items():
+            _local_put(key, vector)
+        _redis_put_many(fresh)
+        found.update(fresh)
+    return [found.get(key) for key in keys]
+
+def get_cached_embedding(
+    text: str,
+    model: str,
+    compute: Callable[[str], Optional[List[float]]],
+) -> Optional[List[float]]:
+    """
+    Single-text variant of `get_cached_embeddings`.
+    """
+    return get_cached_embeddings([text], model, lambda missing: [compute(missing[0])])[0]
+
+def get_cache_stats() -> Dict[str, float]:
+    """
+    Return hit/miss counters and the overall hit ratio.
+    """
+    with _lock:
+        stats = dict(_stats)
+        stats["local_size"] = len(_local_cache)
+    lookups = stats["local_hits"] + stats["redis_hits"] + stats["misses"]
+    stats["hit_ratio"] = round((stats["local_hits"] + stats["redis_hits"]) / lookups, 4) if lookups else 0.0
+    return stats
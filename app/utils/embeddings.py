@@ -0,0 +1,82 @@
+# app/utils/embeddings.py
+# DeepInfra embedding calls shared by book/video ingestion and query-time search.
+# All calls go through the shared rate limiter and the content-addressed embedding cache.
+
+# Standard library imports
+from typing import List
+
+# Third-party imports
+import requests
+
+# App imports
+from app.utils.logger import get_logger
+from app.utils.metrics import timed
+from app.utils.keyvault_loader import DEEPINFRA_TOKEN
+from app.utils.rate_limiter import deepinfra_limiter
+from app.utils.embedding_cache import get_cached_embedding, get_cached_embeddings
+
+# Logger setup
+logger = get_logger(__name__)
+
+# ----------------------------- CONSTANTS ----------------------------- #
+EMBEDDING_MODEL = "BAAI/bge-base-en-v1.5"
+EMBEDDING_URL = "https://api.deepinfra.com/v1/openai/embeddings"
+HEADERS = {"Authorization": f"Bearer {DEEPINFRA_TOKEN}"}
+
+def get_embedding(text: str) -> List[float] | None:
+    """
+    Get embedding for the given text, served from the shared embedding cache when possible.
+    """
+    return get_cached_embedding(text, EMBEDDING_MODEL, request_embedding)
+
+def get_embeddings(texts: List[str]) -> List[List[float] | None]:
+    """
+    Get embeddings for several texts; only uncached texts are sent to DeepInfra, in one request.
+    Returns a list aligned with `texts`; entries are None where no vector came back.
+    """
+    return get_cached_embeddings(texts, EMBEDDING_MODEL, request_embeddings)
+
+@timed("embed.request")
+def request_embedding(text: str) -> List[float] | None:
+    """
+    Get embedding for the given text using DeepInfra API. Logs errors if any.
+    """
+    try:
+        deepinfra_limiter.acquire()
+        resp = requests.post(
+            EMBEDDING_URL,
+            headers=HEADERS,
+            json={"model": EMBEDDING_MODEL, "input": [text]}
+        )
+        resp.raise_for_status()
+        return resp.json()["data"][0]["embedding"]
+    except Exception as e:
+        logger.error(f"Embedding error: {e}")
+        return None
+
+@timed("embed.request_batch")
+def request_embeddings(texts: List[str]) -> List[List[float] | None]:
+    """
+    Get embeddings for several texts with a single DeepInfra request.
+    Vectors are mapped back by the `index` field of each response item.
+    Returns a list aligned with `texts`; entries are None where no vector came back.
+    """
+    if not texts:
+        return []
+    try:
+        deepinfra_limiter.acquire()
+        resp = requests.post(
+            EMBEDDING_URL,
+            headers=HEADERS,
+            json={"model": EMBEDDING_MODEL, "input": texts}
+        )
+        resp.raise_for_status()
+        embeddings: List[List[float] | None] = [None] * len(texts)
+        for position, item in enumerate(resp.json()["data"]):
+            index = item.get("index", position)
+            if 0 <= index < len(texts):
+                embeddings[index] = item.get("embedding")
+        return embeddings
+    except Exception as e:
+        logger.error(f"Batch embedding error ({len(texts)} texts): {e}")
+        return [None] * len(texts)
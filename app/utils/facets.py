@@ -0,0 +1,169 @@
+# app/utils/facets.py
+# Taxonomy facets for book:* and video:* documents: TAG field schemas, filter clauses that are
+# pushed down into RediSearch queries, and FT.AGGREGATE facet counts.
+
+# Standard library imports
+import re
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+# App imports
+from app.utils.redis_manager import redis_client
+from app.utils.logger import get_logger
+
+# Logger setup
+logger = get_logger(__name__)
+
+# ----------------------------- CONSTANTS ----------------------------- #
+FACET_FIELDS = {
+    "book": ["dimension", "difficulty", "audience"],
+    "video": ["primaryCategory", "activityType", "goalObjective", "intensity"],
+}
+# Multi-valued fields such as book audience ("Adults, Professionals") are comma separated
+TAG_SEPARATOR = ","
+FACET_LIMIT = 50
+
+Filters = Dict[str, Union[str, Iterable[str]]]
+
+# ----------------------------- SCHEMA ----------------------------- #
+
+def facet_field_schema(field: str, on_json: bool = True) -> List[str]:
+    """
+    Schema arguments for one facet TAG field. JSON indexes address fields by path,
+    the companion vector hashes by name.
+    """
+    prefix = [f'$.{field}', 'AS', field] if on_json else [field]
+    return prefix + ['TAG', 'SEPARATOR', TAG_SEPARATOR]
+
+def facet_schema(kind: str, on_json: bool = True) -> List[str]:
+    """
+    FT.CREATE schema arguments for all facet TAG fields of `kind`.
+    """
+    return [arg for field in FACET_FIELDS[kind] for arg in facet_field_schema(field, on_json)]
+
+def facet_values(kind: str, doc: dict) -> Dict[str, str]:
+    """
+    Facet values of a document as flat strings, for copying into the companion vector hash.
+    """
+    values = {}
+    for field in FACET_FIELDS[kind]:
+        value = doc.get(field)
+        if isinstance(value, (list, tuple)):
+            value = TAG_SEPARATOR.join(str(v) for v in value)
+        if value:
+            values[field] = str(value)
+    return values
+
+def index_attributes(index: str) -> List[str]:
+    """
+    Attribute names of an existing index, read from FT.INFO.
+    """
+    res = redis_client.execute_command('FT.INFO', index)
+    info = dict(zip(res[::2], res[1::2]))
+    names = []
+    for attribute in info.get('attributes', []):
+        values = dict(zip(attribute[::2], attribute[1::2]))
+        names.append(values.get('attribute') or values.get('identifier'))
+    return names
+
+def ensure_facet_fields(index: str, kind: str, on_json: bool = True) -> List[str]:
+    """
+    Add any missing facet TAG fields to an existing index with FT.ALTER (existing documents
+    are re-indexed in the background). Returns the names of the fields that were added.
+    """
+    try:
+        present = set(index_attributes(index))
+    except Exception as e:
+        logger.warning(f"Cannot read schema of {index}, facet fields not checked: {e}")
+        return []
+    added = []
+    for field in FACET_FIELDS[kind]:
+        if field in present:
+            continue
+        redis_client.execute_command('FT.ALTER', index, 'SCHEMA', 'ADD', *facet_field_schema(field, on_json))
+        added.append(field)
+    if added:
+        logger.info(f"Added facet fields to {index}: {', '.join(added)}")
+    return added
+
+# ----------------------------- FILTERS ----------------------------- #
+
+def escape_tag_value(value: str) -> str:
+    """
+    Escape a tag value for a `@field:{...}` clause (punctuation and spaces must be escaped).
+    """
+    return re.sub(r'([^A-Za-z0-9_])', r'\\\1', value.strip())
+
+def normalize_filters(kind: str, filters: Optional[Filters]) -> Dict[str, List[str]]:
+    """
+    Keep only known facet fields with non-empty values; single strings become one-item lists.
+    """
+    normalized = {}
+    for field, values in (filters or {}).items():
+        if field not in FACET_FIELDS[kind]:
+            logger.warning(f"Ignoring unknown {kind} facet filter: {field}")
+            continue
+        if isinstance(values, str):
+            values = [values]
+        values = [v for v in (values or []) if v and str(v).strip()]
+        if values:
+            normalized[field] = values
+    return normalized
+
+def filter_clause(kind: str, filters: Optional[Filters]) -> str:
+    """
+    RediSearch clause for facet filters: values of one field are OR'ed, fields are AND'ed.
+    e.g. {"activityType": ["Yoga", "Breathwork"]} -> '@activityType:{Yoga | Breathwork}'
+    """
+    return " ".join(
+        f"@{field}:{{{' | '.join(escape_tag_value(str(v)) for v in values)}}}"
+        for field, values in normalize_filters(kind, filters).items()
+    )
+
+def combine_query(text_query: str, clause: str) -> str:
+    """
+    Intersect a text query with a filter clause; '*' when both are empty.
+    """
+    parts = [part for part in (text_query, clause) if part and part != '*']
+    return " ".join(parts) if parts else '*'
+
+def filters_cache_key(kind: str, filters: Optional[Filters]) -> str:
+    """
+    Stable string form of a filter set, for search cache keys (tags match case-insensitively).
+    """
+    return ";".join(
+        f"{field}={','.join(sorted(str(v).lower() for v in values))}"
+        for field, values in sorted(normalize_filters(kind, filters).items())
+    )
+
+# ----------------------------- COUNTS ----------------------------- #
+
+def aggregate_facets(index: str, kind: str, query: str = '*', fields: Optional[List[str]] = None,
+                     limit: int = FACET_LIMIT) -> Dict[str, List[Tuple[str, int]]]:
+    """
+    Count matching documents per facet value with one FT.AGGREGATE per field, sent in a single
+    pipeline. Comma-separated values are split so each value is counted on its own.
+
+    Returns:
+        Dict[str, List[Tuple[str, int]]]: Field -> (value, count), most frequent first.
+    """
+    fields = [f for f in (fields or FACET_FIELDS[kind]) if f in FACET_FIELDS[kind]]
+    pipe = redis_client.pipeline(transaction=False)
+    for field in fields:
+        pipe.execute_command(
+            'FT.AGGREGATE', index, query,
+            'LOAD', '1', f'@{field}',
+            'APPLY', f'split(@{field}, "{TAG_SEPARATOR}")', 'AS', 'value',
+            'GROUPBY', '1', '@value',
+            'REDUCE', 'COUNT', '0', 'AS', 'count',
+            'SORTBY', '2', '@count', 'DESC', 'MAX', str(limit),
+            'DIALECT', '2',
+        )
+    counts = {}
+    for field, res in zip(fields, pipe.execute(raise_on_error=False)):
+        if isinstance(res, Exception):
+            logger.error(f"Facet aggregation failed for {index}.{field}: {res}")
+            counts[field] = []
+            continue
+        rows = [dict(zip(row[::2], row[1::2])) for row in res[1:]]
+        counts[field] = [(row['value'], int(row['count'])) for row in rows if row.get('value')]
+    return counts
@@ -0,0 +1,310 @@
+# app/utils/index_manager.py
+# Declarative RediSearch schemas for book_idx / video_idx and zero-downtime schema changes.
+#
+# Searches always query the alias (book_idx, video_idx). Each schema version is a concrete
+# index named <alias>_<schema fingerprint>. When the declared schema changes, the new index is
+# created next to the live one (RediSearch indexes the existing keys by prefix in the
+# background), its progress is tracked with FT.INFO, and FT.ALIASUPDATE moves the alias once
+# indexing is complete. The previous index is then dropped without touching the documents.
+#
+# Usage:
+#   python -m app.utils.index_manager status
+#   python -m app.utils.index_manager ensure   (builds changed indexes in the foreground)
+
+# Standard library imports
+import os
+import json
+import time
+import uuid
+import hashlib
+import argparse
+import threading
+from typing import Dict, List, Optional
+
+# Third-party imports
+from dotenv import load_dotenv
+
+# App imports
+from app.utils.redis_manager import redis_client
+from app.utils.vector_store import json_vector_field, ensure_vector_index
+from app.utils.facets import facet_schema
+from app.utils.search_cache import bump_index_version
+from app.utils.logger import get_logger
+
+# Logger setup
+logger = get_logger(__name__)
+
+# Load environment variables
+load_dotenv()
+
+# ----------------------------- SCHEMAS ----------------------------- #
+INDEX_SCHEMAS = {
+    "book": {
+        "alias": "book_idx",
+        "prefix": "book:",
+        "fields": [
+            ['$.book_title', 'AS', 'book_title', 'TEXT'],
+            ['$.author', 'AS', 'author', 'TEXT'],
+            ['$.searchable_text', 'AS', 'searchable_text', 'TEXT'],
+            facet_schema("book"),
+            json_vector_field(),
+        ],
+    },
+    "video": {
+        "alias": "video_idx",
+        "prefix": "video:",
+        "fields": [
+            ['$.youtube_title', 'AS', 'youtube_title', 'TEXT'],
+            ['$.searchable_text', 'AS', 'searchable_text', 'TEXT'],
+            facet_schema("video"),
+            json_vector_field(),
+        ],
+    },
+}
+
+# ----------------------------- CONSTANTS ----------------------------- #
+BUILD_POLL_SECONDS = float(os.getenv("INDEX_BUILD_POLL_SECONDS", "2"))
+# A build holds this lock so that only one app process builds and switches an index
+BUILD_LOCK_PREFIX = "index_build:"
+BUILD_LOCK_TTL_SECONDS = 600
+# The lock holds a unique token; only the holder may renew or release it
+RENEW_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('expire', KEYS[1], ARGV[2]) end
+return 0
+"""
+RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) end
+return 0
+"""
+
+_builds: Dict[str, threading.Thread] = {}
+_builds_lock = threading.Lock()
+
+# ----------------------------- NAMING ----------------------------- #
+
+def schema_args(kind: str) -> List[str]:
+    """
+    Flat SCHEMA arguments of the declared index for `kind`.
+    """
+    return [arg for field in INDEX_SCHEMAS[kind]["fields"] for arg in field]
+
+def schema_fingerprint(kind: str) -> str:
+    """
+    Short hash of the declared prefix and schema; changes whenever the schema does.
+    """
+    spec = [INDEX_SCHEMAS[kind]["prefix"], schema_args(kind)]
+    return hashlib.sha256(json.dumps(spec).encode("utf-8")).hexdigest()[:8]
+
+def versioned_index_name(kind: str) -> str:
+    """
+    Concrete index name for the declared schema of `kind`, e.g. book_idx_1a2b3c4d.
+    """
+    return f"{INDEX_SCHEMAS[kind]['alias']}_{schema_fingerprint(kind)}"
+
+# ----------------------------- FT.INFO ----------------------------- #
+
+def index_info(name: str) -> Optional[dict]:
+    """
+    Top-level FT.INFO fields of an index or alias, or None if it does not exist.
+    """
+    try:
+        res = redis_client.execute_command('FT.INFO', name)
+    except Exception:
+        return None
+    return dict(zip(res[::2], res[1::2]))
+
+def alias_target(kind: str) -> Optional[str]:
+    """
+    Concrete index currently serving the alias of `kind`. Returns the alias name itself for a
+    legacy index created under that name, or None if nothing serves it.
+    """
+    info = index_info(INDEX_SCHEMAS[kind]["alias"])
+    return info.get('index_name') if info else None
+
+def indexing_progress(name: str) -> Optional[dict]:
+    """
+    Indexing state of an index: whether a background scan is running, the indexed fraction
+    (0-1), the document count and the number of indexing failures.
+    """
+    info = index_info(name)
+    if info is None:
+        return None
+    return {
+        "indexing": bool(int(info.get('indexing', 0))),
+        "percent_indexed": float(info.get('percent_indexed', 1)),
+        "num_docs": int(info.get('num_docs', 0)),
+        "hash_indexing_failures": int(info.get('hash_indexing_failures', 0)),
+    }
+
+# ----------------------------- BUILD / SWITCH ----------------------------- #
+
+def create_index(kind: str, name: str) -> None:
+    """
+    FT.CREATE the declared schema of `kind` under `name`.
+    """
+    schema = INDEX_SCHEMAS[kind]
+    redis_client.execute_command(
+        'FT.CREATE', name, 'ON', 'JSON', 'PREFIX', '1', schema["prefix"], 'SCHEMA', *schema_args(kind)
+    )
+    logger.info(f"Created index {name} for {schema['prefix']}* (schema {schema_fingerprint(kind)})")
+
+def wait_until_indexed(name: str, timeout: Optional[float] = None, lock_key: Optional[str] = None,
+                       lock_token: Optional[str] = None) -> bool:
+    """
+    Poll FT.INFO until the background scan of `name` has finished. Keeps `lock_key` (held with
+    `lock_token`) alive while waiting. Returns False on timeout, if the index disappears or if
+    the lock was lost.
+    """
+    started = time.monotonic()
+    while True:
+        progress = indexing_progress(name)
+        if progress is None:
+            logger.error(f"Index {name} disappeared while building")
+            return False
+        if not progress["indexing"] and progress["percent_indexed"] >= 1:
+            logger.info(f"Index {name} ready: {progress['num_docs']} documents")
+            return True
+        logger.info(f"Building {name}: {progress['percent_indexed']:.0%} indexed, {progress['num_docs']} documents")
+        if timeout is not None and time.monotonic() - started > timeout:
+            return False
+        if lock_key and not redis_client.eval(RENEW_LOCK_SCRIPT, 1, lock_key, lock_token, BUILD_LOCK_TTL_SECONDS):
+            logger.error(f"Lost build lock {lock_key} while building {name}")
+            return False
+        time.sleep(BUILD_POLL_SECONDS)
+
+def switch_alias(kind: str, new_index: str, old_index: Optional[str]) -> None:
+    """
+    Point the alias of `kind` at `new_index` and drop `old_index` (documents are kept).
+    A legacy index named like the alias is dropped and replaced by the alias in one MULTI/EXEC.
+    """
+    alias = INDEX_SCHEMAS[kind]["alias"]
+    pipe = redis_client.pipeline(transaction=True)
+    if old_index is None:
+        pipe.execute_command('FT.ALIASADD', alias, new_index)
+    elif old_index == alias:
+        pipe.execute_command('FT.DROPINDEX', old_index)
+        pipe.execute_command('FT.ALIASADD', alias, new_index)
+    else:
+        pipe.execute_command('FT.ALIASUPDATE', alias, new_index)
+        pipe.execute_command('FT.DROPINDEX', old_index)
+    pipe.execute()
+    bump_index_version(alias)
+    logger.info(f"✅ Alias {alias} now serves {new_index} (was {old_index})")
+
+def build_and_switch(kind: str, timeout: Optional[float] = None) -> bool:
+    """
+    Build the declared index of `kind` next to the live one, wait for FT.INFO to report it
+    fully indexed, then switch the alias. Returns True if the alias was switched.
+    """
+    new_index = versioned_index_name(kind)
+    lock_key = f"{BUILD_LOCK_PREFIX}{INDEX_SCHEMAS[kind]['alias']}"
+    lock_token = f"{new_index}:{uuid.uuid4().hex}"
+    if not redis_client.set(lock_key, lock_token, nx=True, ex=BUILD_LOCK_TTL_SECONDS):
+        logger.info(f"Index build for {kind} already running elsewhere ({redis_client.get(lock_key)})")
+        return False
+    try:
+        if index_info(new_index) is None:
+            create_index(kind, new_index)
+        if not wait_until_indexed(new_index, timeout, lock_key, lock_token):
+            logger.error(f"Index {new_index} not ready; alias left on {alias_target(kind)}")
+            return False
+        old_index = alias_target(kind)
+        if old_index != new_index:
+            switch_alias(kind, new_index, old_index)
+        return True
+    except Exception as e:
+        logger.error(f"Index build for {kind} failed: {e}")
+        return False
+    finally:
+        # A lock that expired and was taken by another process is left to that process
+        redis_client.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, lock_token)
+
+def start_background_build(kind: str) -> threading.Thread:
+    """
+    Run build_and_switch for `kind` in a daemon thread (at most one per kind in this process).
+    """
+    with _builds_lock:
+        thread = _builds.get(kind)
+        if thread and thread.is_alive():
+            return thread
+        thread = threading.Thread(target=build_and_switch, args=(kind,), name=f"index-build-{kind}", daemon=True)
+        _builds[kind] = thread
+        thread.start()
+        return thread
+
+def ensure_index(kind: str, background: bool = True) -> str:
+    """
+    Make the alias of `kind` serve the declared schema.
+
+    Returns:
+        str: 'current' if it already does, 'created' if the index did not exist (it is created
+        and aliased right away), or 'rebuilding' if the schema changed and a new index is being
+        built ('rebuilt' when run in the foreground).
+    """
+    target = alias_target(kind)
+    desired = versioned_index_name(kind)
+    if target == desired:
+        return "current"
+    if target is None:
+        if index_info(desired) is None:
+            create_index(kind, desired)
+        switch_alias(kind, desired, None)
+        return "created"
+    logger.info(f"Schema of {INDEX_SCHEMAS[kind]['alias']} changed ({target} -> {desired}), reindexing")
+    if background:
+        start_background_build(kind)
+        return "rebuilding"
+    return "rebuilt" if build_and_switch(kind) else "rebuilding"
+
+def ensure_indexes(background: bool = True) -> Dict[str, str]:
+    """
+    Ensure the book and video search indexes (and the companion vector indexes used by
+    binary vector storage). Called at startup.
+    """
+    results = {}
+    for kind in INDEX_SCHEMAS:
+        try:
+            results[kind] = ensure_index(kind, background)
+        except Exception as e:
+            logger.error(f"Could not ensure {kind} index: {e}")
+            results[kind] = f"error: {e}"
+        try:
+            ensure_vector_index(kind)
+        except Exception as e:
+            logger.error(f"Could not ensure {kind} vector index: {e}")
+            results[f"{kind}_vector"] = f"error: {e}"
+    logger.info(f"Search indexes: {results}")
+    return results
+
+def get_index_status() -> Dict[str, dict]:
+    """
+    Alias target, declared index and indexing progress per kind.
+    """
+    status = {}
+    for kind, schema in INDEX_SCHEMAS.items():
+        target = alias_target(kind)
+        desired = versioned_index_name(kind)
+        status[kind] = {
+            "alias": schema["alias"],
+            "serving": target,
+            "declared": desired,
+            "up_to_date": target == desired,
+            "serving_progress": indexing_progress(target) if target else None,
+            "declared_progress": indexing_progress(desired) if target != desired else None,
+        }
+    return status
+
+# ----------------------------- CLI ----------------------------- #
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the book/video search indexes.")
+    parser.add_argument("command", choices=["status", "ensure"])
+    args = parser.parse_args()
+
+    if args.command == "ensure":
+        print(ensure_indexes(background=False))
+        return
+    print(json.dumps(get_index_status(), indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,356 @@
+# app/utils/local_vector_index.py
+# Optional in-process vector index: all book:* / video:* embeddings in one contiguous float32
+# matrix, searched by brute-force cosine similarity without a Redis round trip.
+#
+# The matrix is snapshotted to <LOCAL_VECTOR_INDEX_DIR>/<kind>.npy (+ <kind>.keys.json) and
+# memory-mapped on startup, so a restart does not re-read every embedding from Redis. Writes made
+# by this process are applied incrementally; when the index version in Redis moves for any other
+# reason (another process wrote or deleted documents), the index is rebuilt in the background.
+#
+# Enable with LOCAL_VECTOR_INDEX=1. vector_search() then answers unfiltered KNN queries from here
+# and falls back to RediSearch for filtered ones or while the index is not loaded.
+
+# Standard library imports
+import os
+import json
+import time
+import atexit
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Third-party imports
+import numpy as np
+from dotenv import load_dotenv
+
+# App imports
+from app.utils.redis_manager import redis_client, redis_binary_client
+from app.utils.vector_store import (
+    EMBEDDING_DIM, VECTOR_FIELD, FORMAT_FIELD, DOC_PREFIXES, decode_vector, vector_key
+)
+from app.utils.search_cache import get_index_version
+from app.utils.logger import get_logger
+
+# Logger setup
+logger = get_logger(__name__)
+
+# Load environment variables
+load_dotenv()
+
+# ----------------------------- CONSTANTS ----------------------------- #
+LOCAL_INDEX_ENABLED = os.getenv("LOCAL_VECTOR_INDEX", "0") == "1"
+LOCAL_INDEX_DIR = os.getenv("LOCAL_VECTOR_INDEX_DIR", "app/data/vector_index")
+# Seconds between checks of the Redis index version for changes made by other processes
+REFRESH_SECONDS = float(os.getenv("LOCAL_VECTOR_INDEX_REFRESH", "30"))
+INDEX_NAMES = {"book": "book_idx", "video": "video_idx"}
+LOAD_BATCH_SIZE = 500
+INITIAL_CAPACITY = 1024
+
+# ----------------------------- INDEX ----------------------------- #
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """
+    L2-normalize float32 row vectors so a dot product is the cosine similarity.
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+class LocalVectorIndex:
+    """
+    Contiguous float32 matrix of normalized embeddings with a key per row.
+    Deleted rows are masked out and dropped when the snapshot is saved.
+    """
+
+    def __init__(self, kind: str, directory: str = LOCAL_INDEX_DIR, dim: int = EMBEDDING_DIM):
+        self.kind = kind
+        self.dim = dim
+        self.matrix_path = os.path.join(directory, f"{kind}.npy")
+        self.keys_path = os.path.join(directory, f"{kind}.keys.json")
+        self.version = None
+        self.dirty = False
+        self._lock = threading.RLock()
+        self._reset(np.zeros((0, dim), dtype=np.float32), [])
+
+    def _reset(self, matrix: np.ndarray, keys: List[str]) -> None:
+        self._matrix = matrix
+        self._keys = list(keys)
+        self._size = len(self._keys)
+        self._valid = np.ones(max(len(matrix), self._size), dtype=bool)
+        self._positions = {key: i for i, key in enumerate(self._keys)}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    # -- snapshot --
+
+    def load_snapshot(self) -> bool:
+        """
+        Memory-map the snapshot (copy-on-write, so later updates never touch the file).
+        Returns False if there is no usable snapshot.
+        """
+        if not (os.path.exists(self.matrix_path) and os.path.exists(self.keys_path)):
+            return False
+        try:
+            with open(self.keys_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            matrix = np.load(self.matrix_path, mmap_mode="c")
+            if matrix.shape != (len(meta["keys"]), self.dim):
+                logger.warning(f"Local {self.kind} vector snapshot does not match its keys; ignoring it")
+                return False
+        except Exception as e:
+            logger.warning(f"Could not load local {self.kind} vector snapshot: {e}")
+            return False
+        with self._lock:
+            self._reset(matrix, meta["keys"])
+            self.version = meta.get("version")
+            self.dirty = False
+        logger.info(f"Loaded local {self.kind} vector index: {len(self)} vectors (version {self.version})")
+        return True
+
+    def save_snapshot(self) -> None:
+        """
+        Write the live rows to the snapshot files (temp file + rename).
+        """
+        with self._lock:
+            live = np.flatnonzero(self._valid[:self._size])
+            matrix = np.ascontiguousarray(self._matrix[live])
+            keys = [self._keys[i] for i in live]
+            version = self.version
+            self.dirty = False
+        os.makedirs(os.path.dirname(self.matrix_path), exist_ok=True)
+        tmp_matrix = f"{self.matrix_path}.tmp.npy"
+        np.save(tmp_matrix, matrix)
+        os.replace(tmp_matrix, self.matrix_path)
+        tmp_keys = f"{self.keys_path}.tmp"
+        with open(tmp_keys, "w", encoding="utf-8") as f:
+            json.dump({"version": version, "keys": keys}, f)
+        os.replace(tmp_keys, self.keys_path)
+        logger.info(f"Saved local {self.kind} vector snapshot: {len(keys)} vectors")
+
+    def rebuild(self) -> None:
+        """
+        Reload every embedding of this kind from Redis, replace the index and save a snapshot.
+        """
+        started = time.monotonic()
+        version = get_index_version(INDEX_NAMES[self.kind])
+        keys, vectors = load_all_embeddings(self.kind, self.dim)
+        matrix = normalize_rows(np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim))
+        with self._lock:
+            self._reset(matrix, keys)
+            self.version = version
+        self.save_snapshot()
+        logger.info(f"Rebuilt local {self.kind} vector index: {len(keys)} vectors in {time.monotonic() - started:.1f}s")
+
+    # -- updates --
+
+    def add(self, items: Iterable[Tuple[str, List[float]]]) -> None:
+        """
+        Insert or replace embeddings by key.
+        """
+        items = [(key, vector) for key, vector in items if vector is not None]
+        if not items:
+            return
+        vectors = normalize_rows(np.asarray([vector for _, vector in items], dtype=np.float32))
+        with self._lock:
+            new_rows = sum(1 for key, _ in items if key not in self._positions)
+            self._ensure_capacity(self._size + new_rows)
+            for (key, _), vector in zip(items, vectors):
+                row = self._positions.get(key)
+                if row is None:
+                    row = self._size
+                    self._size += 1
+                    self._keys.append(key)
+                    self._positions[key] = row
+                self._matrix[row] = vector
+                self._valid[row] = True
+            self.dirty = True
+
+    def remove(self, keys: Iterable[str]) -> int:
+        """
+        Mask out embeddings by key. Returns the number removed.
+        """
+        removed = 0
+        with self._lock:
+            for key in keys:
+                row = self._positions.pop(key, None)
+                if row is not None:
+                    self._valid[row] = False
+                    removed += 1
+            self.dirty = self.dirty or bool(removed)
+        return removed
+
+    def adopt_version(self, version: Optional[int]) -> None:
+        """
+        Move to `version` after applying this process's own write, but only if it directly
+        follows the local version. Otherwise another process wrote in between, and the version
+        is left alone so the refresh loop rebuilds.
+        """
+        with self._lock:
+            if version is not None and self.version is not None and int(self.version) == version - 1:
+                self.version = str(version)
+
+    def _ensure_capacity(self, rows: int) -> None:
+        if rows <= len(self._matrix):
+            return
+        capacity = max(rows, INITIAL_CAPACITY, 2 * len(self._matrix))
+        matrix = np.zeros((capacity, self.dim), dtype=np.float32)
+        matrix[:self._size] = self._matrix[:self._size]
+        valid = np.zeros(capacity, dtype=bool)
+        valid[:self._size] = self._valid[:self._size]
+        self._matrix, self._valid = matrix, valid
+
+    # -- search --
+
+    def search(self, vector: List[float], k: int) -> List[Tuple[str, float]]:
+        """
+        Top-k keys by cosine similarity, best first; same shape as common.vector_search.
+        """
+        return self.search_many([vector], k)[0]
+
+    def search_many(self, vectors: List[List[float]], k: int) -> List[List[Tuple[str, float]]]:
+        """
+        Top-k neighbours for several query vectors with one matrix product.
+        """
+        queries = normalize_rows(np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim))
+        with self._lock:
+            size = self._size
+            if not size or not self._positions:
+                return [[] for _ in queries]
+            scores = queries @ self._matrix[:size].T
+            scores[:, ~self._valid[:size]] = -np.inf
+            keys = self._keys
+        k = min(k, len(self._positions))
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        results = []
+        for row, candidates in zip(scores, top):
+            ordered = candidates[np.argsort(-row[candidates], kind="stable")]
+            results.append([(keys[i], round(float(row[i]), 4)) for i in ordered])
+        return results
+
+# ----------------------------- LOADING ----------------------------- #
+
+def load_all_embeddings(kind: str, dim: int = EMBEDDING_DIM) -> Tuple[List[str], List[List[float]]]:
+    """
+    Read the embeddings of every document of `kind` from Redis, in SCAN batches, whichever
+    storage format each document uses.
+    """
+    keys, vectors = [], []
+    batch = []
+    for key in redis_client.scan_iter(match=f"{DOC_PREFIXES[kind]}*", count=LOAD_BATCH_SIZE):
+        batch.append(key)
+        if len(batch) >= LOAD_BATCH_SIZE:
+            _load_batch(batch, keys, vectors, dim)
+            batch = []
+    _load_batch(batch, keys, vectors, dim)
+    return keys, vectors
+
+def _load_batch(batch: List[str], keys: List[str], vectors: List[List[float]], dim: int) -> None:
+    if not batch:
+        return
+    embeddings = redis_client.json().mget(batch, f"$.{VECTOR_FIELD}")
+    formats = redis_client.json().mget(batch, f"$.{FORMAT_FIELD}")
+    binary = []
+    for key, embedding, fmt in zip(batch, embeddings, formats):
+        if embedding and embedding[0] and len(embedding[0]) == dim:
+            keys.append(key)
+            vectors.append(embedding[0])
+        elif fmt and fmt[0]:
+            binary.append((key, fmt[0]))
+    if not binary:
+        return
+    pipe = redis_binary_client.pipeline(transaction=False)
+    for key, _ in binary:
+        pipe.hget(vector_key(key), VECTOR_FIELD)
+    for (key, fmt), blob in zip(binary, pipe.execute()):
+        if blob:
+            keys.append(key)
+            vectors.append(decode_vector(blob, fmt))
+
+# ----------------------------- MODULE API ----------------------------- #
+
+_indexes: Dict[str, LocalVectorIndex] = {}
+_indexes_lock = threading.Lock()
+
+def get_local_index(kind: str) -> Optional[LocalVectorIndex]:
+    """
+    The loaded local index for `kind`, or None when disabled or not yet loaded.
+    """
+    return _indexes.get(kind) if LOCAL_INDEX_ENABLED else None
+
+def load_local_indexes() -> None:
+    """
+    Load each kind from its snapshot (rebuilding from Redis if there is none or it is stale).
+    """
+    for kind in INDEX_NAMES:
+        index = LocalVectorIndex(kind)
+        if not index.load_snapshot() or index.version != get_index_version(INDEX_NAMES[kind]):
+            index.rebuild()
+        with _indexes_lock:
+            _indexes[kind] = index
+
+def local_vector_search(kind: str, vector: List[float], k: int) -> Optional[List[Tuple[str, float]]]:
+    """
+    KNN from the local index, or None if it is unavailable (callers then query Redis).
+    """
+    index = get_local_index(kind)
+    if index is None or vector is None:
+        return None
+    return index.search(vector, k)
+
+def local_index_add(kind: str, items: Iterable[Tuple[str, List[float]]], version: Optional[int]) -> None:
+    """
+    Apply documents just written by this process. `version` is what bump_index_version returned.
+    """
+    index = get_local_index(kind)
+    if index is not None:
+        index.add(items)
+        index.adopt_version(version)
+
+def local_index_remove(kind: str, keys: Iterable[str], version: Optional[int]) -> None:
+    """
+    Apply deletions just made by this process. `version` is what bump_index_version returned.
+    """
+    index = get_local_index(kind)
+    if index is not None:
+        index.remove(keys)
+        index.adopt_version(version)
+
+def save_local_indexes() -> None:
+    """
+    Snapshot every index with unsaved changes.
+    """
+    for index in list(_indexes.values()):
+        if index.dirty:
+            try:
+                index.save_snapshot()
+            except Exception as e:
+                logger.error(f"Could not save local {index.kind} vector snapshot: {e}")
+
+def _refresh_loop() -> None:
+    try:
+        load_local_indexes()
+    except Exception as e:
+        logger.error(f"Could not load local vector indexes: {e}")
+    while True:
+        time.sleep(REFRESH_SECONDS)
+        for kind, index in list(_indexes.items()):
+            try:
+                if index.version != get_index_version(INDEX_NAMES[kind]):
+                    logger.info(f"Index version of {kind} changed outside this process, rebuilding local index")
+                    index.rebuild()
+                elif index.dirty:
+                    index.save_snapshot()
+            except Exception as e:
+                logger.error(f"Local {kind} vector index refresh failed: {e}")
+
+def start_local_index() -> Optional[threading.Thread]:
+    """
+    Load the local indexes and keep them fresh in a daemon thread (no-op unless LOCAL_VECTOR_INDEX=1).
+    Searches use Redis until loading has finished.
+    """
+    if not LOCAL_INDEX_ENABLED:
+        return None
+    atexit.register(save_local_indexes)
+    thread = threading.Thread(target=_refresh_loop, name="local-vector-index", daemon=True)
+    thread.start()
+    return thread
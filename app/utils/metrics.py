@@ -0,0 +1,246 @@
+# app/utils/metrics.py
+# In-process timing histograms for search and ingest stages, a slow-query log with FT.PROFILE
+# output, and a small JSON metrics endpoint served next to the Gradio app.
+#
+# Stage names are dotted, e.g. search.book.text.query or ingest.book.write_chunk.
+#
+#   GET http://<METRICS_HOST>:<METRICS_PORT>/metrics        -> stage percentiles, caches, slow queries
+#   POST http://<METRICS_HOST>:<METRICS_PORT>/metrics/reset -> clear the histograms
+
+# Standard library imports
+import os
+import json
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional
+
+# Third-party imports
+from dotenv import load_dotenv
+
+# App imports
+from app.utils.redis_manager import redis_client
+from app.utils.search_cache import get_search_cache_stats
+from app.utils.embedding_cache import get_cache_stats
+from app.utils.logger import get_logger
+
+# Logger setup
+logger = get_logger(__name__)
+
+# Load environment variables
+load_dotenv()
+
+# ----------------------------- CONSTANTS ----------------------------- #
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "1") == "1"
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+METRICS_PORT = int(os.getenv("METRICS_PORT", "7862"))
+# Percentiles are computed over the most recent samples of each stage
+HISTOGRAM_WINDOW = int(os.getenv("METRICS_WINDOW", "2048"))
+# Queries slower than this are logged; with SLOW_QUERY_PROFILE=1 they are re-run under FT.PROFILE
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "250"))
+SLOW_QUERY_PROFILE = os.getenv("SLOW_QUERY_PROFILE", "0") == "1"
+SLOW_QUERY_LOG_SIZE = 50
+PERCENTILES = (50, 95, 99)
+
+# ----------------------------- HISTOGRAMS ----------------------------- #
+
+class Histogram:
+    """
+    Running count/total/max plus a window of recent samples for percentiles.
+    """
+
+    def __init__(self, window: int = HISTOGRAM_WINDOW):
+        self.samples = deque(maxlen=window)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.samples.append(seconds)
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def summary(self) -> Dict[str, float]:
+        ordered = sorted(self.samples)
+        summary = {"count": self.count, "mean_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0}
+        for p in PERCENTILES:
+            index = min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))
+            summary[f"p{p}_ms"] = round(ordered[index] * 1000, 3) if ordered else 0.0
+        summary["max_ms"] = round(self.max * 1000, 3)
+        return summary
+
+_histograms: Dict[str, Histogram] = {}
+_slow_queries: deque = deque(maxlen=SLOW_QUERY_LOG_SIZE)
+_lock = threading.Lock()
+
+def record(stage: str, seconds: float) -> None:
+    """
+    Add one timing sample to the histogram of `stage`.
+    """
+    if not METRICS_ENABLED:
+        return
+    with _lock:
+        histogram = _histograms.get(stage)
+        if histogram is None:
+            histogram = _histograms[stage] = Histogram()
+        histogram.add(seconds)
+
+@contextmanager
+def timer(stage: str):
+    """
+    Time a block: `with timer("search.book.text.fetch"): ...`
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(stage, time.perf_counter() - started)
+
+def timed(stage: str) -> Callable:
+    """
+    Decorator timing every call of a function (including generators' setup, not their iteration).
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with timer(stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def get_stage_stats() -> Dict[str, Dict[str, float]]:
+    """
+    Percentile summary per stage, sorted by stage name.
+    """
+    with _lock:
+        return {stage: histogram.summary() for stage, histogram in sorted(_histograms.items())}
+
+def reset_metrics() -> None:
+    with _lock:
+        _histograms.clear()
+        _slow_queries.clear()
+
+# ----------------------------- SLOW QUERIES ----------------------------- #
+
+def _printable(args: List[Any]) -> List[Any]:
+    return [f"<{len(arg)} bytes>" if isinstance(arg, bytes) else arg for arg in args]
+
+def run_ft_command(stage: str, command: str, args: List[Any]) -> Any:
+    """
+    Run an FT.SEARCH / FT.AGGREGATE command, record its latency under `stage`, and log it as a
+    slow query (with FT.PROFILE output if enabled) when it exceeds SLOW_QUERY_MS.
+    `args` start with the index name, as for execute_command.
+    """
+    started = time.perf_counter()
+    res = redis_client.execute_command(command, *args)
+    elapsed = time.perf_counter() - started
+    record(stage, elapsed)
+    if elapsed * 1000 >= SLOW_QUERY_MS:
+        log_slow_query(stage, command, args, elapsed)
+    return res
+
+def log_slow_query(stage: str, command: str, args: List[Any], elapsed: float) -> None:
+    """
+    Keep a slow query in the recent slow-query log. The profile run happens on a daemon
+    thread so the caller is not slowed down a second time.
+    """
+    entry = {
+        "at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "stage": stage,
+        "elapsed_ms": round(elapsed * 1000, 3),
+        "command": [command, *_printable(args)],
+        "profile": None,
+    }
+    logger.warning(f"Slow query ({entry['elapsed_ms']} ms) in {stage}: {entry['command']}")
+    with _lock:
+        _slow_queries.append(entry)
+    if SLOW_QUERY_PROFILE:
+        threading.Thread(target=_profile, args=(entry, command, args), daemon=True).start()
+
+def _profile(entry: dict, command: str, args: List[Any]) -> None:
+    index, query, *rest = args
+    kind = "SEARCH" if command.upper() == "FT.SEARCH" else "AGGREGATE"
+    try:
+        profile = redis_client.execute_command('FT.PROFILE', index, kind, 'QUERY', query, *rest)
+        # The reply is [results, profile]; only the profile part is kept
+        result = _printable_nested(profile[-1])
+    except Exception as e:
+        result = f"FT.PROFILE failed: {e}"
+    with _lock:
+        entry["profile"] = result
+
+def _printable_nested(value: Any) -> Any:
+    if isinstance(value, (list, tuple)):
+        return [_printable_nested(v) for v in value]
+    if isinstance(value, bytes):
+        return f"<{len(value)} bytes>"
+    return value
+
+def get_slow_queries() -> List[dict]:
+    with _lock:
+        return [dict(entry) for entry in _slow_queries]
+
+# ----------------------------- ENDPOINT ----------------------------- #
+
+def collect_metrics() -> Dict[str, Any]:
+    """
+    Everything the metrics endpoint reports.
+    """
+    return {
+        "stages": get_stage_stats(),
+        "search_cache": get_search_cache_stats(),
+        "embedding_cache": get_cache_stats(),
+        "slow_query_ms": SLOW_QUERY_MS,
+        "slow_queries": get_slow_queries(),
+    }
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        path = self.path.rstrip("/")
+        if path == "/metrics":
+            self.send_json(collect_metrics())
+        elif path == "/metrics/reset":
+            # Resetting changes state, so crawlers and probes must not trigger it
+            self.send_response(405)
+            self.send_header("Allow", "POST")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        else:
+            self.send_error(404)
+
+    def do_POST(self):
+        if self.path.rstrip("/") == "/metrics/reset":
+            reset_metrics()
+            self.send_json({"status": "✅ Metrics reset"})
+        else:
+            self.send_error(404)
+
+    def send_json(self, body: Dict[str, Any]) -> None:
+        payload = json.dumps(body, indent=2, default=str).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        logger.debug(f"metrics: {format % args}")
+
+def start_metrics_server(host: str = METRICS_HOST, port: int = METRICS_PORT) -> Optional[ThreadingHTTPServer]:
+    """
+    Serve /metrics from a daemon thread (no-op when METRICS_ENABLED=0).
+    """
+    if not METRICS_ENABLED:
+        return None
+    try:
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+    except OSError as e:
+        logger.error(f"Could not start metrics endpoint on {host}:{port}: {e}")
+        return None
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    logger.info(f"Metrics endpoint: http://{host}:{port}/metrics")
+    return server
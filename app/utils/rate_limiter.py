@@ -0,0 +1,56 @@
+# Standard library imports
+import os
+import threading
+import time
+
+# Third-party imports
+from dotenv import load_dotenv
+
+# App imports
+from app.utils.logger import get_logger
+
+# Logger setup
+logger = get_logger(__name__)
+
+# Load environment variables
+load_dotenv()
+
+# DeepInfra request budget shared by every caller in the process
+DEEPINFRA_RATE_PER_SEC = float(os.getenv("DEEPINFRA_RATE_PER_SEC", "10"))
+DEEPINFRA_BURST = int(os.getenv("DEEPINFRA_BURST", "10"))
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: `rate` tokens are added per second up to `capacity`.
+    `acquire` blocks until enough tokens are available. A rate <= 0 disables limiting.
+    """
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, tokens: int = 1) -> None:
+        """
+        Take `tokens` from the bucket, sleeping until they are available.
+        """
+        if self.rate <= 0:
+            return
+        tokens = min(tokens, self.capacity)
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait = (tokens - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+# Singleton limiter for DeepInfra API calls (embeddings and LLM)
+deepinfra_limiter = TokenBucket(DEEPINFRA_RATE_PER_SEC, DEEPINFRA_BURST)
+logger.info(f"DeepInfra rate limit: {DEEPINFRA_RATE_PER_SEC}/s, burst {DEEPINFRA_BURST}")
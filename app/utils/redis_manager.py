@@ -16,6 +16,7 @@ class RedisManager:
     """
     def __init__(self):
         config = get_redis_config()
+        self.config = config
         try:
             self.client = redis.Redis(
                 host=config['host'],
@@ -38,5 +39,20 @@ class RedisManager:
         """
         return self.client
 
-# Singleton Redis client for app-wide use
-redis_client = RedisManager().get_client()
+    def get_binary_client(self):
+        """
+        Return a Redis client that does not decode responses, for binary values (e.g. vectors).
+        """
+        return redis.Redis(
+            host=self.config['host'],
+            port=self.config['port'],
+            password=self.config['password'],
+            decode_responses=False,
+            socket_connect_timeout=5,  # seconds
+            socket_timeout=5
+        )
+
+# Singleton Redis clients for app-wide use
+redis_manager = RedisManager()
+redis_client = redis_manager.get_client()
+redis_binary_client = redis_manager.get_binary_client()
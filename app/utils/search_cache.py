@@ -0,0 +1,103 @@
+# app/utils/search_cache.py
+# In-process cache for search results, invalidated by per-index version counters in Redis.
+# Writers (book/video ingestion, deletes) bump the version of the index they change, so
+# cached results from an older version are never served.
+
+# Standard library imports
+import os
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Third-party imports
+from dotenv import load_dotenv
+
+# App imports
+from app.utils.redis_manager import redis_client
+from app.utils.logger import get_logger
+
+# Logger setup
+logger = get_logger(__name__)
+
+# Load environment variables
+load_dotenv()
+
+# ----------------------------- CONSTANTS ----------------------------- #
+CACHE_TTL_SECONDS = float(os.getenv("SEARCH_CACHE_TTL", "300"))
+CACHE_MAX_ENTRIES = int(os.getenv("SEARCH_CACHE_SIZE", "1000"))
+VERSION_KEY_PREFIX = "index_version:"
+
+# key -> (stored_at, compute_seconds, result)
+_cache: "OrderedDict[Tuple[str, str, str, str], Tuple[float, float, Any]]" = OrderedDict()
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "saved_seconds": 0.0}
+
+# ----------------------------- VERSIONS ----------------------------- #
+
+def get_index_version(index: str) -> str:
+    """
+    Current version counter of an index ("0" if never written or Redis is unavailable).
+    """
+    try:
+        return redis_client.get(f"{VERSION_KEY_PREFIX}{index}") or "0"
+    except Exception as e:
+        logger.warning(f"Could not read index version for {index}: {e}")
+        return "0"
+
+def bump_index_version(index: str) -> Optional[int]:
+    """
+    Invalidate cached results for an index. Call after writing or deleting its documents.
+    Returns the new version (None if Redis is unavailable).
+    """
+    try:
+        return redis_client.incr(f"{VERSION_KEY_PREFIX}{index}")
+    except Exception as e:
+        logger.warning(f"Could not bump index version for {index}: {e}")
+        return None
+
+# ----------------------------- CACHE ----------------------------- #
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+def cached_search(index: str, mode: str, query: str, compute: Callable[[], Tuple[list, list]]) -> Tuple[list, list]:
+    """
+    Return the cached (keys, data) result for (index, mode, normalized query, index version),
+    or run `compute` and cache its result. Empty results (no hits or errors) are not cached.
+    """
+    key = (index, mode, normalize_query(query), get_index_version(index))
+    now = time.monotonic()
+    with _lock:
+        entry = _cache.get(key)
+        if entry and now - entry[0] <= CACHE_TTL_SECONDS:
+            _cache.move_to_end(key)
+            _stats["hits"] += 1
+            _stats["saved_seconds"] += entry[1]
+            logger.info(f"Search cache hit ({index}, {mode}): saved {entry[1] * 1000:.1f} ms")
+            return entry[2]
+        if entry:
+            del _cache[key]
+        _stats["misses"] += 1
+
+    started = time.monotonic()
+    result = compute()
+    elapsed = time.monotonic() - started
+    if result[0]:
+        with _lock:
+            _cache[key] = (time.monotonic(), elapsed, result)
+            while len(_cache) > CACHE_MAX_ENTRIES:
+                _cache.popitem(last=False)
+    return result
+
+def get_search_cache_stats() -> Dict[str, float]:
+    """
+    Hit/miss counters, hit ratio and total latency saved by cache hits.
+    """
+    with _lock:
+        stats = dict(_stats)
+        stats["entries"] = len(_cache)
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_ratio"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+    stats["saved_seconds"] = round(stats["saved_seconds"], 3)
+    return stats
@@ -0,0 +1,180 @@
+# app/utils/suggestions.py
+# Title autocomplete backed by RediSearch suggestion dictionaries (FT.SUGADD / FT.SUGGET).
+# Titles are added when books and videos are stored and removed when they are deleted;
+# each suggestion carries the document key as its payload.
+#
+# Usage (backfill dictionaries from existing documents):
+#   python -m app.utils.suggestions rebuild
+
+# Standard library imports
+import os
+import re
+import argparse
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Third-party imports
+from dotenv import load_dotenv
+
+# App imports
+from app.utils.redis_manager import redis_client
+from app.utils.logger import get_logger
+
+# Logger setup
+logger = get_logger(__name__)
+
+# Load environment variables
+load_dotenv()
+
+# ----------------------------- CONSTANTS ----------------------------- #
+SUGGESTION_KEYS = {"book": "sug:book_title", "video": "sug:youtube_title"}
+SEARCH_INDEXES = {"book": "book_idx", "video": "video_idx"}
+TITLE_FIELDS = {"book": "book_title", "video": "youtube_title"}
+DOC_PREFIXES = {"book": "book:", "video": "video:"}
+SUGGEST_MAX = int(os.getenv("SUGGEST_MAX", "8"))
+SUGGEST_MIN_CHARS = int(os.getenv("SUGGEST_MIN_CHARS", "2"))
+# Fuzzy matching (Levenshtein distance 1) for prefixes with no exact match
+SUGGEST_FUZZY_FALLBACK = os.getenv("SUGGEST_FUZZY_FALLBACK", "1") == "1"
+REBUILD_BATCH_SIZE = 500
+# Documents read per title when checking whether a deleted title is still in use
+TITLE_MATCH_LIMIT = 100
+
+# ----------------------------- WRITE ----------------------------- #
+
+def add_suggestions(kind: str, items: Iterable[Tuple[str, str]]) -> int:
+    """
+    Add (title, document key) pairs to the suggestion dictionary of `kind` in one pipeline.
+    Returns the number of titles sent. Failures are logged, never raised: autocomplete
+    must not fail an ingest.
+    """
+    items = [(title.strip(), key) for title, key in items if title and title.strip()]
+    if not items:
+        return 0
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        for title, key in items:
+            pipe.execute_command('FT.SUGADD', SUGGESTION_KEYS[kind], title, '1', 'PAYLOAD', key)
+        pipe.execute()
+    except Exception as e:
+        logger.error(f"Could not add {len(items)} {kind} suggestions: {e}")
+        return 0
+    return len(items)
+
+def remove_suggestions(kind: str, titles: Iterable[str]) -> int:
+    """
+    Remove titles from the suggestion dictionary of `kind`. Call after deleting the documents.
+    Titles are not unique: a title still carried by another document is kept and pointed at
+    that document instead. Returns the number removed.
+    """
+    titles = list(dict.fromkeys(title.strip() for title in titles if title and title.strip()))
+    if not titles:
+        return 0
+    try:
+        survivors = _surviving_keys(kind, titles)
+        pipe = redis_client.pipeline(transaction=False)
+        deletes = []
+        for title, key in survivors.items():
+            if key:
+                pipe.execute_command('FT.SUGADD', SUGGESTION_KEYS[kind], title, '1', 'PAYLOAD', key)
+            else:
+                pipe.execute_command('FT.SUGDEL', SUGGESTION_KEYS[kind], title)
+            deletes.append(not key)
+        return sum(int(reply) for is_delete, reply in zip(deletes, pipe.execute()) if is_delete)
+    except Exception as e:
+        logger.error(f"Could not remove {len(titles)} {kind} suggestions: {e}")
+        return 0
+
+def _surviving_keys(kind: str, titles: List[str]) -> Dict[str, Optional[str]]:
+    """
+    For each title, the key of a remaining document with exactly that title (case-insensitive),
+    or None if there is none. Titles whose lookup failed are left out, so they are kept.
+    """
+    field = TITLE_FIELDS[kind]
+    pipe = redis_client.pipeline(transaction=False)
+    for title in titles:
+        phrase = re.sub(r'([^\w\s])', r'\\\1', title)
+        pipe.execute_command('FT.SEARCH', SEARCH_INDEXES[kind], f'@{field}:"{phrase}"',
+                             'RETURN', '1', field, 'LIMIT', '0', str(TITLE_MATCH_LIMIT))
+    survivors = {}
+    for title, reply in zip(titles, pipe.execute(raise_on_error=False)):
+        if isinstance(reply, Exception):
+            logger.warning(f"Could not check remaining {kind}s titled '{title}': {reply}")
+            continue
+        # Phrase matches include longer titles; only an exact title keeps the suggestion
+        survivors[title] = next(
+            (key for key, fields in zip(reply[1::2], reply[2::2])
+             if dict(zip(fields[::2], fields[1::2])).get(field, "").strip().lower() == title.lower()),
+            None,
+        )
+    return survivors
+
+# ----------------------------- READ ----------------------------- #
+
+def get_suggestions(kind: str, prefix: str, fuzzy: Optional[bool] = None,
+                    max_results: int = SUGGEST_MAX) -> List[Dict[str, str]]:
+    """
+    Titles of `kind` starting with `prefix` (case-insensitive), best first.
+
+    Args:
+        kind (str): 'book' or 'video'.
+        prefix (str): What the user has typed so far.
+        fuzzy (bool): True/False to force fuzzy matching on/off; None to try an exact prefix
+            first and fall back to fuzzy matching (SUGGEST_FUZZY_FALLBACK) if it finds nothing.
+        max_results (int): Maximum suggestions.
+
+    Returns:
+        List[Dict[str, str]]: {"title": ..., "key": ...} per suggestion.
+    """
+    prefix = " ".join(prefix.split())
+    if len(prefix) < SUGGEST_MIN_CHARS:
+        return []
+    suggestions = _sugget(kind, prefix, bool(fuzzy), max_results)
+    if not suggestions and fuzzy is None and SUGGEST_FUZZY_FALLBACK:
+        suggestions = _sugget(kind, prefix, True, max_results)
+    return suggestions
+
+def _sugget(kind: str, prefix: str, fuzzy: bool, max_results: int) -> List[Dict[str, str]]:
+    args = [SUGGESTION_KEYS[kind], prefix, 'WITHPAYLOADS', 'MAX', str(max_results)]
+    if fuzzy:
+        args.append('FUZZY')
+    try:
+        res = redis_client.execute_command('FT.SUGGET', *args) or []
+    except Exception as e:
+        logger.error(f"FT.SUGGET error for {kind} prefix '{prefix}': {e}")
+        return []
+    return [{"title": title, "key": key} for title, key in zip(res[::2], res[1::2])]
+
+# ----------------------------- BACKFILL ----------------------------- #
+
+def rebuild_suggestions(kind: str) -> int:
+    """
+    Recreate the suggestion dictionary of `kind` from the stored documents.
+    Returns the number of titles added.
+    """
+    redis_client.delete(SUGGESTION_KEYS[kind])
+    added = 0
+    batch = []
+    for key in redis_client.scan_iter(match=f"{DOC_PREFIXES[kind]}*", count=REBUILD_BATCH_SIZE):
+        batch.append(key)
+        if len(batch) >= REBUILD_BATCH_SIZE:
+            added += _add_batch(kind, batch)
+            batch = []
+    added += _add_batch(kind, batch)
+    logger.info(f"Rebuilt {kind} suggestions: {added} titles")
+    return added
+
+def _add_batch(kind: str, keys: List[str]) -> int:
+    if not keys:
+        return 0
+    titles = redis_client.json().mget(keys, f"$.{TITLE_FIELDS[kind]}")
+    return add_suggestions(kind, [(title[0], key) for key, title in zip(keys, titles) if title])
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage title autocomplete dictionaries.")
+    parser.add_argument("command", choices=["rebuild"])
+    parser.add_argument("--kind", choices=list(SUGGESTION_KEYS), action="append",
+                        help="Dictionary to rebuild (repeatable, default: all)")
+    args = parser.parse_args()
+    print({kind: rebuild_suggestions(kind) for kind in (args.kind or SUGGESTION_KEYS)})
+
+if __name__ == "__main__":
+    main()
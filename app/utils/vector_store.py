@@ -0,0 +1,267 @@
+# app/utils/vector_store.py
+# Embedding storage formats for book:* and video:* documents, the matching vector index
+# schemas, and a migration command for existing keys.
+#
+# Formats (VECTOR_STORAGE_FORMAT):
+#   json    - embedding kept inside the JSON document as a float array (original layout)
+#   float32 - embedding moved to a companion hash `vec:<doc key>` as a FLOAT32 blob
+#   float16 - as float32, but FLOAT16 blobs (half the memory, needs RediSearch 2.10+)
+#
+# Usage:
+#   python -m app.utils.vector_store create-index --format float32
+#   python -m app.utils.vector_store migrate --format float32 [--prefix book:] [--dry-run]
+
+# Standard library imports
+import os
+import argparse
+from typing import Dict, List, Optional, Tuple
+
+# Third-party imports
+import numpy as np
+from dotenv import load_dotenv
+
+# App imports
+from app.utils.redis_manager import redis_client, redis_binary_client
+from app.utils.facets import facet_schema, facet_values, ensure_facet_fields
+from app.utils.logger import get_logger
+
+# Logger setup
+logger = get_logger(__name__)
+
+# Load environment variables
+load_dotenv()
+
+# ----------------------------- CONSTANTS ----------------------------- #
+JSON_FORMAT = "json"
+BINARY_FORMATS = {"float32": np.float32, "float16": np.float16}
+VECTOR_FORMAT = os.getenv("VECTOR_STORAGE_FORMAT", JSON_FORMAT).lower()
+if VECTOR_FORMAT != JSON_FORMAT and VECTOR_FORMAT not in BINARY_FORMATS:
+    raise RuntimeError(f"Unsupported VECTOR_STORAGE_FORMAT: {VECTOR_FORMAT}")
+
+EMBEDDING_DIM = 768
+DISTANCE_METRIC = "COSINE"
+VECTOR_KEY_PREFIX = "vec:"
+VECTOR_FIELD = "embedding"
+# Marks documents whose embedding lives in the companion hash, and in which format
+FORMAT_FIELD = "vector_format"
+DOC_PREFIXES = {"book": "book:", "video": "video:"}
+MIGRATION_BATCH_SIZE = 500
+
+# ----------------------------- ENCODING ----------------------------- #
+
+def encode_vector(vector: List[float], fmt: str = VECTOR_FORMAT) -> bytes:
+    """
+    Encode an embedding as a little-endian FLOAT32/FLOAT16 blob.
+    """
+    return np.asarray(vector, dtype=np.dtype(BINARY_FORMATS[fmt]).newbyteorder("<")).tobytes()
+
+def decode_vector(blob: bytes, fmt: str) -> List[float]:
+    """
+    Decode a FLOAT32/FLOAT16 blob back to a list of floats.
+    """
+    dtype = np.dtype(BINARY_FORMATS[fmt]).newbyteorder("<")
+    return np.frombuffer(blob, dtype=dtype).astype(np.float32).tolist()
+
+def vector_key(doc_key: str) -> str:
+    """
+    Companion hash key holding the binary embedding of a document.
+    """
+    return f"{VECTOR_KEY_PREFIX}{doc_key}"
+
+def doc_kind(doc_key: str) -> Optional[str]:
+    """
+    'book' or 'video' for a document key, from its prefix.
+    """
+    return next((kind for kind, prefix in DOC_PREFIXES.items() if doc_key.startswith(prefix)), None)
+
+def vector_hash(doc_key: str, doc: dict, blob: bytes) -> Dict[str, object]:
+    """
+    Companion hash fields: the embedding blob plus the document's facet tags, so KNN queries
+    on the vector index can be pre-filtered by facet.
+    """
+    kind = doc_kind(doc_key)
+    return {VECTOR_FIELD: blob, **(facet_values(kind, doc) if kind else {})}
+
+# ----------------------------- READ / WRITE ----------------------------- #
+
+def split_embedding(doc: dict, fmt: str = VECTOR_FORMAT) -> Tuple[dict, Optional[bytes]]:
+    """
+    For binary formats, return the document without its embedding plus the encoded blob.
+    For the json format the document is returned unchanged with no blob.
+    """
+    if fmt == JSON_FORMAT or doc.get(VECTOR_FIELD) is None:
+        return doc, None
+    stored = {k: v for k, v in doc.items() if k != VECTOR_FIELD}
+    stored[FORMAT_FIELD] = fmt
+    return stored, encode_vector(doc[VECTOR_FIELD], fmt)
+
+def queue_document(pipe, doc_key: str, doc: dict, fmt: str = VECTOR_FORMAT) -> int:
+    """
+    Queue the writes for one document on a JSON pipeline. Returns the number of queued commands.
+    """
+    stored, blob = split_embedding(doc, fmt)
+    pipe.set(doc_key, "$", stored)
+    if blob is None:
+        return 1
+    pipe.hset(vector_key(doc_key), mapping=vector_hash(doc_key, doc, blob))
+    return 2
+
+def store_document(json_client, doc_key: str, doc: dict, fmt: str = VECTOR_FORMAT) -> None:
+    """
+    Store a document (and its binary embedding, if any) atomically.
+    `json_client` is a RedisJSON command object, e.g. `redis_client.json()`.
+    """
+    pipe = json_client.pipeline(transaction=True)
+    queue_document(pipe, doc_key, doc, fmt)
+    pipe.execute()
+
+def load_embedding(doc_key: str, doc: Optional[dict] = None) -> Optional[List[float]]:
+    """
+    Return a document's embedding in either storage format.
+    Pass `doc` if the JSON document has already been fetched.
+    """
+    if doc is None:
+        doc = redis_client.json().get(doc_key)
+    if not doc:
+        return None
+    fmt = doc.get(FORMAT_FIELD)
+    if not fmt:
+        return doc.get(VECTOR_FIELD)
+    blob = redis_binary_client.hget(vector_key(doc_key), VECTOR_FIELD)
+    return decode_vector(blob, fmt) if blob else None
+
+def restore_embeddings(keys: List[str], docs: List[Optional[dict]]) -> List[Optional[dict]]:
+    """
+    Put binary embeddings back into already fetched documents (one pipelined HGET for the
+    batch) and drop the format marker, so readers see the same layout in every storage format.
+    """
+    binary = [(key, doc) for key, doc in zip(keys, docs) if doc and doc.get(FORMAT_FIELD)]
+    if not binary:
+        return docs
+    pipe = redis_binary_client.pipeline(transaction=False)
+    for key, _ in binary:
+        pipe.hget(vector_key(key), VECTOR_FIELD)
+    for (key, doc), blob in zip(binary, pipe.execute()):
+        fmt = doc.pop(FORMAT_FIELD)
+        doc[VECTOR_FIELD] = decode_vector(blob, fmt) if blob else None
+    return docs
+
+def get_document(doc_key: str) -> Optional[dict]:
+    """
+    Fetch a document with its embedding restored as a float list, whatever the storage format.
+    """
+    return restore_embeddings([doc_key], [redis_client.json().get(doc_key)])[0]
+
+# ----------------------------- INDEX SCHEMA ----------------------------- #
+
+def json_vector_field(fmt: str = "float32") -> List[str]:
+    """
+    Vector field for the JSON indexes (book_idx / video_idx) when embeddings stay in the document.
+    """
+    return ['$.embedding', 'AS', VECTOR_FIELD, 'VECTOR', 'HNSW', '6',
+            'TYPE', fmt.upper(), 'DIM', str(EMBEDDING_DIM), 'DISTANCE_METRIC', DISTANCE_METRIC]
+
+def vector_index_name(kind: str) -> str:
+    return f"{kind}_vec_idx"
+
+def vector_index_args(kind: str, fmt: str = VECTOR_FORMAT) -> List[str]:
+    """
+    FT.CREATE arguments for the hash index over companion vector keys (binary formats),
+    including the facet TAG fields used to pre-filter KNN queries.
+    """
+    return [
+        vector_index_name(kind), 'ON', 'HASH',
+        'PREFIX', '1', vector_key(DOC_PREFIXES[kind]),
+        'SCHEMA', VECTOR_FIELD, 'VECTOR', 'HNSW', '6',
+        'TYPE', fmt.upper(), 'DIM', str(EMBEDDING_DIM), 'DISTANCE_METRIC', DISTANCE_METRIC,
+        *facet_schema(kind, on_json=False),
+    ]
+
+def ensure_vector_index(kind: str, fmt: str = VECTOR_FORMAT) -> bool:
+    """
+    Create the companion vector index for `kind` ('book' or 'video') if it does not exist.
+    Returns True if the index was created.
+    """
+    if fmt == JSON_FORMAT:
+        return False
+    try:
+        redis_client.execute_command('FT.INFO', vector_index_name(kind))
+        ensure_facet_fields(vector_index_name(kind), kind, on_json=False)
+        return False
+    except Exception:
+        redis_client.execute_command('FT.CREATE', *vector_index_args(kind, fmt))
+        logger.info(f"Created vector index {vector_index_name(kind)} ({fmt})")
+        return True
+
+# ----------------------------- MIGRATION ----------------------------- #
+
+def _migrate_batch(keys: List[str], fmt: str) -> int:
+    """
+    Convert one batch of documents to `fmt`. Returns the number of converted documents.
+    """
+    docs = redis_client.json().mget(keys, "$")
+    to_json = fmt == JSON_FORMAT
+    pipe = redis_client.json().pipeline(transaction=False)
+    converted = 0
+    for key, result in zip(keys, docs):
+        doc = result[0] if result else None
+        if not doc or doc.get(FORMAT_FIELD, JSON_FORMAT) == fmt:
+            continue
+        embedding = load_embedding(key, doc)
+        if embedding is None:
+            logger.warning(f"No embedding to migrate for {key}")
+            continue
+        if to_json:
+            pipe.set(key, "$.embedding", embedding)
+            pipe.delete(key, f"$.{FORMAT_FIELD}")
+            pipe.unlink(vector_key(key))
+        else:
+            pipe.hset(vector_key(key), mapping=vector_hash(key, doc, encode_vector(embedding, fmt)))
+            pipe.set(key, f"$.{FORMAT_FIELD}", fmt)
+            pipe.delete(key, "$.embedding")
+        converted += 1
+    pipe.execute()
+    return converted
+
+def migrate(fmt: str, prefixes: List[str], batch_size: int = MIGRATION_BATCH_SIZE, dry_run: bool = False) -> Dict[str, int]:
+    """
+    Convert every JSON document under `prefixes` to storage format `fmt`, in batches.
+    Returns counts of scanned and converted documents.
+    """
+    counts = {"scanned": 0, "converted": 0}
+    for prefix in prefixes:
+        batch: List[str] = []
+        for key in redis_client.scan_iter(match=f"{prefix}*", count=batch_size, _type="ReJSON-RL"):
+            batch.append(key)
+            if len(batch) >= batch_size:
+                counts["scanned"] += len(batch)
+                counts["converted"] += 0 if dry_run else _migrate_batch(batch, fmt)
+                batch = []
+        if batch:
+            counts["scanned"] += len(batch)
+            counts["converted"] += 0 if dry_run else _migrate_batch(batch, fmt)
+        logger.info(f"Vector migration to {fmt} for '{prefix}': {counts}")
+    return counts
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage embedding storage formats.")
+    parser.add_argument("command", choices=["create-index", "migrate"])
+    parser.add_argument("--format", default=VECTOR_FORMAT, choices=[JSON_FORMAT, *BINARY_FORMATS])
+    parser.add_argument("--prefix", action="append", choices=list(DOC_PREFIXES.values()),
+                        help="Key prefix to migrate (repeatable, default: all)")
+    parser.add_argument("--batch-size", type=int, default=MIGRATION_BATCH_SIZE)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    if args.command == "create-index":
+        for kind in DOC_PREFIXES:
+            ensure_vector_index(kind, args.format)
+        return
+    if args.format != JSON_FORMAT:
+        for kind in DOC_PREFIXES:
+            ensure_vector_index(kind, args.format)
+    counts = migrate(args.format, args.prefix or list(DOC_PREFIXES.values()), args.batch_size, args.dry_run)
+    print(counts)
+
+if __name__ == "__main__":
+    main()
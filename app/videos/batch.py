@@ -0,0 +1,222 @@
+# app/videos/batch.py
+# Batch video ingestion: URL lists, playlists and channels through a bounded worker pool.
+#
+# Sources may be any mix of video URLs, bare 11-character video ids and playlist/channel URLs
+# (expanded with yt-dlp's flat extraction, which lists the videos without fetching each page).
+# Videos already stored in Redis are skipped in one pipelined EXISTS pass before any work starts.
+#
+# Usage:
+#   python -m app.videos.batch https://www.youtube.com/@somechannel --workers 4
+#   python -m app.videos.batch --file urls.txt
+
+# Standard library imports
+import os
+import re
+import json
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Tuple
+
+# Third-party imports
+import yt_dlp
+from dotenv import load_dotenv
+
+# App imports
+from app.videos.runner import run_video_pipeline
+from app.videos.utils import extract_video_id
+from app.utils.redis_manager import redis_client
+from app.utils.logger import get_logger
+
+# Logger setup
+logger = get_logger(__name__)
+
+# Load environment variables
+load_dotenv()
+
+# ----------------------------- CONSTANTS ----------------------------- #
+# Videos processed at the same time; LLM calls are still paced by the shared DeepInfra limiter
+VIDEO_BATCH_WORKERS = int(os.getenv("VIDEO_BATCH_WORKERS", "4"))
+# Upper bound on videos taken from one batch (after playlist/channel expansion)
+VIDEO_BATCH_MAX = int(os.getenv("VIDEO_BATCH_MAX", "500"))
+
+WATCH_URL = "https://www.youtube.com/watch?v={}"
+VIDEO_ID_RE = re.compile(r"^[0-9A-Za-z_-]{11}$")
+COLLECTION_RE = re.compile(r"youtube\.com/(?:playlist\b|@|channel/|c/|user/)")
+FLAT_OPTIONS = {"extract_flat": True, "quiet": True, "skip_download": True, "nocache": True}
+# Channel pages list their tabs (Videos, Shorts, Live) as nested playlists
+MAX_EXPAND_DEPTH = 2
+
+# Per-video statuses
+STATUS_QUEUED = "queued"
+STATUS_STORED = "stored"
+STATUS_SKIPPED = "skipped"
+STATUS_FAILED = "failed"
+
+# ----------------------------- SOURCES ----------------------------- #
+
+def split_sources(text: str) -> List[str]:
+    """
+    Split pasted text or file contents (one URL per line, or comma/space separated) into entries.
+    """
+    return [entry for entry in re.split(r"[\s,;]+", text or "") if entry]
+
+def is_collection_url(url: str) -> bool:
+    """
+    True for playlist and channel URLs (a watch URL that also carries list= is a single video).
+    """
+    return bool(COLLECTION_RE.search(url)) or ("list=" in url and "v=" not in url)
+
+def expand_collection(url: str, depth: int = 0) -> List[str]:
+    """
+    Video ids of a playlist or channel, via yt-dlp flat extraction (no per-video requests).
+    """
+    try:
+        with yt_dlp.YoutubeDL(FLAT_OPTIONS) as ydl:
+            info = ydl.extract_info(url, download=False) or {}
+    except Exception as e:
+        logger.error(f"Could not expand {url}: {e}")
+        return []
+
+    video_ids = []
+    for entry in info.get("entries") or []:
+        if not entry:
+            continue
+        if entry.get("ie_key") == "YoutubeTab" or entry.get("_type") == "playlist":
+            if depth < MAX_EXPAND_DEPTH and entry.get("url"):
+                video_ids.extend(expand_collection(entry["url"], depth + 1))
+        elif VIDEO_ID_RE.match(entry.get("id") or ""):
+            video_ids.append(entry["id"])
+    logger.info(f"Expanded {url} to {len(video_ids)} videos")
+    return video_ids
+
+def resolve_sources(entries: List[str]) -> Tuple[List[str], List[str]]:
+    """
+    Turn URLs, ids and playlist/channel URLs into unique video ids (in input order).
+
+    Returns:
+        Tuple[List[str], List[str]]: (video ids, entries that are not YouTube videos or collections)
+    """
+    video_ids, invalid = [], []
+    for entry in entries:
+        if is_collection_url(entry):
+            video_ids.extend(expand_collection(entry))
+        elif VIDEO_ID_RE.match(entry):
+            video_ids.append(entry)
+        else:
+            video_id = extract_video_id(entry)
+            if video_id:
+                video_ids.append(video_id)
+            else:
+                invalid.append(entry)
+    return list(dict.fromkeys(video_ids)), invalid
+
+def existing_video_ids(video_ids: List[str]) -> set:
+    """
+    Ids already stored as video:<id>, checked with one pipelined EXISTS pass.
+    """
+    if not video_ids:
+        return set()
+    pipe = redis_client.pipeline(transaction=False)
+    for video_id in video_ids:
+        pipe.exists(f"video:{video_id}")
+    return {video_id for video_id, exists in zip(video_ids, pipe.execute()) if exists}
+
+# ----------------------------- BATCH RUN ----------------------------- #
+
+def _run_one(video_id: str) -> Dict[str, object]:
+    started = time.perf_counter()
+    try:
+        result = run_video_pipeline(WATCH_URL.format(video_id))
+    except Exception as e:
+        result = {"error": f"❌ Unexpected error: {e}"}
+    seconds = round(time.perf_counter() - started, 2)
+    if isinstance(result, dict) and result.get("error"):
+        error = result["error"]
+        # Videos stored meanwhile, or without a transcript, are skipped rather than failed
+        status = STATUS_SKIPPED if error.startswith("⚠️") else STATUS_FAILED
+        return {"status": status, "detail": error, "seconds": seconds}
+    return {"status": STATUS_STORED, "detail": "✅ Stored", "seconds": seconds}
+
+def _summary(videos: Dict[str, dict], invalid: List[str], requested: int) -> Dict[str, int]:
+    counts = {STATUS_QUEUED: 0, STATUS_STORED: 0, STATUS_SKIPPED: 0, STATUS_FAILED: 0}
+    for video in videos.values():
+        counts[video["status"]] += 1
+    return {"requested": requested, "videos": len(videos), "invalid": len(invalid), **counts}
+
+def run_video_batch(entries: List[str], workers: int = VIDEO_BATCH_WORKERS,
+                    skip_existing: bool = True) -> Iterator[dict]:
+    """
+    Ingest many videos, yielding a progress report after every finished video.
+
+    Args:
+        entries (List[str]): Video URLs/ids and playlist/channel URLs.
+        workers (int): Videos processed concurrently.
+        skip_existing (bool): Mark videos already in Redis as skipped without processing them.
+
+    Yields:
+        dict: {"status", "summary", "invalid", "videos": {video_id: {"status", "detail", "seconds"}}}
+    """
+    video_ids, invalid = resolve_sources(entries)
+    if not video_ids:
+        yield {"error": "❌ No YouTube videos found in the input.", "invalid": invalid}
+        return
+    if len(video_ids) > VIDEO_BATCH_MAX:
+        logger.warning(f"Batch truncated to {VIDEO_BATCH_MAX} of {len(video_ids)} videos")
+        video_ids = video_ids[:VIDEO_BATCH_MAX]
+
+    existing = existing_video_ids(video_ids) if skip_existing else set()
+    videos = {
+        video_id: {"status": STATUS_SKIPPED, "detail": "⚠️ Already in Redis", "seconds": 0}
+        if video_id in existing else {"status": STATUS_QUEUED}
+        for video_id in video_ids
+    }
+    todo = [video_id for video_id in video_ids if video_id not in existing]
+    logger.info(f"Video batch: {len(todo)} to process, {len(existing)} already stored, {len(invalid)} invalid")
+
+    def report(status: str) -> dict:
+        return {"status": status, "summary": _summary(videos, invalid, len(entries)),
+                "invalid": invalid, "videos": videos}
+
+    yield report(f"⏳ Processing {len(todo)} videos with {max(1, workers)} workers")
+    if not todo:
+        yield report("✅ Nothing to process: all videos already stored")
+        return
+
+    executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="video-batch")
+    try:
+        futures = {executor.submit(_run_one, video_id): video_id for video_id in todo}
+        for done, future in enumerate(as_completed(futures), start=1):
+            video_id = futures[future]
+            videos[video_id] = future.result()
+            logger.info(f"[{done}/{len(todo)}] {video_id}: {videos[video_id]['status']}")
+            yield report(f"⏳ {done}/{len(todo)} processed")
+    finally:
+        # Stop queued videos if the caller goes away (e.g. the UI run is cancelled)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    summary = _summary(videos, invalid, len(entries))
+    icon = "✅" if not summary[STATUS_FAILED] else "⚠️"
+    yield report(f"{icon} Batch complete: {summary[STATUS_STORED]} stored, "
+                 f"{summary[STATUS_SKIPPED]} skipped, {summary[STATUS_FAILED]} failed")
+
+# ----------------------------- CLI ----------------------------- #
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingest many YouTube videos, playlists or channels.")
+    parser.add_argument("sources", nargs="*", help="Video URLs/ids or playlist/channel URLs")
+    parser.add_argument("--file", help="Text file with one URL per line")
+    parser.add_argument("--workers", type=int, default=VIDEO_BATCH_WORKERS)
+    args = parser.parse_args()
+
+    entries = list(args.sources)
+    if args.file:
+        with open(args.file, "r", encoding="utf-8") as f:
+            entries.extend(split_sources(f.read()))
+    report = {}
+    for report in run_video_batch(entries, workers=args.workers):
+        print(report.get("status") or report.get("error"))
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+if __name__ == "__main__":
+    main()
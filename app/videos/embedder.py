@@ -5,16 +5,22 @@
 # Standard library imports
 import os
 import json
+from typing import Optional
 
 # Third-party imports
-import requests
 import redis
 from dotenv import load_dotenv
 
 # App imports
 from app.videos.utils import stringify
 from app.utils.logger import get_logger
-from app.utils.keyvault_loader import DEEPINFRA_TOKEN
+from app.utils.metrics import timed
+from app.utils.embeddings import get_embedding
+from app.utils.vector_store import store_document
+from app.utils.search_cache import bump_index_version
+from app.utils.local_vector_index import local_index_add
+from app.utils.suggestions import add_suggestions
+from app.utils.artifacts import save_record
 
 # Logger setup
 logger = get_logger(__name__)
@@ -25,34 +31,13 @@ load_dotenv()
 # Constants
 INPUT_DIR = "app/data/processed_transcripts"
 OUTPUT_DIR = "app/data/formatted_jsons"
-EMBEDDING_MODEL = "BAAI/bge-base-en-v1.5"
+VIDEO_INDEX = "video_idx"
+ALREADY_STORED = "⚠️ Video already exists in Redis."
 
 REDIS_URL = os.getenv("REDIS_URL")
 redis_client = redis.from_url(REDIS_URL, decode_responses=False)
 redis_json = redis_client.json()
 
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-
-def get_embedding(text: str):
-    """
-    Get embedding vector for input text using DeepInfra API.
-    Args:
-        text (str): Input text
-    Returns:
-        list or None: Embedding vector if successful, else None
-    """
-    try:
-        resp = requests.post(
-            "https://api.deepinfra.com/v1/openai/embeddings",
-            headers={"Authorization": f"Bearer {DEEPINFRA_TOKEN}"},
-            json={"model": EMBEDDING_MODEL, "input": [text]}
-        )
-        resp.raise_for_status()
-        return resp.json()["data"][0]["embedding"]
-    except Exception as e:
-        logger.error(f"Embedding failed: {e}")
-        return None
-
 def build_searchable_text(fields):
     """
     Build a single string from multiple fields for embedding/search.
@@ -63,25 +48,25 @@ def build_searchable_text(fields):
     """
     return " ".join([stringify(f) for f in fields if f]).strip()
 
-def process_json_file(filepath):
+@timed("ingest.video.embed_store")
+def process_video_record(data: dict) -> Optional[dict]:
     """
-    Process a single processed_transcripts JSON file: embed, store in Redis, and log actions.
+    Embed a processed video record (output of process_transcript), store it in Redis, and log actions.
     Args:
-        filepath (str): Path to processed JSON file
+        data (dict): Processed record with videoId, videoTitle and metadata
+    Returns:
+        dict or None: Stored document, an error dict if the video is already stored, or None on failure
     """
+    video_id = data.get("videoId")
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        video_id = data.get("videoId")
         if not video_id:
-            logger.warning(f"Missing videoId in {filepath}")
-            return
+            logger.warning("Missing videoId in processed record")
+            return None
 
         redis_key = f"video:{video_id}"
         if redis_client.exists(redis_key):
             logger.info(f"Already in Redis: {redis_key}")
-            return
+            return {"error": ALREADY_STORED}
 
         metadata = data.get("metadata", {})
         classification = metadata.get("classification", {})
@@ -98,10 +83,8 @@ def process_json_file(filepath):
 
         embedding = get_embedding(searchable_text)
         if not embedding:
-            logger.error(f"Embedding failed for {filepath}")
-            return
-
-
+            logger.error(f"Embedding failed for {video_id}")
+            return None
 
         final_json = {
             "youtube_title": data.get("videoTitle", ""),
@@ -118,11 +101,30 @@ def process_json_file(filepath):
             "embedding": embedding,
         }
 
-        with open(os.path.join(OUTPUT_DIR, f"{video_id}.json"), "w", encoding="utf-8") as f:
-            json.dump(final_json, f, indent=4)
-
-        redis_json.set(redis_key, "$", final_json)
+        store_document(redis_json, redis_key, final_json)
+        version = bump_index_version(VIDEO_INDEX)
+        local_index_add("video", [(redis_key, embedding)], version)
+        add_suggestions("video", [(final_json["youtube_title"], redis_key)])
+        save_record(OUTPUT_DIR, video_id, final_json, stream="formatted_jsons", indent=4)
         logger.info(f"Stored in Redis: {redis_key}")
+        return final_json
 
     except Exception as e:
-        logger.error(f"Error processing {filepath}: {e}")
+        logger.error(f"Error processing {video_id}: {e}")
+        return None
+
+def process_json_file(filepath):
+    """
+    Embed and store a processed_transcripts JSON file saved earlier (e.g. to re-ingest artifacts).
+    Args:
+        filepath (str): Path to processed JSON file
+    Returns:
+        dict or None: As process_video_record
+    """
+    try:
+        with open(filepath, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception as e:
+        logger.error(f"Error reading {filepath}: {e}")
+        return None
+    return process_video_record(data)
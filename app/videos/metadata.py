@@ -0,0 +1,197 @@
+# app/videos/metadata.py
+# YouTube video metadata (title, duration, channel, upload date) from one yt-dlp extraction per
+# video id, cached in Redis so retries and re-runs never fetch it again.
+#
+# get_video_title() answers from the cache or YouTube's lightweight oEmbed endpoint, so the LLM
+# prompt can be built while the full extraction is still running.
+#
+# The provider is swappable: set METADATA_FIXTURE to a JSON file mapping video ids to metadata
+# (or call set_metadata_provider) to run without network access, e.g. in tests.
+
+# Standard library imports
+import os
+import json
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional
+
+# Third-party imports
+import requests
+import yt_dlp
+from dotenv import load_dotenv
+
+# App imports
+from app.utils.redis_manager import redis_client
+from app.utils.logger import get_logger
+from app.utils.metrics import timed
+
+# Logger setup
+logger = get_logger(__name__)
+
+# Load environment variables
+load_dotenv()
+
+# ----------------------------- CONSTANTS ----------------------------- #
+METADATA_CACHE_TTL = int(os.getenv("VIDEO_METADATA_TTL", str(7 * 24 * 60 * 60)))  # 7 days
+METADATA_FIXTURE = os.getenv("METADATA_FIXTURE", "")
+METADATA_KEY_PREFIX = "ytmeta:"
+UNKNOWN_TITLE = "Unknown Title"
+YDL_OPTIONS = {"quiet": True, "nocache": True, "skip_download": True}
+OEMBED_URL = "https://www.youtube.com/oembed"
+OEMBED_TIMEOUT_SECONDS = 5
+
+Metadata = Dict[str, Optional[object]]
+Provider = Callable[[str], Optional[Metadata]]
+TitleProvider = Callable[[str], Optional[str]]
+
+# Concurrent lookups of the same id in this process share one extraction
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+# ----------------------------- PROVIDERS ----------------------------- #
+
+def empty_metadata() -> Metadata:
+    return {"title": UNKNOWN_TITLE, "duration_seconds": None, "channel": None, "upload_date": None}
+
+@timed("ingest.video.metadata")
+def yt_dlp_provider(video_id: str) -> Optional[Metadata]:
+    """
+    Extract metadata for one video with yt-dlp (no download).
+    Args:
+        video_id (str): YouTube video ID
+    Returns:
+        dict or None: title, duration_seconds, channel, upload_date (YYYYMMDD), or None on failure
+    """
+    try:
+        with yt_dlp.YoutubeDL(YDL_OPTIONS) as ydl:
+            info = ydl.extract_info(f"https://www.youtube.com/watch?v={video_id}", download=False)
+    except Exception as e:
+        logger.warning(f"❌ Metadata fetch failed for {video_id}: {e}")
+        return None
+    if not info:
+        return None
+    return {
+        "title": info.get("title") or UNKNOWN_TITLE,
+        "duration_seconds": info.get("duration"),
+        "channel": info.get("channel") or info.get("uploader"),
+        "upload_date": info.get("upload_date"),
+    }
+
+@timed("ingest.video.title")
+def oembed_title(video_id: str) -> Optional[str]:
+    """
+    Title from YouTube's oEmbed endpoint (a small JSON reply, much faster than an extraction).
+    Args:
+        video_id (str): YouTube video ID
+    Returns:
+        str or None: Video title, or None on failure
+    """
+    try:
+        resp = requests.get(
+            OEMBED_URL,
+            params={"url": f"https://www.youtube.com/watch?v={video_id}", "format": "json"},
+            timeout=OEMBED_TIMEOUT_SECONDS,
+        )
+        resp.raise_for_status()
+        return resp.json().get("title") or None
+    except Exception as e:
+        logger.warning(f"oEmbed title fetch failed for {video_id}: {e}")
+        return None
+
+def fixture_provider(path: str) -> Provider:
+    """
+    Provider reading metadata from a JSON file: {"<video id>": {"title": ..., ...}, ...}.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        fixtures = json.load(f)
+
+    def provider(video_id: str) -> Optional[Metadata]:
+        data = fixtures.get(video_id)
+        return {**empty_metadata(), **data} if data else None
+
+    return provider
+
+_provider: Provider = fixture_provider(METADATA_FIXTURE) if METADATA_FIXTURE else yt_dlp_provider
+_use_cache = not METADATA_FIXTURE
+_title_provider: Optional[TitleProvider] = None if METADATA_FIXTURE else oembed_title
+
+def set_metadata_provider(provider: Provider, cache: bool = False,
+                          title_provider: Optional[TitleProvider] = None) -> None:
+    """
+    Replace the metadata source (e.g. with fixture_provider). The Redis cache is bypassed
+    unless `cache` is True. Without a `title_provider`, titles come from `provider` too.
+    """
+    global _provider, _use_cache, _title_provider
+    _provider, _use_cache, _title_provider = provider, cache, title_provider
+
+# ----------------------------- LOOKUP ----------------------------- #
+
+def _cached(video_id: str) -> Optional[Metadata]:
+    try:
+        raw = redis_client.get(f"{METADATA_KEY_PREFIX}{video_id}")
+        return json.loads(raw) if raw else None
+    except Exception as e:
+        logger.warning(f"Metadata cache read failed for {video_id}: {e}")
+        return None
+
+def _store(video_id: str, metadata: Metadata) -> None:
+    try:
+        redis_client.set(f"{METADATA_KEY_PREFIX}{video_id}", json.dumps(metadata), ex=METADATA_CACHE_TTL)
+    except Exception as e:
+        logger.warning(f"Metadata cache write failed for {video_id}: {e}")
+
+def get_video_metadata(video_id: str) -> Metadata:
+    """
+    Title, duration, channel and upload date of a video, from the Redis cache or one provider call.
+    Concurrent callers for the same id wait for the first one's result, failed or not.
+    Failed lookups are not cached and come back with an 'Unknown Title' and empty fields.
+    Args:
+        video_id (str): YouTube video ID
+    Returns:
+        dict: title, duration_seconds, channel, upload_date
+    """
+    with _inflight_lock:
+        future = _inflight.get(video_id)
+        owner = future is None
+        if owner:
+            future = _inflight[video_id] = Future()
+    if not owner:
+        return dict(future.result())
+
+    try:
+        metadata = _lookup(video_id)
+        future.set_result(metadata)
+        return dict(metadata)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        # Only after the result is published, so no caller can start a second extraction meanwhile
+        with _inflight_lock:
+            _inflight.pop(video_id, None)
+
+def _lookup(video_id: str) -> Metadata:
+    cached = _cached(video_id) if _use_cache else None
+    if cached:
+        return cached
+    metadata = _provider(video_id)
+    if not metadata:
+        return empty_metadata()
+    if _use_cache:
+        _store(video_id, metadata)
+    return metadata
+
+def get_video_title(video_id: str) -> str:
+    """
+    Title of a video without waiting for a full extraction when possible: cached metadata,
+    then the title provider (oEmbed), then get_video_metadata.
+    Args:
+        video_id (str): YouTube video ID
+    Returns:
+        str: Video title or 'Unknown Title' if not found
+    """
+    cached = _cached(video_id) if _use_cache else None
+    if cached:
+        return cached["title"]
+    title = _title_provider(video_id) if _title_provider else None
+    return title or get_video_metadata(video_id)["title"]
@@ -7,12 +7,11 @@
 
 # Standard library imports
 import os
-import json
-import time
 import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
 
 # Third-party imports
-import yt_dlp
 from dotenv import load_dotenv
 from youtube_transcript_api._api import YouTubeTranscriptApi
 from youtube_transcript_api._errors import (
@@ -22,8 +21,11 @@ from youtube_transcript_api._errors import (
 # App imports
 from app.videos.new_tags import activity_tags, goal_objective_tags
 from app.videos.prompt import prepare_prompt
+from app.videos.metadata import UNKNOWN_TITLE, get_video_metadata
 from app.videos.utils import get_video_title, extract_json_response, call_llm, ensure_dirs
+from app.utils.artifacts import save_record, save_text
 from app.utils.logger import get_logger
+from app.utils.metrics import timed
 
 # Ensure redis_client is imported or defined at the top of the file
 from app.utils.redis_manager import redis_client
@@ -38,6 +40,10 @@ TRANSCRIPTS_DIR = os.path.join(BASE_DIR, "transcripts")
 PROCESSED_DIR = os.path.join(BASE_DIR, "processed_transcripts")
 ensure_dirs([TRANSCRIPTS_DIR, PROCESSED_DIR])
 
+# Title and metadata lookups run here, next to the transcript fetch and the LLM call
+VIDEO_FETCH_WORKERS = int(os.getenv("VIDEO_FETCH_WORKERS", "8"))
+_fetch_pool = ThreadPoolExecutor(max_workers=VIDEO_FETCH_WORKERS, thread_name_prefix="video-fetch")
+
 def extract_video_id(url: str):
     """
     Extract YouTube video ID from URL.
@@ -49,9 +55,10 @@ def extract_video_id(url: str):
     m = re.search(r"(?:v=|\/)([0-9A-Za-z_-]{11})", url)
     return m.group(1) if m else None
 
+@timed("ingest.video.transcript")
 def fetch_transcript(video_id: str, lang="en"):
     """
-    Fetch YouTube transcript and save to file.
+    Fetch YouTube transcript (saved as an artifact per ARTIFACT_POLICY).
     Args:
         video_id (str): YouTube video ID
         lang (str): Language code
@@ -61,10 +68,7 @@ def fetch_transcript(video_id: str, lang="en"):
     try:
         transcript = YouTubeTranscriptApi().fetch(video_id, languages=[lang])
         text = " ".join(item.text for item in transcript)
-        path = os.path.join(TRANSCRIPTS_DIR, f"{video_id}.txt")
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(text)
-        logger.info(f"Saved transcript to {path}")
+        save_text(TRANSCRIPTS_DIR, video_id, text)
         return text
     except (NoTranscriptFound, TranscriptsDisabled, VideoUnavailable) as e:
         logger.error(f"Transcript error for {video_id}: {e}")
@@ -73,25 +77,23 @@ def fetch_transcript(video_id: str, lang="en"):
         logger.error(f"Unexpected error fetching transcript for {video_id}: {e}")
         return None
 
-def process_transcript(video_id: str, transcript: str):
-    def get_youtube_duration_seconds(video_id: str) -> int | None:
-        """Fetch YouTube video duration in seconds using yt_dlp."""
-        try:
-            url = f"https://www.youtube.com/watch?v={video_id}"
-            with yt_dlp.YoutubeDL({'quiet': True, 'nocache': True, 'skip_download': True}) as ydl:
-                info = ydl.extract_info(url, download=False)
-                if info is not None:
-                    return info.get("duration", None)
-                else:
-                    return None
-        except Exception as e:
-            logger.warning(f"❌ Duration fetch failed for {video_id}: {e}")
-            return None
+def submit_fetch(func: Callable, *args) -> Future:
+    """
+    Run a network fetch (e.g. video metadata) on the shared fetch pool.
     """
-    Process transcript with LLM and save structured JSON output.
+    return _fetch_pool.submit(func, *args)
+
+@timed("ingest.video.tagging")
+def process_transcript(video_id: str, transcript: str, title: Optional[str] = None,
+                       metadata_future: Optional[Future] = None):
+    """
+    Process transcript with LLM into a structured record (saved as an artifact per ARTIFACT_POLICY).
+    The full metadata lookup (duration, channel, ...) runs while the LLM call is in flight.
     Args:
         video_id (str): YouTube video ID
         transcript (str): Transcript text
+        title (str): Video title, fetched here if not given
+        metadata_future (Future): Pending get_video_metadata lookup, started here if not given
     Returns:
         dict or None: Processed result if successful, else None
     """
@@ -99,10 +101,12 @@ def process_transcript(video_id: str, transcript: str):
         logger.warning("Empty transcript. Skipping.")
         return None
 
-    title = get_video_title(video_id)
+    if metadata_future is None:
+        metadata_future = submit_fetch(get_video_metadata, video_id)
+    if title is None:
+        title = get_video_title(video_id)
     prompt = prepare_prompt(transcript, title, video_id, activity_tags, goal_objective_tags)
     logger.info(f"Sending transcript for video {video_id} to LLM...")
-    time.sleep(1)
     llm_response = call_llm(prompt)
     if not llm_response:
         logger.error("LLM did not return a response.")
@@ -113,17 +117,15 @@ def process_transcript(video_id: str, transcript: str):
         logger.error("Failed to extract JSON from LLM response.")
         return None
 
+    metadata = metadata_future.result()
     result["videoId"] = video_id
-    result["videoTitle"] = title
+    result["videoTitle"] = title if title != UNKNOWN_TITLE else metadata["title"]
     result["transcript_text"] = transcript
-    # Add duration in seconds
-    duration = get_youtube_duration_seconds(video_id)
-    result["duration_seconds"] = duration
-
-    output_path = os.path.join(PROCESSED_DIR, f"{video_id}.json")
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(result, f, indent=4)
-    logger.info(f"Saved processed JSON: {output_path}")
+    result["duration_seconds"] = metadata["duration_seconds"]
+    result["channel"] = metadata["channel"]
+    result["upload_date"] = metadata["upload_date"]
+
+    save_record(PROCESSED_DIR, video_id, result, stream="processed_transcripts", indent=4)
     return result
 
 def check_duplicate_by_video_title(video_title: str) -> bool:
@@ -4,15 +4,16 @@
 
 # Standard library imports
 import os
-import json
-import time
 
 # App imports
-from app.videos.utils import extract_video_id
-from app.videos.processor import fetch_transcript, process_transcript
-from app.videos.embedder import process_json_file
+from app.videos.utils import extract_video_id, get_video_title
+from app.videos.metadata import get_video_metadata
+from app.videos.processor import fetch_transcript, process_transcript, submit_fetch
+from app.videos.embedder import ALREADY_STORED, process_video_record
 from app.utils.redis_manager import redis_client
+from app.utils.artifacts import remove_files
 from app.utils.logger import get_logger
+from app.utils.metrics import timed
 
 
 # Logger setup
@@ -26,59 +27,37 @@ FORMATTED_DIR = "app/data/formatted_jsons"
 
 def ensure_dirs():
     """
-    Ensure all necessary folders exist before writing files.
+    Ensure all artifact folders exist.
     """
     os.makedirs(TRANSCRIPTS_DIR, exist_ok=True)
     os.makedirs(PROCESSED_DIR, exist_ok=True)
     os.makedirs(FORMATTED_DIR, exist_ok=True)
 
-def wait_for_valid_json(path, timeout=20, interval=1):
-    """
-    Wait until file contains valid JSON with key fields.
-    Args:
-        path (str): Path to JSON file
-        timeout (int): Max seconds to wait
-        interval (int): Poll interval in seconds
-    Returns:
-        bool: True if valid JSON found, else False
-    """
-    waited = 0
-    while waited < timeout:
-        if os.path.exists(path) and os.path.getsize(path) > 0:
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    if data.get("videoTitle") and data.get("metadata"):
-                        return True
-            except json.JSONDecodeError:
-                pass
-        time.sleep(interval)
-        waited += interval
-    return False
-
 def delete_intermediate_files(video_id):
     """
     Remove transient files if video processing failed.
     Args:
         video_id (str): YouTube video ID
     """
-    for folder, ext in [
-        (TRANSCRIPTS_DIR, ".txt"),
-        (PROCESSED_DIR, ".json"),
-        (FORMATTED_DIR, ".json")
-    ]:
-        path = os.path.join(folder, f"{video_id}{ext}")
-        if os.path.exists(path):
-            os.remove(path)
+    remove_files([
+        os.path.join(folder, f"{video_id}{ext}")
+        for folder, ext in [
+            (TRANSCRIPTS_DIR, ".txt"),
+            (PROCESSED_DIR, ".json"),
+            (FORMATTED_DIR, ".json")
+        ]
+    ])
 
 
+@timed("ingest.video.total")
 def run_video_pipeline(youtube_url: str):
     """
     Run the full video processing pipeline: transcript, LLM, embedding, and storage.
+    Stages hand their results over in memory; files are only written as artifacts.
     Args:
         youtube_url (str): YouTube video URL
     Returns:
-        dict or str: Final JSON string or error dict
+        dict: Stored document or error dict
     """
     video_id = extract_video_id(youtube_url)
     if not video_id:
@@ -91,11 +70,16 @@ def run_video_pipeline(youtube_url: str):
     redis_key = f"video:{video_id}"
     if redis_client.exists(redis_key):
         logger.warning(f"Video already exists in Redis: {redis_key}")
-        return {"error": "⚠️ Video already exists in Redis."}
+        return {"error": ALREADY_STORED}
 
     try:
         transcript_path = os.path.join(TRANSCRIPTS_DIR, f"{video_id}.txt")
 
+        # The title (fast) and the full metadata (one yt-dlp extraction) are fetched while the
+        # transcript is; only the title is needed before the LLM call
+        title_future = submit_fetch(get_video_title, video_id)
+        metadata_future = submit_fetch(get_video_metadata, video_id)
+
         # Phase 1: Fetch transcript
         if os.path.exists(transcript_path):
             with open(transcript_path, "r", encoding="utf-8") as f:
@@ -108,30 +92,26 @@ def run_video_pipeline(youtube_url: str):
                 return {"error": "⚠️ Empty transcript. Skipping."}
 
         # Phase 1: Process transcript
-        result = process_transcript(video_id, transcript)
+        result = process_transcript(video_id, transcript, title=title_future.result(),
+                                    metadata_future=metadata_future)
         if not result:
             delete_intermediate_files(video_id)
             logger.error(f"Phase 1 failed for {video_id}")
             return {"error": "❌ Phase 1 failed"}
 
-        json_path = os.path.join(PROCESSED_DIR, f"{video_id}.json")
-        if not wait_for_valid_json(json_path):
+        # Phase 2: Embedding and storage
+        document = process_video_record(result)
+        if document and document.get("error"):
+            # Stored meanwhile by another worker or session: a skip, and its artifacts are not ours
+            logger.warning(f"Video already exists in Redis: {redis_key}")
+            return document
+        if not document:
             delete_intermediate_files(video_id)
-            logger.error(f"Processed JSON is invalid or incomplete for {video_id}")
-            return {"error": "❌ Processed JSON is invalid or incomplete."}
-
-        # Phase 2: Embedding
-        process_json_file(json_path)
-
-        # Final JSON
-        formatted_path = os.path.join(FORMATTED_DIR, f"{video_id}.json")
-        if os.path.exists(formatted_path):
-            with open(formatted_path, "r", encoding="utf-8") as f:
-                logger.info(f"Pipeline complete for {video_id}")
-                return f.read()
-        else:
-            logger.error(f"Final JSON not found for {video_id}")
-            return {"error": "❌ Final JSON not found."}
+            logger.error(f"Embedding/storage failed for {video_id}")
+            return {"error": "❌ Embedding or storage failed."}
+
+        logger.info(f"Pipeline complete for {video_id}")
+        return document
 
     except Exception as e:
         delete_intermediate_files(video_id)
@@ -9,14 +9,15 @@ import re
 from typing import Optional
 
 # Third-party imports
-import requests
-from bs4 import BeautifulSoup
 from openai import OpenAI
 from dotenv import load_dotenv
 from app.utils.keyvault_loader import DEEPINFRA_TOKEN
+from app.utils.rate_limiter import deepinfra_limiter
 
 # App imports
+from app.videos.metadata import get_video_title as metadata_title
 from app.utils.logger import get_logger
+from app.utils.metrics import timed
 
 # Logger setup
 logger = get_logger(__name__)
@@ -49,22 +50,15 @@ def extract_video_id(url: str) -> Optional[str]:
 
 def get_video_title(video_id: str):
     """
-    Fetch the title of a YouTube video by ID.
+    Fetch the title of a YouTube video by ID (from the metadata service).
     Args:
         video_id (str): YouTube video ID
     Returns:
         str: Video title or 'Unknown Title' if not found
     """
-    try:
-        url = f"https://www.youtube.com/watch?v={video_id}"
-        resp = requests.get(url)
-        soup = BeautifulSoup(resp.text, "html.parser")
-        title = soup.find("title")
-        return title.text.replace(" - YouTube", "").strip() if title else "Unknown Title"
-    except Exception as e:
-        logger.error(f"Title fetch failed: {e}")
-        return "Unknown Title"
+    return metadata_title(video_id)
 
+@timed("ingest.video.llm")
 def call_llm(prompt: str):
     """
     Call the DeepInfra LLM with a prompt and return the response.
@@ -78,6 +72,7 @@ def call_llm(prompt: str):
             api_key=DEEPINFRA_TOKEN,
             base_url="https://api.deepinfra.com/v1/openai",
         )
+        deepinfra_limiter.acquire()
         completion = openai.chat.completions.create(
             model=LLM_MODEL,
             messages=[{"role": "user", "content": prompt}],
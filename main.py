@@ -13,6 +13,9 @@ import gradio as gr
 # App imports
 from app.ui.ui import launch
 from app.utils.logger import get_logger
+from app.utils.index_manager import ensure_indexes
+from app.utils.local_vector_index import start_local_index
+from app.utils.metrics import start_metrics_server
 
 # Logger setup
 logger = get_logger(__name__)
@@ -29,6 +32,12 @@ def main():
     logger.info("Server will run on: http://127.0.0.1:7861")
     logger.info(f"Admin username: {os.getenv('ADMIN_USERNAME', 'admin')}")
     logger.info(f"Environment: {os.getenv('ENVIRONMENT', 'staging')}")
+    # Create missing search indexes; changed schemas are rebuilt in the background
+    ensure_indexes()
+    # Load the optional in-process vector index (LOCAL_VECTOR_INDEX=1)
+    start_local_index()
+    # Serve stage latency percentiles and cache stats next to the UI
+    start_metrics_server()
     # Start background cleanup thread
     start_cleanup_thread()
     logger.info("Background cleanup thread started")
@@ -0,0 +1,227 @@
+# tests/conftest.py
+# Shared fixtures. app.utils.redis_manager connects (and pings) Redis and
+# app.utils.keyvault_loader reads Azure Key Vault at import time, so both are replaced here by
+# offline stand-ins before any app module is imported.
+
+# Standard library imports
+import os
+import sys
+import types
+import fnmatch
+
+# Third-party imports
+import pytest
+
+
+class FakePipeline:
+    """
+    Queues client calls and runs them in order on execute().
+    """
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+        return queue
+
+    def execute(self, raise_on_error=True):
+        results = []
+        for name, args, kwargs in self.calls:
+            try:
+                results.append(getattr(self.client, name)(*args, **kwargs))
+            except Exception as e:
+                if raise_on_error:
+                    raise
+                results.append(e)
+        self.calls = []
+        return results
+
+
+class FakeJSON:
+    """
+    RedisJSON commands over the documents stored in a FakeRedis.
+    """
+    def __init__(self, client):
+        self.client = client
+
+    def set(self, key, path, obj):
+        self.client.data[key] = obj
+        return True
+
+    def get(self, key, path="$"):
+        return self.client.data.get(key)
+
+    def mget(self, keys, path):
+        docs = [self.client.data.get(key) for key in keys]
+        if path == "$":
+            return [[dict(doc)] if isinstance(doc, dict) else None for doc in docs]
+        field = path.removeprefix("$.")
+        return [[doc[field]] if isinstance(doc, dict) and field in doc else None for doc in docs]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def __getattr__(self, name):
+        # JSON pipelines also carry plain commands (e.g. HSET of a companion vector hash)
+        return getattr(self.client, name)
+
+
+class FakeRedis:
+    """
+    The subset of redis-py used by the modules under test. FT.* commands go to handlers
+    registered in `commands`; suggestion dictionaries are emulated with plain dicts.
+    """
+    def __init__(self, data=None):
+        self.data = {} if data is None else data
+        self.ttls = {}
+        self.commands = {}
+        self.calls = []
+
+    def flushall(self):
+        self.data.clear()
+        self.ttls.clear()
+        self.commands.clear()
+        self.calls.clear()
+
+    def ping(self):
+        return True
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        if ex is not None:
+            self.ttls[key] = ex
+        return True
+
+    def incr(self, key, amount=1):
+        self.data[key] = str(int(self.data.get(key, 0)) + amount)
+        return int(self.data[key])
+
+    def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def zadd(self, key, mapping):
+        zset = self.data.setdefault(key, {})
+        added = sum(1 for member in mapping if member not in zset)
+        zset.update(mapping)
+        return added
+
+    def zremrangebyscore(self, key, low, high):
+        zset = self.data.get(key, {})
+        low, high = float(low), float(high)
+        removed = [member for member, score in zset.items() if low <= score <= high]
+        for member in removed:
+            del zset[member]
+        return len(removed)
+
+    def zcard(self, key):
+        return len(self.data.get(key, {}))
+
+    def zpopmin(self, key, count=1):
+        zset = self.data.get(key, {})
+        popped = sorted(zset.items(), key=lambda item: item[1])[:count]
+        for member, _ in popped:
+            del zset[member]
+        return popped
+
+    def hset(self, key, field=None, value=None, mapping=None):
+        fields = self.data.setdefault(key, {})
+        updates = dict(mapping or {})
+        if field is not None:
+            updates[field] = value
+        added = sum(1 for name in updates if name not in fields)
+        fields.update(updates)
+        return added
+
+    def hget(self, key, field):
+        return self.data.get(key, {}).get(field)
+
+    def exists(self, *keys):
+        return sum(1 for key in keys if key in self.data)
+
+    def delete(self, *keys):
+        return sum(1 for key in keys if self.data.pop(key, None) is not None)
+
+    unlink = delete
+
+    def expire(self, key, seconds):
+        if key not in self.data:
+            return False
+        self.ttls[key] = seconds
+        return True
+
+    def scan_iter(self, match="*", count=None):
+        return iter([key for key in list(self.data) if fnmatch.fnmatch(key, match)])
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def json(self):
+        return FakeJSON(self)
+
+    def eval(self, script, numkeys, *keys_and_args):
+        # Only the compare-and-expire / compare-and-delete lock scripts are supported
+        keys, args = keys_and_args[:numkeys], keys_and_args[numkeys:]
+        self.calls.append(("EVAL", keys, args))
+        if self.data.get(keys[0]) != args[0]:
+            return 0
+        if "'expire'" in script:
+            return int(self.expire(keys[0], int(args[1])))
+        if "'del'" in script:
+            return self.delete(keys[0])
+        raise NotImplementedError(script)
+
+    def execute_command(self, command, *args):
+        command = command.upper()
+        self.calls.append((command, *args))
+        if command in self.commands:
+            return self.commands[command](*args)
+        if command == "FT.SUGADD":
+            key, title = args[0], args[1]
+            payload = args[args.index("PAYLOAD") + 1] if "PAYLOAD" in args else None
+            self.data.setdefault(key, {})[title] = payload
+            return len(self.data[key])
+        if command == "FT.SUGDEL":
+            return 1 if self.data.get(args[0], {}).pop(args[1], None) is not None else 0
+        if command == "FT.SUGGET":
+            key, prefix = args[0], args[1].lower()
+            reply = []
+            for title, payload in self.data.get(key, {}).items():
+                if title.lower().startswith(prefix):
+                    reply.extend([title, payload])
+            return reply
+        raise NotImplementedError(command)
+
+
+fake_redis = FakeRedis()
+# Both clients talk to the same server, only decoding differs
+fake_binary_redis = FakeRedis(fake_redis.data)
+
+redis_manager = types.ModuleType("app.utils.redis_manager")
+redis_manager.redis_client = fake_redis
+redis_manager.redis_binary_client = fake_binary_redis
+sys.modules["app.utils.redis_manager"] = redis_manager
+
+# Modules that build their own client from REDIS_URL (it never connects in tests)
+os.environ.setdefault("REDIS_URL", "redis://localhost:6379/0")
+
+keyvault_loader = types.ModuleType("app.utils.keyvault_loader")
+keyvault_loader.DEEPINFRA_TOKEN = "test-token"
+sys.modules["app.utils.keyvault_loader"] = keyvault_loader
+
+
+@pytest.fixture
+def redis():
+    """
+    The in-memory Redis used by every app module, emptied before each test.
+    """
+    fake_redis.flushall()
+    fake_binary_redis.flushall()
+    return fake_redis
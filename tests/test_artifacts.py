@@ -0,0 +1,75 @@
+import os
+import json
+
+from app.utils import artifacts
+from app.utils.artifacts import CompactStream, read_compact_stream
+
+
+def test_compact_stream_writes_vector_before_its_row(tmp_path):
+    stream = CompactStream(str(tmp_path), "books")
+    stream.append({"title": "A", "embedding": [1.0, 2.0, 3.0]})
+
+    # The vector is on disk as soon as it is appended; the row follows on flush
+    assert os.path.getsize(tmp_path / "books.00000.f32") == 3 * 4
+    stream.flush()
+    row = json.loads((tmp_path / "books.jsonl").read_text(encoding="utf-8"))
+    assert "embedding" not in row and row["vector_file"] == "books.00000.f32"
+    assert list(read_compact_stream(str(tmp_path), "books")) == [{"title": "A", "embedding": [1.0, 2.0, 3.0]}]
+
+
+def test_compact_stream_keeps_its_files_open(tmp_path, monkeypatch):
+    opened = []
+    real_open = open
+    monkeypatch.setattr("builtins.open", lambda path, *a, **kw: opened.append(os.path.basename(path)) or real_open(path, *a, **kw))
+    monkeypatch.setattr(artifacts, "VECTORS_PER_PART", 2)
+    stream = CompactStream(str(tmp_path), "books")
+    for i in range(5):
+        stream.append({"id": i, "embedding": [float(i)]})
+    stream.close()
+    monkeypatch.undo()
+
+    assert opened == ["books.00000.f32", "books.jsonl", "books.00001.f32", "books.00002.f32"]
+    assert len(list(read_compact_stream(str(tmp_path), "books"))) == 5
+
+
+def test_writer_flushes_streams_when_the_queue_drains(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifacts, "ARTIFACT_POLICY", artifacts.POLICY_COMPACT)
+    monkeypatch.setattr(artifacts, "_streams", {})
+    for i in range(3):
+        artifacts.save_record(str(tmp_path), f"book_{i}", {"id": i, "embedding": [float(i)]}, "books")
+    artifacts.flush()
+
+    assert [record["id"] for record in read_compact_stream(str(tmp_path), "books")] == [0, 1, 2]
+    artifacts._close_streams()
+
+
+def test_compact_stream_round_trip_across_parts(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifacts, "VECTORS_PER_PART", 2)
+    stream = CompactStream(str(tmp_path), "videos")
+    records = [{"id": i, "embedding": [float(i), float(-i)]} for i in range(5)]
+    for record in records:
+        stream.append(record)
+    stream.append({"id": "no-vector"})
+    stream.close()
+
+    assert sorted(p.name for p in tmp_path.glob("videos.*.f32")) == [
+        "videos.00000.f32", "videos.00001.f32", "videos.00002.f32"
+    ]
+    assert list(read_compact_stream(str(tmp_path), "videos")) == records + [{"id": "no-vector"}]
+
+
+def test_new_stream_does_not_append_to_an_interrupted_part(tmp_path):
+    first = CompactStream(str(tmp_path), "books")
+    first.append({"id": 1, "embedding": [1.0]})
+    first.close()
+    # Simulate a crash halfway through a vector write
+    with open(tmp_path / "books.00000.f32", "ab") as f:
+        f.write(b"\x00\x00")
+
+    second = CompactStream(str(tmp_path), "books")
+    second.append({"id": 2, "embedding": [2.0]})
+    second.close()
+
+    assert list(read_compact_stream(str(tmp_path), "books")) == [
+        {"id": 1, "embedding": [1.0]}, {"id": 2, "embedding": [2.0]}
+    ]
@@ -0,0 +1,63 @@
+import pandas as pd
+
+from app.books.processor import (
+    check_duplicate_by_title, find_existing_titles, prepare_book_frame, prepare_book_row
+)
+
+ROWS = [
+    {"Book Title": "Yoga Basics", "Dimension*": "Physical", "Author": "A. Author"},
+    {"Book Title": "Title Only", "Dimension*": "", "Author": ""},
+    {"Book Title": "", "Dimension*": "Physical", "Author": "Nobody"},
+    {"Book Title": "  Padded  ", "Dimension*": "  Mental ", "Author": ""},
+]
+
+
+def test_frame_preparation_matches_row_preparation():
+    frame = pd.DataFrame(ROWS, dtype=str)
+    assert prepare_book_frame(frame) == [prepare_book_row(row) for row in ROWS]
+
+
+def test_title_only_rows_are_complete():
+    prepared = prepare_book_frame(pd.DataFrame(ROWS, dtype=str))
+    assert prepared[1]["book_title"] == "Title Only"
+    assert prepared[1]["searchable_text"] == "Title Only"
+    assert prepared[2] is None
+
+
+def term_search(stored_titles):
+    """
+    FT.SEARCH stand-in: a title query matches books whose title has every query word.
+    """
+    def ft_search(index, query, *args):
+        words = query.split(":", 1)[1].split()
+        return [sum(1 for title in stored_titles if all(word in title.lower().split() for word in words))]
+    return ft_search
+
+
+def test_existing_titles_keep_the_term_match_rule(redis):
+    redis.commands["FT.SEARCH"] = term_search(["Morning Yoga Flow", "Running Form"])
+
+    existing = find_existing_titles(["Yoga Flow", "Yoga: Flow!", "Evening Yoga", "Running", "?!"])
+    assert existing == {"Yoga Flow", "Yoga: Flow!", "Running"}
+    assert check_duplicate_by_title("Morning Yoga")
+    assert not check_duplicate_by_title("Evening Yoga")
+
+
+def test_existing_titles_are_checked_in_one_pipeline(redis, monkeypatch):
+    pipelines = []
+    make_pipeline = redis.pipeline
+    monkeypatch.setattr(redis, "pipeline", lambda **kwargs: pipelines.append(kwargs) or make_pipeline(**kwargs))
+    redis.commands["FT.SEARCH"] = term_search([])
+
+    find_existing_titles([f"Book {i}" for i in range(50)])
+    assert pipelines == [{"transaction": False}]
+    assert len([call for call in redis.calls if call[0] == "FT.SEARCH"]) == 50
+    assert all(call[3:] == ("LIMIT", "0", "0") for call in redis.calls)
+
+
+def test_failed_lookup_counts_as_new(redis):
+    def failing_search(*args):
+        raise RuntimeError("index unavailable")
+
+    redis.commands["FT.SEARCH"] = failing_search
+    assert find_existing_titles(["Yoga Flow"]) == set()
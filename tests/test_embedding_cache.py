@@ -0,0 +1,62 @@
+import pytest
+
+from app.utils import embedding_cache
+from app.utils.embedding_cache import CACHE_INDEX_KEY, cache_key, get_cached_embeddings
+
+
+@pytest.fixture
+def cache(redis, monkeypatch):
+    monkeypatch.setattr(embedding_cache, "_local_cache", embedding_cache.OrderedDict())
+    monkeypatch.setattr(embedding_cache, "REDIS_CACHE_ENABLED", True)
+    return embedding_cache
+
+
+def counting_compute(calls):
+    def compute(texts):
+        calls.append(list(texts))
+        return [None if text == "fail" else [float(len(text)), 1.0] for text in texts]
+    return compute
+
+
+def test_only_uncached_unique_texts_are_computed(cache):
+    calls = []
+    compute = counting_compute(calls)
+
+    first = get_cached_embeddings(["yoga", "run", "yoga"], "model", compute)
+    second = get_cached_embeddings(["run", "swim"], "model", compute)
+
+    assert calls == [["yoga", "run"], ["swim"]]
+    assert first == [[4.0, 1.0], [3.0, 1.0], [4.0, 1.0]]
+    assert second == [[3.0, 1.0], [4.0, 1.0]]
+
+
+def test_whitespace_variants_share_an_entry_but_models_do_not():
+    assert cache_key("model", "deep  breath\n") == cache_key("model", "deep breath")
+    assert cache_key("model", "deep breath") != cache_key("other", "deep breath")
+
+
+def test_redis_tier_serves_other_processes(cache):
+    calls = []
+    get_cached_embeddings(["yoga"], "model", counting_compute(calls))
+    cache._local_cache.clear()  # a fresh process
+
+    assert get_cached_embeddings(["yoga"], "model", counting_compute(calls)) == [[4.0, 1.0]]
+    assert calls == [["yoga"]]
+
+
+def test_failures_are_not_cached(cache):
+    calls = []
+    assert get_cached_embeddings(["fail"], "model", counting_compute(calls)) == [None]
+    assert get_cached_embeddings(["fail"], "model", counting_compute(calls)) == [None]
+    assert calls == [["fail"], ["fail"]]
+
+
+def test_oldest_redis_entries_are_evicted(cache, monkeypatch):
+    binary = cache.redis_binary_client
+    monkeypatch.setattr(cache, "REDIS_CACHE_MAX_ENTRIES", 2)
+    for text in ["a", "bb", "ccc"]:
+        get_cached_embeddings([text], "model", counting_compute([]))
+
+    assert binary.zcard(CACHE_INDEX_KEY) == 2
+    assert binary.get(cache_key("model", "ccc")) is not None
+    assert binary.exists(*(cache_key("model", text) for text in ["a", "bb", "ccc"])) == 2
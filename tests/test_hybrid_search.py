@@ -0,0 +1,40 @@
+import pytest
+
+from app.utils import common
+from app.utils.common import fuse_rankings
+
+
+def test_documents_in_both_rankings_win():
+    fused = fuse_rankings([["a", "b", "c"], ["c", "d"]], [1.0, 1.0], k=60)
+    assert fused[0][0] == "c"
+    assert fused[0][1] == pytest.approx(1 / 63 + 1 / 61)
+    assert fused[0][2] == [3, 1]
+    assert dict((key, ranks) for key, _, ranks in fused)["d"] == [None, 2]
+
+
+def test_weights_shift_the_order():
+    rankings = [["text"], ["vector"]]
+    assert [key for key, _, _ in fuse_rankings(rankings, [2.0, 1.0])] == ["text", "vector"]
+    assert [key for key, _, _ in fuse_rankings(rankings, [1.0, 2.0])] == ["vector", "text"]
+
+
+def test_ties_keep_first_seen_order_and_duplicates_use_the_best_rank():
+    assert [key for key, _, _ in fuse_rankings([["a", "b"], ["b", "a"]], [1.0, 1.0])] == ["a", "b"]
+    assert fuse_rankings([["a", "a"]], [1.0], k=0)[0][2] == [1]
+    assert fuse_rankings([[], []], [1.0, 1.0]) == []
+
+
+def test_hybrid_search_annotates_fused_documents(redis, monkeypatch):
+    redis.json().set("book:1", "$", {"book_title": "Yoga"})
+    redis.json().set("book:2", "$", {"book_title": "Running"})
+    monkeypatch.setattr(common, "text_search_keys", lambda *args: ["book:2", "book:1"])
+    monkeypatch.setattr(common, "get_embedding", lambda query: [0.1, 0.2])
+    monkeypatch.setattr(common, "vector_search", lambda *args: [("book:1", 0.9)])
+
+    keys, data = common._hybrid_search("book", "yoga", 5, 1.0, 1.0)
+
+    assert keys == ["book:1", "book:2"]
+    assert data[0]["hybrid_scores"] == {
+        "rrf": round(1 / 62 + 1 / 61, 6), "text_rank": 2, "vector_rank": 1, "vector_similarity": 0.9
+    }
+    assert data[1]["hybrid_scores"]["vector_rank"] is None
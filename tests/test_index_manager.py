@@ -0,0 +1,86 @@
+import pytest
+
+from app.utils import index_manager
+from app.utils.index_manager import BUILD_LOCK_PREFIX, build_and_switch, ensure_index, ensure_indexes, versioned_index_name
+
+
+@pytest.fixture
+def search(redis, monkeypatch):
+    """
+    Minimal FT.CREATE / FT.INFO / alias emulation; `indexing` holds builds still scanning.
+    """
+    state = {"indexes": set(), "aliases": {}, "indexing": {}}
+
+    def info(name):
+        target = state["aliases"].get(name, name)
+        if target not in state["indexes"]:
+            raise Exception("Unknown index name")
+        step = state["indexing"].get(target)
+        indexing = bool(step and step())
+        return ["index_name", target, "indexing", int(indexing), "percent_indexed", 0.5 if indexing else 1,
+                "num_docs", 0, "hash_indexing_failures", 0]
+
+    def alias(name, target):
+        state["aliases"][name] = target
+        return "OK"
+
+    redis.commands.update({
+        "FT.CREATE": lambda name, *args: state["indexes"].add(name) or "OK",
+        "FT.INFO": info,
+        "FT.ALIASADD": alias,
+        "FT.ALIASUPDATE": alias,
+        "FT.DROPINDEX": lambda name: state["indexes"].discard(name) or "OK",
+    })
+    monkeypatch.setattr(index_manager, "BUILD_POLL_SECONDS", 0)
+    return state
+
+
+def test_new_index_is_created_and_aliased(search):
+    assert ensure_index("book") == "created"
+    assert search["aliases"]["book_idx"] == versioned_index_name("book")
+    assert ensure_index("book") == "current"
+
+
+def test_changed_schema_is_rebuilt_then_switched(search, redis):
+    search["indexes"].add("book_idx_old")
+    search["aliases"]["book_idx"] = "book_idx_old"
+    scans = iter([True, True, False])
+    search["indexing"][versioned_index_name("book")] = lambda: next(scans)
+
+    assert ensure_index("book", background=False) == "rebuilt"
+    assert search["aliases"]["book_idx"] == versioned_index_name("book")
+    assert "book_idx_old" not in search["indexes"]
+    assert f"{BUILD_LOCK_PREFIX}book_idx" not in redis.data
+
+
+def test_build_does_not_release_a_lock_taken_over_by_another_process(search, redis):
+    search["indexes"].add("book_idx_old")
+    search["aliases"]["book_idx"] = "book_idx_old"
+    lock_key = f"{BUILD_LOCK_PREFIX}book_idx"
+
+    def lock_expires_and_is_taken():
+        redis.data[lock_key] = "other-process-token"
+        return True
+
+    search["indexing"][versioned_index_name("book")] = lock_expires_and_is_taken
+
+    assert build_and_switch("book") is False
+    assert redis.data[lock_key] == "other-process-token"
+    assert search["aliases"]["book_idx"] == "book_idx_old"
+
+
+def test_build_is_skipped_while_another_process_holds_the_lock(search, redis):
+    redis.data[f"{BUILD_LOCK_PREFIX}book_idx"] = "other-process-token"
+    assert build_and_switch("book") is False
+    assert versioned_index_name("book") not in search["indexes"]
+
+
+def test_vector_index_failure_is_reported_not_raised(search, monkeypatch):
+    def failing_vector_index(kind):
+        raise Exception("Unknown field type FLOAT16")
+
+    monkeypatch.setattr(index_manager, "ensure_vector_index", failing_vector_index)
+    results = ensure_indexes(background=False)
+
+    assert results["book"] == results["video"] == "created"
+    assert results["book_vector"] == results["video_vector"] == "error: Unknown field type FLOAT16"
@@ -0,0 +1,45 @@
+import pytest
+
+from app.utils import local_vector_index
+from app.utils.local_vector_index import LocalVectorIndex, local_index_add, local_index_remove
+from app.utils.search_cache import bump_index_version, get_index_version
+
+
+@pytest.fixture
+def book_index(redis, tmp_path, monkeypatch):
+    index = LocalVectorIndex("book", directory=str(tmp_path), dim=3)
+    index.version = get_index_version("book_idx")
+    monkeypatch.setattr(local_vector_index, "LOCAL_INDEX_ENABLED", True)
+    monkeypatch.setitem(local_vector_index._indexes, "book", index)
+    return index
+
+
+def test_search_ranks_by_cosine_similarity(book_index):
+    book_index.add([("book:a", [1, 0, 0]), ("book:b", [0, 1, 0]), ("book:c", [1, 1, 0])])
+    assert [key for key, _ in book_index.search([1, 0.1, 0], 2)] == ["book:a", "book:c"]
+
+
+def test_own_write_adopts_the_next_version(book_index):
+    version = bump_index_version("book_idx")
+    local_index_add("book", [("book:a", [1, 0, 0])], version)
+    assert book_index.version == get_index_version("book_idx") == "1"
+
+    version = bump_index_version("book_idx")
+    local_index_remove("book", ["book:a"], version)
+    assert book_index.version == "2"
+    assert len(book_index) == 0
+
+
+def test_foreign_write_in_between_keeps_the_index_stale(book_index):
+    bump_index_version("book_idx")  # another process
+    version = bump_index_version("book_idx")  # this process
+    local_index_add("book", [("book:a", [1, 0, 0])], version)
+
+    # The refresh loop compares against Redis and must still see a difference
+    assert book_index.version == "0"
+    assert book_index.version != get_index_version("book_idx")
+
+
+def test_failed_bump_leaves_the_version_alone(book_index):
+    local_index_add("book", [("book:a", [1, 0, 0])], None)
+    assert book_index.version == "0"
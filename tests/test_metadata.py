@@ -0,0 +1,89 @@
+import json
+import threading
+import time
+
+import pytest
+
+from app.videos import metadata
+from app.videos.metadata import (
+    METADATA_KEY_PREFIX, UNKNOWN_TITLE, fixture_provider, get_video_metadata, set_metadata_provider
+)
+
+YOGA = {"title": "Yoga Basics", "duration_seconds": 600, "channel": "Studio", "upload_date": "20240101"}
+
+
+@pytest.fixture
+def provider(redis, monkeypatch):
+    """
+    Counting provider behind the Redis cache; `release` lets a test hold calls in flight.
+    """
+    calls = []
+    release = threading.Event()
+    release.set()
+
+    def fetch(video_id):
+        calls.append(video_id)
+        release.wait(5)
+        return dict(YOGA) if video_id == "abcdefghijk" else None
+
+    monkeypatch.setattr(metadata, "_provider", fetch)
+    monkeypatch.setattr(metadata, "_use_cache", True)
+    fetch.calls, fetch.release = calls, release
+    return fetch
+
+
+def run_concurrently(count, video_id):
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(get_video_metadata(video_id))) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def test_result_is_cached_in_redis_with_ttl(provider, redis):
+    assert get_video_metadata("abcdefghijk") == YOGA
+    assert get_video_metadata("abcdefghijk") == YOGA
+    assert provider.calls == ["abcdefghijk"]
+    assert json.loads(redis.data[f"{METADATA_KEY_PREFIX}abcdefghijk"]) == YOGA
+    assert redis.ttls[f"{METADATA_KEY_PREFIX}abcdefghijk"] == metadata.METADATA_CACHE_TTL
+
+
+def test_concurrent_lookups_share_one_extraction(provider):
+    provider.release.clear()
+    threads, results = run_concurrently(8, "abcdefghijk")
+    time.sleep(0.1)
+    provider.release.set()
+    for thread in threads:
+        thread.join()
+    assert provider.calls == ["abcdefghijk"]
+    assert results == [YOGA] * 8
+
+
+def test_failed_lookup_is_shared_and_not_cached(provider, redis):
+    provider.release.clear()
+    threads, results = run_concurrently(4, "zzzzzzzzzzz")
+    time.sleep(0.1)
+    provider.release.set()
+    for thread in threads:
+        thread.join()
+    assert provider.calls == ["zzzzzzzzzzz"]
+    assert all(result["title"] == UNKNOWN_TITLE for result in results)
+    assert f"{METADATA_KEY_PREFIX}zzzzzzzzzzz" not in redis.data
+
+    # A later retry fetches again
+    get_video_metadata("zzzzzzzzzzz")
+    assert provider.calls == ["zzzzzzzzzzz", "zzzzzzzzzzz"]
+
+
+def test_fixture_provider_bypasses_the_cache(redis, tmp_path, monkeypatch):
+    path = tmp_path / "metadata.json"
+    path.write_text(json.dumps({"abcdefghijk": {"title": "Yoga Basics", "duration_seconds": 600}}))
+    monkeypatch.setattr(metadata, "_provider", metadata._provider)
+    monkeypatch.setattr(metadata, "_use_cache", metadata._use_cache)
+    set_metadata_provider(fixture_provider(str(path)))
+
+    assert get_video_metadata("abcdefghijk") == {
+        "title": "Yoga Basics", "duration_seconds": 600, "channel": None, "upload_date": None
+    }
+    assert get_video_metadata("missingmiss")["title"] == UNKNOWN_TITLE
+    assert redis.data == {}
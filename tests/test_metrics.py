@@ -0,0 +1,50 @@
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from app.utils import metrics
+from app.utils.metrics import get_stage_stats, record, start_metrics_server
+
+
+@pytest.fixture
+def server(monkeypatch):
+    monkeypatch.setattr(metrics, "METRICS_ENABLED", True)
+    server = start_metrics_server("127.0.0.1", 0)
+    metrics.reset_metrics()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_get_reports_metrics(server):
+    record("search.book.text.total", 0.01)
+    with urllib.request.urlopen(f"{server}/metrics") as resp:
+        assert "search.book.text.total" in json.load(resp)["stages"]
+
+
+def test_reset_needs_post(server):
+    record("search.book.text.total", 0.01)
+
+    with pytest.raises(urllib.error.HTTPError) as error:
+        urllib.request.urlopen(f"{server}/metrics/reset")
+    assert error.value.code == 405
+    assert error.value.headers["Allow"] == "POST"
+    assert get_stage_stats()
+
+    with urllib.request.urlopen(urllib.request.Request(f"{server}/metrics/reset", data=b"", method="POST")) as resp:
+        assert resp.status == 200
+    assert get_stage_stats() == {}
+
+
+def test_slow_query_readers_get_copies(redis, monkeypatch):
+    metrics.reset_metrics()
+    monkeypatch.setattr(metrics, "SLOW_QUERY_PROFILE", False)
+    metrics.log_slow_query("search.book.text", "FT.SEARCH", ["book_idx", "yoga"], 1.0)
+
+    snapshot = metrics.get_slow_queries()
+    metrics._profile(metrics._slow_queries[0], "FT.SEARCH", ["book_idx", "yoga"])
+
+    assert snapshot[0]["profile"] is None
+    assert metrics.get_slow_queries()[0]["profile"].startswith("FT.PROFILE failed")
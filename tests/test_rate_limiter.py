@@ -0,0 +1,48 @@
+from app.utils import rate_limiter
+from app.utils.rate_limiter import TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_burst_then_paced_at_the_rate(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    bucket = TokenBucket(rate=10, capacity=2)
+
+    for _ in range(4):
+        bucket.acquire()
+
+    # Two tokens from the burst, then one every 1/rate seconds
+    assert [round(s, 6) for s in clock.sleeps] == [0.1, 0.1]
+    assert round(clock.now, 6) == 0.2
+
+
+def test_idle_time_refills_up_to_capacity(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    bucket = TokenBucket(rate=10, capacity=2)
+    bucket.acquire(2)
+    clock.now += 60
+
+    bucket.acquire(2)
+    assert clock.sleeps == []
+
+
+def test_non_positive_rate_disables_limiting(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    bucket = TokenBucket(rate=0, capacity=1)
+    for _ in range(100):
+        bucket.acquire()
+    assert clock.sleeps == []
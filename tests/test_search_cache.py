@@ -0,0 +1,63 @@
+import pytest
+
+from app.utils import search_cache
+from app.utils.search_cache import bump_index_version, cached_search
+
+
+@pytest.fixture
+def cache(redis, monkeypatch):
+    monkeypatch.setattr(search_cache, "_cache", search_cache.OrderedDict())
+    monkeypatch.setattr(search_cache, "_stats", {"hits": 0, "misses": 0, "saved_seconds": 0.0})
+    return search_cache
+
+
+def counting(result):
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return result
+    compute.calls = calls
+    return compute
+
+
+def test_normalized_repeat_is_served_from_cache(cache):
+    compute = counting((["book:1"], [{"book_title": "Yoga"}]))
+    cached_search("book_idx", "title", "Yoga  Basics", compute)
+    assert cached_search("book_idx", "title", " yoga basics", compute) == (["book:1"], [{"book_title": "Yoga"}])
+    assert len(compute.calls) == 1
+    assert cache.get_search_cache_stats()["hits"] == 1
+
+
+def test_bumping_the_version_invalidates_only_that_index(cache):
+    books = counting((["book:1"], [{}]))
+    videos = counting((["video:1"], [{}]))
+    cached_search("book_idx", "title", "yoga", books)
+    cached_search("video_idx", "title", "yoga", videos)
+
+    assert bump_index_version("book_idx") == 1
+    cached_search("book_idx", "title", "yoga", books)
+    cached_search("video_idx", "title", "yoga", videos)
+    assert (len(books.calls), len(videos.calls)) == (2, 1)
+
+
+def test_empty_results_and_expired_entries_are_recomputed(cache, monkeypatch):
+    empty = counting(([], [{"message": "❌ No results"}]))
+    cached_search("book_idx", "title", "nothing", empty)
+    cached_search("book_idx", "title", "nothing", empty)
+    assert len(empty.calls) == 2
+
+    monkeypatch.setattr(cache, "CACHE_TTL_SECONDS", -1)
+    hits = counting((["book:1"], [{}]))
+    cached_search("book_idx", "title", "yoga", hits)
+    cached_search("book_idx", "title", "yoga", hits)
+    assert len(hits.calls) == 2
+
+
+def test_oldest_entries_are_evicted(cache, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_MAX_ENTRIES", 2)
+    compute = counting((["book:1"], [{}]))
+    for query in ["a", "b", "c", "a"]:
+        cached_search("book_idx", "title", query, compute)
+    assert len(compute.calls) == 4
+    assert cache.get_search_cache_stats()["entries"] == 2
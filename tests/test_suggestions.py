@@ -0,0 +1,68 @@
+import re
+
+import pytest
+
+from app.utils.suggestions import SUGGESTION_KEYS, add_suggestions, get_suggestions, remove_suggestions
+
+
+@pytest.fixture
+def books(redis):
+    """
+    Stored book titles by key; FT.SEARCH phrase queries are answered from it.
+    """
+    docs = {}
+
+    def ft_search(index, query, *args):
+        phrase = re.sub(r"\\(.)", r"\1", query.split(":", 1)[1].strip('"')).lower()
+        hits = [(key, title) for key, title in docs.items() if phrase in title.lower()]
+        reply = [len(hits)]
+        for key, title in hits:
+            reply.extend([key, ["book_title", title]])
+        return reply
+
+    redis.commands["FT.SEARCH"] = ft_search
+    return docs
+
+
+def stored_suggestions(redis):
+    return redis.data.get(SUGGESTION_KEYS["book"], {})
+
+
+def test_suggestions_are_prefix_matched(books, redis):
+    add_suggestions("book", [("Yoga Basics", "book:1"), ("Running Form", "book:2")])
+    assert get_suggestions("book", "yo", fuzzy=False) == [{"title": "Yoga Basics", "key": "book:1"}]
+    assert get_suggestions("book", "y") == []
+
+
+def test_removing_a_unique_title_drops_its_suggestion(books, redis):
+    add_suggestions("book", [("Yoga Basics", "book:1")])
+    assert remove_suggestions("book", ["Yoga Basics"]) == 1
+    assert stored_suggestions(redis) == {}
+
+
+def test_title_shared_with_a_remaining_document_is_kept(books, redis):
+    books["book:2"] = "Yoga Basics"
+    add_suggestions("book", [("Yoga Basics", "book:1"), ("Yoga Basics", "book:2")])
+    redis.data[SUGGESTION_KEYS["book"]]["Yoga Basics"] = "book:1"
+
+    # book:1 was deleted, book:2 still has the title
+    assert remove_suggestions("book", ["Yoga Basics"]) == 0
+    assert stored_suggestions(redis) == {"Yoga Basics": "book:2"}
+
+
+def test_only_an_exact_title_keeps_the_suggestion(books, redis):
+    books["book:2"] = "Yoga Basics for Runners"
+    add_suggestions("book", [("Yoga Basics", "book:1"), ("Yoga Basics for Runners", "book:2")])
+
+    assert remove_suggestions("book", ["Yoga Basics"]) == 1
+    assert stored_suggestions(redis) == {"Yoga Basics for Runners": "book:2"}
+
+
+def test_title_is_kept_when_the_check_fails(books, redis):
+    def failing_search(*args):
+        raise RuntimeError("index unavailable")
+
+    redis.commands["FT.SEARCH"] = failing_search
+    add_suggestions("book", [("Yoga Basics", "book:1")])
+    assert remove_suggestions("book", ["Yoga Basics"]) == 0
+    assert stored_suggestions(redis) == {"Yoga Basics": "book:1"}
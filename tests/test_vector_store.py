@@ -0,0 +1,31 @@
+import pytest
+
+from app.utils.common import _search_video_by_title_or_url, fetch_documents
+from app.utils.vector_store import FORMAT_FIELD, VECTOR_FIELD, get_document, store_document, vector_key
+
+
+@pytest.mark.parametrize("fmt", ["float32", "float16"])
+def test_binary_documents_read_back_with_their_embedding(redis, fmt):
+    store_document(redis.json(), "book:1", {"book_title": "Yoga", "embedding": [0.5, -1.0, 2.0]}, fmt)
+    store_document(redis.json(), "book:2", {"book_title": "Running", "embedding": [1.0, 0.0, 0.25]}, "json")
+
+    # The JSON document carries only the marker; the vector sits in the companion hash
+    assert VECTOR_FIELD not in redis.data["book:1"]
+    assert isinstance(redis.data[vector_key("book:1")][VECTOR_FIELD], bytes)
+
+    assert fetch_documents(["book:1", "book:2", "book:missing"]) == [
+        {"book_title": "Yoga", "embedding": [0.5, -1.0, 2.0]},
+        {"book_title": "Running", "embedding": [1.0, 0.0, 0.25]},
+        None,
+    ]
+    assert get_document("book:1") == {"book_title": "Yoga", "embedding": [0.5, -1.0, 2.0]}
+
+
+def test_video_url_lookup_restores_the_embedding(redis):
+    store_document(redis.json(), "video:abcdefghijk", {"youtube_title": "Yoga", "embedding": [1.0, 2.0]}, "float32")
+
+    keys, data, total = _search_video_by_title_or_url("https://www.youtube.com/watch?v=abcdefghijk")
+
+    assert keys == ["video:abcdefghijk"]
+    assert data == [{"youtube_title": "Yoga", "embedding": [1.0, 2.0]}]
+    assert FORMAT_FIELD not in data[0]
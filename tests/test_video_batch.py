@@ -0,0 +1,49 @@
+from app.videos import batch
+from app.videos.batch import (
+    STATUS_FAILED, STATUS_SKIPPED, STATUS_STORED, is_collection_url, resolve_sources, run_video_batch, split_sources
+)
+
+
+def test_pasted_text_is_split_on_lines_commas_and_spaces():
+    assert split_sources("a\nb, c;d  e\n\n") == ["a", "b", "c", "d", "e"]
+
+
+def test_collection_urls_are_told_apart_from_watch_urls():
+    assert is_collection_url("https://www.youtube.com/playlist?list=PL123")
+    assert is_collection_url("https://www.youtube.com/@studio/videos")
+    assert not is_collection_url("https://www.youtube.com/watch?v=abcdefghijk&list=PL123")
+
+
+def test_sources_resolve_to_unique_ids_in_input_order(monkeypatch):
+    monkeypatch.setattr(batch, "expand_collection", lambda url: ["bbbbbbbbbbb", "abcdefghijk"])
+    video_ids, invalid = resolve_sources([
+        "https://www.youtube.com/watch?v=abcdefghijk",
+        "https://www.youtube.com/playlist?list=PL123",
+        "bbbbbbbbbbb",
+        "not a video",
+    ])
+    assert video_ids == ["abcdefghijk", "bbbbbbbbbbb"]
+    assert invalid == ["not a video"]
+
+
+def test_batch_skips_stored_videos_in_one_pipeline(redis, monkeypatch):
+    redis.set("video:abcdefghijk", "{}")
+    pipelines = []
+    pipeline = redis.pipeline
+    monkeypatch.setattr(redis, "pipeline", lambda *a, **kw: pipelines.append(1) or pipeline(*a, **kw))
+    results = {
+        "bbbbbbbbbbb": {"ok": True},
+        "ccccccccccc": {"error": "⚠️ No transcript available."},
+        "ddddddddddd": {"error": "❌ LLM failed"},
+    }
+    monkeypatch.setattr(batch, "run_video_pipeline", lambda url: results[url[-11:]])
+
+    reports = list(run_video_batch(["abcdefghijk", "bbbbbbbbbbb", "ccccccccccc", "ddddddddddd"], workers=2))
+
+    assert len(pipelines) == 1
+    videos = reports[-1]["videos"]
+    assert {video_id: video["status"] for video_id, video in videos.items()} == {
+        "abcdefghijk": STATUS_SKIPPED, "bbbbbbbbbbb": STATUS_STORED,
+        "ccccccccccc": STATUS_SKIPPED, "ddddddddddd": STATUS_FAILED,
+    }
+    assert reports[-1]["summary"]["failed"] == 1
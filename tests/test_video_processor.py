@@ -0,0 +1,55 @@
+import threading
+
+import pytest
+
+from app.videos import metadata, processor
+
+LLM_REPLY = '```json\n{"metadata": {"classification": {"primaryCategory": "Yoga"}}}\n```'
+
+
+@pytest.fixture
+def slow_metadata(redis, monkeypatch):
+    """
+    Metadata extraction that only finishes once the LLM call has started.
+    """
+    llm_started = threading.Event()
+
+    def extraction(video_id):
+        if not llm_started.wait(2):
+            raise AssertionError("metadata extraction was awaited before the LLM call")
+        return {"title": "Yoga Basics", "duration_seconds": 600, "channel": "Studio", "upload_date": "20240101"}
+
+    monkeypatch.setattr(metadata, "_provider", extraction)
+    monkeypatch.setattr(metadata, "_use_cache", True)
+    monkeypatch.setattr(metadata, "_title_provider", lambda video_id: "Yoga Basics")
+    monkeypatch.setattr(processor, "save_record", lambda *args, **kwargs: None)
+    return llm_started
+
+
+def test_llm_call_overlaps_the_metadata_extraction(slow_metadata, monkeypatch):
+    prompts = []
+
+    def call_llm(prompt):
+        prompts.append(prompt)
+        slow_metadata.set()
+        return LLM_REPLY
+
+    monkeypatch.setattr(processor, "call_llm", call_llm)
+    result = processor.process_transcript("abcdefghijk", "breathe in, breathe out")
+
+    assert "Yoga Basics" in prompts[0]
+    assert result["videoTitle"] == "Yoga Basics"
+    assert result["duration_seconds"] == 600
+    assert result["channel"] == "Studio"
+    assert result["upload_date"] == "20240101"
+
+
+def test_unknown_title_is_replaced_by_the_extracted_one(slow_metadata, monkeypatch):
+    monkeypatch.setattr(metadata, "_title_provider", lambda video_id: None)
+    monkeypatch.setattr(processor, "call_llm", lambda prompt: LLM_REPLY)
+    future = processor.submit_fetch(metadata.get_video_metadata, "abcdefghijk")
+    slow_metadata.set()
+
+    result = processor.process_transcript("abcdefghijk", "text", title=metadata.UNKNOWN_TITLE,
+                                          metadata_future=future)
+    assert result["videoTitle"] == "Yoga Basics"
@@ -0,0 +1,46 @@
+import pytest
+
+from app.videos import batch, embedder, runner
+
+
+@pytest.fixture
+def pipeline(redis, monkeypatch):
+    """
+    run_video_pipeline with every network stage replaced; returns the removed-artifact log.
+    """
+    removed = []
+    monkeypatch.setattr(embedder, "redis_client", redis)
+    monkeypatch.setattr(runner, "fetch_transcript", lambda video_id: "transcript")
+    monkeypatch.setattr(runner, "get_video_title", lambda video_id: "Yoga Basics")
+    monkeypatch.setattr(runner, "get_video_metadata", lambda video_id: {})
+    monkeypatch.setattr(runner, "process_transcript", lambda video_id, transcript, **kwargs: {
+        "videoId": video_id, "videoTitle": "Yoga Basics", "metadata": {}
+    })
+    monkeypatch.setattr(runner, "remove_files", removed.extend)
+    return removed
+
+
+def test_video_stored_by_another_worker_meanwhile_is_a_skip(pipeline, redis, monkeypatch):
+    stored_meanwhile = runner.process_transcript
+
+    def process_transcript(video_id, transcript, **kwargs):
+        redis.set(f"video:{video_id}", "{}")  # the other worker finishes first
+        return stored_meanwhile(video_id, transcript, **kwargs)
+
+    monkeypatch.setattr(runner, "process_transcript", process_transcript)
+    assert runner.run_video_pipeline("https://youtu.be/abcdefghijk") == {"error": embedder.ALREADY_STORED}
+    # The other worker's artifacts are left alone
+    assert pipeline == []
+
+    redis.delete("video:abcdefghijk")
+    outcome = batch._run_one("abcdefghijk")
+    assert outcome["status"] == batch.STATUS_SKIPPED
+
+
+def test_storage_failure_is_still_a_failure(pipeline, monkeypatch):
+    monkeypatch.setattr(embedder, "get_embedding", lambda text: None)
+
+    outcome = batch._run_one("abcdefghijk")
+    assert outcome["status"] == batch.STATUS_FAILED
+    assert outcome["detail"] == "❌ Embedding or storage failed."
+    assert pipeline  # intermediates of the failed run are removed